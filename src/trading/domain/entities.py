@@ -1,4 +1,5 @@
 """Domain entities for trading system"""
+import sys
 import uuid
 from datetime import datetime
 from decimal import Decimal
@@ -146,6 +147,22 @@ class Position:
 class Cycle:
     """Represents a complete trading cycle when both positions close to zero"""
 
+    __slots__ = (
+        "cycle_id",
+        "symbol",
+        "strategy_name",
+        "start_timestamp",
+        "end_timestamp",
+        "duration_minutes",
+        "total_pnl",
+        "long_trades_count",
+        "short_trades_count",
+        "long_max_loads",
+        "short_max_loads",
+        "created_at",
+        "symbol_key",
+    )
+
     def __init__(
         self,
         symbol: str,
@@ -161,6 +178,8 @@ class Cycle:
     ):
         self.cycle_id = cycle_id or str(uuid.uuid4())
         self.symbol = symbol
+        # Interned lowercase symbol, used as the key for cycle listener lookups
+        self.symbol_key = sys.intern(symbol.lower())
         self.strategy_name = strategy_name
         self.start_timestamp = start_timestamp
         self.end_timestamp = end_timestamp
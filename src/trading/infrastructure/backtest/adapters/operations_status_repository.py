@@ -1,8 +1,18 @@
 """Operations status repository for backtests"""
 
+from types import MappingProxyType
+
 from trading.domain.ports import OperationsStatusRepositoryPort
 from trading.domain.types import ORDER_SIDE_TYPE, SIDE_TYPE
 
+# Máscara de bit de cada combinación (side, type) dentro del bitmap de estado
+_OPERATION_BITS = {
+    ("long", "buy"): 1 << 0,
+    ("long", "sell"): 1 << 1,
+    ("short", "buy"): 1 << 2,
+    ("short", "sell"): 1 << 3,
+}
+
 
 class BacktestOperationsStatusRepository(OperationsStatusRepositoryPort):
     """
@@ -12,18 +22,30 @@ class BacktestOperationsStatusRepository(OperationsStatusRepositoryPort):
 
     def __init__(self, symbol: str):
         self.symbol = symbol
-        # Estado inicial en memoria
-        self.operations = {
-            "long": {"buy": False, "sell": False},
-            "short": {"buy": False, "sell": False},
-        }
+        # Estado inicial en memoria: un bit por operación, todas desactivadas
+        self._bits = 0
+
+    @property
+    def operations(self) -> MappingProxyType:
+        """Vista del estado como mapeo anidado (compatibilidad, solo lectura)
+
+        Se reconstruye en cada acceso a partir del bitmap, así que es de solo lectura:
+        asignar sobre ella lanza TypeError; usar set_operation_status() para modificar.
+        """
+        operations = {"long": {}, "short": {}}
+        for (side, type), bit in _OPERATION_BITS.items():
+            operations[side][type] = bool(self._bits & bit)
+        return MappingProxyType({side: MappingProxyType(types) for side, types in operations.items()})
 
     def get_operation_status(self, side: SIDE_TYPE, type: ORDER_SIDE_TYPE) -> bool:
         """Obtener estado de operación desde memoria"""
-        return self.operations[side][type]
+        return bool(self._bits & _OPERATION_BITS[(side, type)])
 
     def set_operation_status(self, side: SIDE_TYPE, type: ORDER_SIDE_TYPE, status: bool):
         """Establecer estado de operación en memoria (sin escritura a disco)"""
-        self.operations[side][type] = status
+        bit = _OPERATION_BITS[(side, type)]
+        if status:
+            self._bits |= bit
+        else:
+            self._bits &= ~bit
         # No hay escritura a disco - optimización para backtest
-
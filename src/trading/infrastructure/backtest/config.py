@@ -5,6 +5,7 @@ from dataclasses import dataclass, field
 from decimal import Decimal
 
 from trading.infrastructure.simulator.domain.constants import TIMEFRAME_MINUTES
+from trading.infrastructure.simulator.simulator import get_base_timeframe
 
 # Note: These imports are not used in this module but kept for consistency
 # from trading.infrastructure.logging import get_backtest_logger, get_logger
@@ -94,8 +95,13 @@ class BacktestConfig:
         """Validate timeframes after initialization"""
         validate_timeframes(self.timeframes)
 
+    @property
+    def base_timeframe(self) -> str:
+        """Shortest of the configured timeframes (derived on access, so it follows reassignment)"""
+        return get_base_timeframe(self.timeframes)
 
-@dataclass
+
+@dataclass(slots=True)
 class BacktestResults:
     """Backtest results"""
 
@@ -1,42 +1,83 @@
 """Event dispatcher for cycle completion events"""
 
+import logging
+import sys
+import weakref
+from functools import lru_cache
+from types import MethodType
 
 from trading.domain.entities import Cycle
 
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=256)
+def _normalize(symbol: str) -> str:
+    """Return the interned lowercase listener key for a symbol (memoized across dispatchers)"""
+    return sys.intern(symbol.lower())
+
 
 class EventDispatcher:
     """Event dispatcher for strategy events, specifically cycle completion events"""
 
     def __init__(self):
-        self.cycle_listeners:[str[callable]] = {}
+        # Listeners per lowercased symbol, kept as dict keys: an insertion-ordered set
+        # with O(1) removal. Bound methods are stored as WeakMethod so a forgotten
+        # subscription doesn't keep its owner alive; plain functions, and methods whose
+        # owner can't be weakly referenced or hashed, are held strongly.
+        self.cycle_listeners: dict[str, dict[callable, None]] = {}
 
     def add_cycle_listener(self, symbol: str, listener: callable):
         """Add a listener for cycle completion events for a specific symbol"""
-        symbol = symbol.lower()
-        if symbol not in self.cycle_listeners:
-            self.cycle_listeners[symbol] = []
-        self.cycle_listeners[symbol].append(listener)
+        key = _normalize(symbol)
+        # Drop the entry on its own once the method's owner is garbage collected
+        listener = self._entry(listener, lambda ref: self._discard(key, ref))
+        self.cycle_listeners.setdefault(key, {})[listener] = None
 
     def remove_cycle_listener(self, symbol: str, listener: callable):
         """Remove a cycle completion listener for a specific symbol"""
-        symbol = symbol.lower()
-        if symbol in self.cycle_listeners:
-            if listener in self.cycle_listeners[symbol]:
-                self.cycle_listeners[symbol].remove(listener)
+        self._discard(_normalize(symbol), self._entry(listener))
+
+    @staticmethod
+    def _entry(listener: callable, callback: callable = None) -> callable:
+        """Return the stored form of a listener: a WeakMethod for bound methods when possible"""
+        if not isinstance(listener, MethodType):
+            return listener
+        try:
+            ref = weakref.WeakMethod(listener, callback)
+            hash(ref)
+        except TypeError:
+            # Owner without __weakref__ (__slots__) or unhashable (dataclass, pydantic model)
+            return listener
+        return ref
+
+    def _discard(self, key: str, listener: callable):
+        """Remove a stored listener entry, dropping the symbol once it has no listeners left"""
+        listeners = self.cycle_listeners.get(key)
+        if listeners is not None:
+            listeners.pop(listener, None)
+            if not listeners:
+                del self.cycle_listeners[key]
 
     def dispatch_cycle_completion(self, cycle: Cycle):
         """Dispatch cycle completion event to all registered listeners for the symbol"""
-        symbol = cycle.symbol.lower()
-        if symbol in self.cycle_listeners:
-            for listener in self.cycle_listeners[symbol]:
-                try:
-                    listener(cycle)
-                except Exception as e:
-                    # Log error but don't stop other listeners
-                    print(f"Error in cycle listener: {e}")
+        listeners = self.cycle_listeners.get(cycle.symbol_key)
+        if not listeners:
+            return
+
+        # Iterate over a snapshot so a listener can unsubscribe itself mid-dispatch
+        for listener in tuple(listeners):
+            if isinstance(listener, weakref.WeakMethod):
+                listener = listener()
+                if listener is None:
+                    continue
+            try:
+                listener(cycle)
+            except Exception as e:
+                # Log error but don't stop other listeners (formatted only if ERROR is enabled)
+                logger.exception("Error in cycle listener: %s", e)
 
     def has_cycle_listeners(self, symbol: str) -> bool:
         """Check if there are any cycle listeners for a symbol"""
-        symbol = symbol.lower()
-        return symbol in self.cycle_listeners and len(self.cycle_listeners[symbol]) > 0
-
+        # Empty symbols are pruned on removal, so presence of the key is enough
+        return _normalize(symbol) in self.cycle_listeners
@@ -2,7 +2,7 @@ import logging
 import time
 from collections.abc import Callable
 from datetime import datetime
-from decimal import Decimal
+from decimal import Context, Decimal, localcontext
 
 from trading.domain.entities import Cycle, Trade
 from trading.domain.ports import ExchangePort, MarketDataPort, StrategyPort
@@ -23,7 +23,10 @@ from trading.infrastructure.logging import (
     get_logger,
     logging_context,
 )
-from trading.infrastructure.simulator.simulator import MarketDataSimulator, get_base_timeframe
+from trading.infrastructure.simulator.simulator import MarketDataSimulator
+
+# Contexto reducido para las sumas de validación: 12 dígitos significativos sobran para una tolerancia de 0.01
+_VALIDATION_CONTEXT = Context(prec=12)
 
 
 class BacktestRunner:
@@ -134,8 +137,7 @@ class BacktestRunner:
         self.exchange.set_fees(self.config.maker_fee, self.config.taker_fee)
         self.exchange.set_max_notional(self.config.max_notional)
         # Configurar timeframe base para order execution
-        base_timeframe = get_base_timeframe(self.config.timeframes)
-        self.exchange.set_base_timeframe(base_timeframe)
+        self.exchange.set_base_timeframe(self.config.base_timeframe)
 
         # Crear estrategia
         self.strategy = strategy_factory(
@@ -154,8 +156,9 @@ class BacktestRunner:
             self.cycle_dispatcher.add_cycle_listener(self.config.symbol, self._on_cycle_completed)
 
         # Agregar listener para capturar el último candle del timeframe base
-        base_timeframe = get_base_timeframe(self.config.timeframes)
-        self.market_data.add_complete_candle_listener(self.config.symbol, base_timeframe, self._on_base_candle_update)
+        self.market_data.add_complete_candle_listener(
+            self.config.symbol, self.config.base_timeframe, self._on_base_candle_update
+        )
 
         # Frontend initialization (if needed) would go here
         self.logger.info("Configuración completada")
@@ -455,13 +458,20 @@ class BacktestRunner:
                 f"Balance inconsistency: initial calculated {initial} != config {self.config.initial_balance}"
             )
 
-        sum_realized = sum(t.realized_pnl for t in trades)
         # total_return ya incluye todo: profits de cierres - todas las comisiones (apertura + cierre)
         # sum_realized solo incluye: profits de cierres - comisiones de cierres
         # Las comisiones de apertura se restan del balance pero no están en realized_pnl
         # Por lo tanto: sum_realized = total_return + opening_commissions
-        opening_commissions = sum(abs(t.commission) for t in trades if t.realized_pnl == 0)
-        expected_return = results.total_return + opening_commissions
+        # Ambas sumas se acumulan en una sola pasada sobre los trades
+        zero = Decimal(0)
+        sum_realized = zero
+        opening_commissions = zero
+        with localcontext(_VALIDATION_CONTEXT):
+            for t in trades:
+                sum_realized += t.realized_pnl
+                if t.realized_pnl == zero:
+                    opening_commissions += abs(t.commission)
+            expected_return = results.total_return + opening_commissions
         if abs(float(sum_realized - expected_return)) > 0.01:
             warnings.append(
                 f"P&L inconsistency: sum realized_pnl {sum_realized} != "
@@ -2,6 +2,7 @@
 
 import time
 from datetime import datetime
+from functools import lru_cache
 
 from trading.domain.entities import Candle
 from trading.infrastructure.logging import get_debug_logger, get_logger
@@ -21,23 +22,18 @@ def get_base_timeframe(timeframes: list[str]) -> str:
     Returns:
         The timeframe with shortest duration, or "1m" as default if list is empty or invalid
     """
-    if not timeframes:
-        # Default to "1m" if no timeframes provided for safety
-        return "1m"
-
-    # Find timeframe with minimum duration (minutes)
-    base_timeframe = None
-    min_minutes = float("inf")
-
-    for tf in timeframes:
-        if tf in TIMEFRAME_MINUTES:
-            minutes = TIMEFRAME_MINUTES[tf]
-            if minutes < min_minutes:
-                min_minutes = minutes
-                base_timeframe = tf
-
-    # If no valid timeframe found, default to "1m"
-    return base_timeframe if base_timeframe else "1m"
+    # Lists aren't hashable; the tuple is the cache key
+    return _get_base_timeframe_cached(tuple(timeframes or ()))
+
+
+@lru_cache(maxsize=128)
+def _get_base_timeframe_cached(timeframes: tuple[str, ...]) -> str:
+    """Cached implementation of get_base_timeframe"""
+    # Only timeframes present in TIMEFRAME_MINUTES are considered
+    valid_timeframes = [tf for tf in timeframes if tf in TIMEFRAME_MINUTES]
+
+    # Default to "1m" if no (valid) timeframes were provided, for safety
+    return min(valid_timeframes, key=TIMEFRAME_MINUTES.__getitem__, default="1m")
 
 
 class MarketDataSimulator:
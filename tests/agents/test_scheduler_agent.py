@@ -2,36 +2,169 @@
 
 import time
 from datetime import datetime, timedelta, timezone
-from unittest.mock import MagicMock, patch
+from decimal import Decimal
+from unittest.mock import Mock, patch
 
 import pytest
-
-from trading.agents import SchedulerAgent
+from freezegun import freeze_time
+
+from trading.agents import OrchestratorAgent, SchedulerAgent
+from trading.domain.messages import (
+    AgentMessage,
+    BacktestResultsResponse,
+    EvaluationResponse,
+    StartBacktestRequest,
+)
 from trading.infrastructure.scheduler.scheduler_config import SchedulerConfig
 
-
-@pytest.fixture
-def scheduler_config():
-    """Create scheduler config for testing"""
-    return SchedulerConfig(
+# Validated once; fixtures and scenarios hand out copies
+_BASE_CONFIG = SchedulerConfig(
+    symbol="BTCUSDT",
+    strategy_name="carga_descarga",
+    schedule_interval_seconds=60,  # Short interval for testing
+    backtest_duration_days=1,  # Short duration for testing
+    max_iterations_per_cycle=2,
+    kpis={"sharpe_ratio": 2.0, "max_drawdown": 10.0, "profit_factor": 1.5},
+    auto_reset_memory=True,
+)
+
+# Orchestrator responses shared by the cycle tests (read-only, built once per module)
+_PASSING_BACKTEST = BacktestResultsResponse(
+    run_id="test_run",
+    status="completed",
+    start_time=1000000,
+    end_time=2000000,
+    duration_seconds=100.0,
+    total_candles_processed=1000,
+    final_balance=Decimal("2600"),
+    total_return=Decimal("100"),
+    return_percentage=4.0,
+    max_drawdown=5.0,
+    total_trades=50,
+    win_rate=60.0,
+    profit_factor=1.5,
+    total_closed_positions=10,
+    winning_positions=6,
+    losing_positions=4,
+    total_commission=Decimal("10"),
+    commission_percentage=10.0,
+    strategy_name="carga_descarga",
+    symbol="BTCUSDT",
+)
+
+_PASSING_EVAL = EvaluationResponse(
+    run_id="test_run",
+    evaluation_passed=True,
+    metrics={"sharpe_ratio": 2.5, "max_drawdown": 5.0, "profit_factor": 1.5},
+    kpi_compliance={"sharpe_ratio": True, "max_drawdown": True, "profit_factor": True},
+    recommendation="promote",
+)
+
+_FAILING_EVAL = EvaluationResponse(
+    run_id="test_run",
+    evaluation_passed=False,
+    metrics={"sharpe_ratio": 1.0, "max_drawdown": 15.0, "profit_factor": 1.2},
+    kpi_compliance={"sharpe_ratio": False, "max_drawdown": False, "profit_factor": False},
+    recommendation="reject",
+)
+
+_OPTIMIZE_EVAL = EvaluationResponse(
+    run_id="test_run",
+    evaluation_passed=False,
+    metrics={"sharpe_ratio": 1.8, "max_drawdown": 8.0, "profit_factor": 1.4},
+    kpi_compliance={"sharpe_ratio": False, "max_drawdown": True, "profit_factor": False},
+    recommendation="optimize",
+)
+
+# The scheduler does not handle any payload type, so any message is unknown to it
+_UNKNOWN_MSG = AgentMessage(
+    message_id="msg_123",
+    from_agent="test",
+    to_agent="scheduler",
+    flow_id="test_flow",
+    payload=StartBacktestRequest(
         symbol="BTCUSDT",
+        start_time=1000000,
         strategy_name="carga_descarga",
-        schedule_interval_seconds=60,  # Short interval for testing
-        backtest_duration_days=1,  # Short duration for testing
-        max_iterations_per_cycle=2,
-        kpis={"sharpe_ratio": 2.0, "max_drawdown": 10.0, "profit_factor": 1.5},
-        auto_reset_memory=True,
-    )
+    ),
+)
+
+_NOW = datetime(2024, 1, 10, 12, 0, 0, tzinfo=timezone.utc)
+
+# Two backtests per period, both must pass to advance
+_TWO_PER_PERIOD = {"backtests_per_period": 2, "min_passed_backtests_per_period": 2}
+
+# Orchestrator (backtest, evaluation) responses by outcome
+_RESPONSE_TABLE = {
+    "pass": (_PASSING_BACKTEST, _PASSING_EVAL),
+    "fail": (_PASSING_BACKTEST, _FAILING_EVAL),
+    "optimize": (_PASSING_BACKTEST, _OPTIMIZE_EVAL),
+}
+
+# (id, orchestrator responses, config overrides, initial agent state, cycles to run, expected agent state)
+_CYCLE_SCENARIOS = [
+    ("run_cycle", "pass", {}, {}, 1, {"cycle_count": 1, "executions_today": 1}),
+    (
+        # Two passing backtests complete the first period; counts restart for the next one
+        "first_period_change",
+        "pass",
+        {**_TWO_PER_PERIOD, "incremental_periods": [1, 7, 30, 90]},
+        {},
+        2,
+        {"current_period_index": 1, "backtest_count_in_period": 0, "passed_backtests_in_period": 0},
+    ),
+    (
+        "period_progression",
+        "pass",
+        {**_TWO_PER_PERIOD, "incremental_periods": [1, 7, 30, 90]},
+        {},
+        4,
+        {"current_period_index": 2, "backtest_count_in_period": 0, "passed_backtests_in_period": 0},
+    ),
+    (
+        # After reset, the backtest count is 1 because one backtest ran in the new period
+        "reset_on_optimize",
+        "optimize",
+        {},
+        {"current_period_index": 2, "backtest_count_in_period": 3},
+        1,
+        {"current_period_index": 0, "backtest_count_in_period": 1, "passed_backtests_in_period": 0},
+    ),
+    (
+        # Only 0 of the 2 required backtests passed
+        "period_failure_reset",
+        "fail",
+        {**_TWO_PER_PERIOD, "incremental_periods": [1, 7, 30, 90]},
+        {"current_period_index": 1},
+        2,
+        {"current_period_index": 0, "backtest_count_in_period": 0, "passed_backtests_in_period": 0},
+    ),
+    (
+        # Completing the last period stops the scheduler
+        "promote_to_production",
+        "pass",
+        {**_TWO_PER_PERIOD, "incremental_periods": [1, 7]},
+        {"current_period_index": 1, "running": True},
+        2,
+        {"running": False},
+    ),
+]
+
+
+@pytest.fixture(scope="module")
+def scheduler_config():
+    """Create scheduler config for testing"""
+    return _BASE_CONFIG.model_copy()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def scheduler_agent(scheduler_config):
-    """Create SchedulerAgent for testing"""
+    """Create SchedulerAgent for testing (shared by the module, see _reset_agent)"""
     with patch("trading.agents.scheduler_agent.OrchestratorAgent") as mock_orchestrator_class:
-        mock_orchestrator = MagicMock()
+        mock_orchestrator = Mock(spec_set=OrchestratorAgent)
         mock_orchestrator_class.return_value = mock_orchestrator
 
-        agent = SchedulerAgent(config=scheduler_config, run_id="test_scheduler")
+        agent = SchedulerAgent(config=scheduler_config.model_copy(deep=True), run_id="test_scheduler")
         agent.orchestrator = mock_orchestrator
         agent.initialize()
 
@@ -39,6 +172,49 @@ def scheduler_agent(scheduler_config):
         agent.close()
 
 
+@pytest.fixture(autouse=True)
+def _reset_agent(scheduler_agent):
+    """Restore the shared SchedulerAgent's mutable state after each test
+
+    Only attributes are reset; close() runs once, when the module fixture is torn down.
+    """
+    config = scheduler_agent.config.model_copy(deep=True)
+    memory = dict(scheduler_agent.episodic_memory)
+    yield
+    scheduler_agent.orchestrator.reset_mock()
+    scheduler_agent.config = config
+    scheduler_agent.episodic_memory = memory
+    scheduler_agent.cycle_count = 0
+    scheduler_agent.executions_today = 0
+    scheduler_agent.last_execution_date = None
+    scheduler_agent.last_reset_date = None
+    scheduler_agent.current_period_index = 0
+    scheduler_agent.backtest_count_in_period = 0
+    scheduler_agent.passed_backtests_in_period = 0
+    scheduler_agent.parameter_combinations.clear()
+    scheduler_agent.period_parameter_combinations.clear()
+    scheduler_agent.running = False
+
+
+@pytest.fixture
+def scheduler_with_responses(scheduler_agent, request):
+    """Shared SchedulerAgent with the orchestrator wired to a _RESPONSE_TABLE entry"""
+    backtest, evaluation = _RESPONSE_TABLE[request.param]
+    scheduler_agent.orchestrator.run_backtest.return_value = backtest
+    scheduler_agent.orchestrator.evaluate_backtest.return_value = evaluation
+    return scheduler_agent
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _module_patches():
+    """Pin the clock and stub the strategy factory once for the whole module"""
+    with (
+        freeze_time(_NOW),
+        patch("trading.agents.scheduler_agent.create_strategy_factory", return_value=lambda: None),
+    ):
+        yield
+
+
 def test_scheduler_agent_initialization(scheduler_agent):
     """Test SchedulerAgent initialization"""
     assert scheduler_agent.agent_name == "scheduler"
@@ -109,79 +285,9 @@ def test_stop_scheduler(scheduler_agent):
     assert scheduler_agent.running is False
 
 
-@patch("trading.agents.scheduler_agent.create_strategy_factory")
-@patch("trading.agents.scheduler_agent.datetime")
-def test_run_cycle(mock_datetime, mock_factory, scheduler_agent):
-    """Test running one cycle"""
-    from decimal import Decimal
-
-    from trading.domain.messages import BacktestResultsResponse, EvaluationResponse
-
-    # Setup mocks
-    mock_datetime.now.return_value = datetime(2024, 1, 10, 12, 0, 0, tzinfo=timezone.utc)
-    mock_factory.return_value = lambda: None
-
-    # Mock orchestrator responses
-    mock_backtest = BacktestResultsResponse(
-        run_id="test_run",
-        status="completed",
-        start_time=1000000,
-        end_time=2000000,
-        duration_seconds=100.0,
-        total_candles_processed=1000,
-        final_balance=Decimal("2600"),
-        total_return=Decimal("100"),
-        return_percentage=4.0,
-        max_drawdown=5.0,
-        total_trades=50,
-        win_rate=60.0,
-        profit_factor=1.5,
-        total_closed_positions=10,
-        winning_positions=6,
-        losing_positions=4,
-        total_commission=Decimal("10"),
-        commission_percentage=10.0,
-        strategy_name="carga_descarga",
-        symbol="BTCUSDT",
-    )
-
-    mock_evaluation = EvaluationResponse(
-        run_id="test_run",
-        evaluation_passed=True,
-        metrics={"sharpe_ratio": 2.5, "max_drawdown": 5.0, "profit_factor": 1.5},
-        kpi_compliance={"sharpe_ratio": True, "max_drawdown": True, "profit_factor": True},
-        recommendation="promote",
-    )
-
-    scheduler_agent.orchestrator.run_backtest.return_value = mock_backtest
-    scheduler_agent.orchestrator.evaluate_backtest.return_value = mock_evaluation
-
-    # Run cycle
-    scheduler_agent.run_cycle()
-
-    # Verify orchestrator was called
-    assert scheduler_agent.orchestrator.run_backtest.called
-    assert scheduler_agent.orchestrator.evaluate_backtest.called
-    assert scheduler_agent.cycle_count == 1
-    assert scheduler_agent.executions_today == 1
-
-
 def test_handle_message_unknown_type(scheduler_agent):
     """Test handling unknown message type"""
-    from trading.domain.messages import AgentMessage, StartBacktestRequest
-
-    message = AgentMessage(
-        from_agent="test",
-        to_agent="scheduler",
-        flow_id="test_flow",
-        payload=StartBacktestRequest(
-            symbol="BTCUSDT",
-            start_time=1000000,
-            strategy_name="carga_descarga",
-        ),
-    )
-
-    response = scheduler_agent.handle_message(message)
+    response = scheduler_agent.handle_message(_UNKNOWN_MSG)
 
     assert response.payload.error_code == "UNKNOWN_MESSAGE_TYPE"
 
@@ -203,262 +309,23 @@ def test_reset_to_first_period(scheduler_agent):
     assert len(scheduler_agent.period_parameter_combinations) == 0
 
 
-@patch("trading.agents.scheduler_agent.create_strategy_factory")
-@patch("trading.agents.scheduler_agent.datetime")
-def test_period_progression(mock_datetime, mock_factory, scheduler_agent):
-    """Test progression through periods (1 day → 1 week → 1 month → 3 months)"""
-    from decimal import Decimal
-
-    from trading.domain.messages import BacktestResultsResponse, EvaluationResponse
-
-    # Setup mocks
-    mock_datetime.now.return_value = datetime(2024, 1, 10, 12, 0, 0, tzinfo=timezone.utc)
-    mock_factory.return_value = lambda: None
-
-    # Configure for incremental periods
-    scheduler_agent.config.incremental_periods = [1, 7, 30, 90]
-    scheduler_agent.config.backtests_per_period = 2  # Small for testing
-    scheduler_agent.config.min_passed_backtests_per_period = 2
-
-    # Mock orchestrator responses (all passing)
-    mock_backtest = BacktestResultsResponse(
-        run_id="test_run",
-        status="completed",
-        start_time=1000000,
-        end_time=2000000,
-        duration_seconds=100.0,
-        total_candles_processed=1000,
-        final_balance=Decimal("2600"),
-        total_return=Decimal("100"),
-        return_percentage=4.0,
-        max_drawdown=5.0,
-        total_trades=50,
-        win_rate=60.0,
-        profit_factor=1.5,
-        total_closed_positions=10,
-        winning_positions=6,
-        losing_positions=4,
-        total_commission=Decimal("10"),
-        commission_percentage=10.0,
-        strategy_name="carga_descarga",
-        symbol="BTCUSDT",
-    )
-
-    mock_evaluation = EvaluationResponse(
-        run_id="test_run",
-        evaluation_passed=True,
-        metrics={"sharpe_ratio": 2.5, "max_drawdown": 5.0, "profit_factor": 1.5},
-        kpi_compliance={"sharpe_ratio": True, "max_drawdown": True, "profit_factor": True},
-        recommendation="promote",
-    )
-
-    scheduler_agent.orchestrator.run_backtest.return_value = mock_backtest
-    scheduler_agent.orchestrator.evaluate_backtest.return_value = mock_evaluation
-
-    # Start at period 0 (1 day)
-    assert scheduler_agent.current_period_index == 0
-
-    # Run 2 cycles for period 0 (should advance to period 1)
-    scheduler_agent.run_cycle()
-    scheduler_agent.run_cycle()
-
-    assert scheduler_agent.current_period_index == 1
-    assert scheduler_agent.backtest_count_in_period == 0  # Reset for new period
-    assert scheduler_agent.passed_backtests_in_period == 0
-
-    # Run 2 cycles for period 1 (should advance to period 2)
-    scheduler_agent.run_cycle()
-    scheduler_agent.run_cycle()
-
-    assert scheduler_agent.current_period_index == 2
-
-
-@patch("trading.agents.scheduler_agent.create_strategy_factory")
-@patch("trading.agents.scheduler_agent.datetime")
-def test_reset_on_optimize(mock_datetime, mock_factory, scheduler_agent):
-    """Test reset to first period when optimization is needed"""
-    from decimal import Decimal
-
-    from trading.domain.messages import BacktestResultsResponse, EvaluationResponse
-
-    # Setup mocks
-    mock_datetime.now.return_value = datetime(2024, 1, 10, 12, 0, 0, tzinfo=timezone.utc)
-    mock_factory.return_value = lambda: None
-
-    # Set to period 2 (1 month)
-    scheduler_agent.current_period_index = 2
-    scheduler_agent.backtest_count_in_period = 3
-
-    # Mock orchestrator responses (optimization needed)
-    mock_backtest = BacktestResultsResponse(
-        run_id="test_run",
-        status="completed",
-        start_time=1000000,
-        end_time=2000000,
-        duration_seconds=100.0,
-        total_candles_processed=1000,
-        final_balance=Decimal("2600"),
-        total_return=Decimal("100"),
-        return_percentage=4.0,
-        max_drawdown=5.0,
-        total_trades=50,
-        win_rate=60.0,
-        profit_factor=1.5,
-        total_closed_positions=10,
-        winning_positions=6,
-        losing_positions=4,
-        total_commission=Decimal("10"),
-        commission_percentage=10.0,
-        strategy_name="carga_descarga",
-        symbol="BTCUSDT",
-    )
-
-    mock_evaluation = EvaluationResponse(
-        run_id="test_run",
-        evaluation_passed=False,
-        metrics={"sharpe_ratio": 1.8, "max_drawdown": 8.0, "profit_factor": 1.4},
-        kpi_compliance={"sharpe_ratio": False, "max_drawdown": True, "profit_factor": False},
-        recommendation="optimize",
-    )
-
-    scheduler_agent.orchestrator.run_backtest.return_value = mock_backtest
-    scheduler_agent.orchestrator.evaluate_backtest.return_value = mock_evaluation
-
-    # Run cycle
-    scheduler_agent.run_cycle()
-
-    # Should reset to first period
-    assert scheduler_agent.current_period_index == 0
-    # After reset, the backtest count should be 1 because we just executed one backtest in the new period
-    assert scheduler_agent.backtest_count_in_period == 1
-    assert scheduler_agent.passed_backtests_in_period == 0
-
-
-@patch("trading.agents.scheduler_agent.create_strategy_factory")
-@patch("trading.agents.scheduler_agent.datetime")
-def test_period_failure_reset(mock_datetime, mock_factory, scheduler_agent):
-    """Test reset when period fails (not enough passed backtests)"""
-    from decimal import Decimal
-
-    from trading.domain.messages import BacktestResultsResponse, EvaluationResponse
-
-    # Setup mocks
-    mock_datetime.now.return_value = datetime(2024, 1, 10, 12, 0, 0, tzinfo=timezone.utc)
-    mock_factory.return_value = lambda: None
-
-    # Configure for incremental periods
-    scheduler_agent.config.incremental_periods = [1, 7, 30, 90]
-    scheduler_agent.config.backtests_per_period = 2
-    scheduler_agent.config.min_passed_backtests_per_period = 2
-
-    # Mock orchestrator responses (failing)
-    mock_backtest = BacktestResultsResponse(
-        run_id="test_run",
-        status="completed",
-        start_time=1000000,
-        end_time=2000000,
-        duration_seconds=100.0,
-        total_candles_processed=1000,
-        final_balance=Decimal("2600"),
-        total_return=Decimal("100"),
-        return_percentage=4.0,
-        max_drawdown=5.0,
-        total_trades=50,
-        win_rate=60.0,
-        profit_factor=1.5,
-        total_closed_positions=10,
-        winning_positions=6,
-        losing_positions=4,
-        total_commission=Decimal("10"),
-        commission_percentage=10.0,
-        strategy_name="carga_descarga",
-        symbol="BTCUSDT",
-    )
-
-    mock_evaluation = EvaluationResponse(
-        run_id="test_run",
-        evaluation_passed=False,
-        metrics={"sharpe_ratio": 1.0, "max_drawdown": 15.0, "profit_factor": 1.2},
-        kpi_compliance={"sharpe_ratio": False, "max_drawdown": False, "profit_factor": False},
-        recommendation="reject",
-    )
-
-    scheduler_agent.orchestrator.run_backtest.return_value = mock_backtest
-    scheduler_agent.orchestrator.evaluate_backtest.return_value = mock_evaluation
-
-    # Set to period 1
-    scheduler_agent.current_period_index = 1
-
-    # Run 2 cycles (both failing)
-    scheduler_agent.run_cycle()
-    scheduler_agent.run_cycle()
-
-    # Should reset to first period (only 0 passed, need 2)
-    assert scheduler_agent.current_period_index == 0
-    assert scheduler_agent.backtest_count_in_period == 0
-    assert scheduler_agent.passed_backtests_in_period == 0
-
-
-@patch("trading.agents.scheduler_agent.create_strategy_factory")
-@patch("trading.agents.scheduler_agent.datetime")
-def test_promote_to_production(mock_datetime, mock_factory, scheduler_agent):
-    """Test promotion to production after completing all periods"""
-    from decimal import Decimal
-
-    from trading.domain.messages import BacktestResultsResponse, EvaluationResponse
-
-    # Setup mocks
-    mock_datetime.now.return_value = datetime(2024, 1, 10, 12, 0, 0, tzinfo=timezone.utc)
-    mock_factory.return_value = lambda: None
-
-    # Configure for incremental periods
-    scheduler_agent.config.incremental_periods = [1, 7]  # Short for testing
-    scheduler_agent.config.backtests_per_period = 2
-    scheduler_agent.config.min_passed_backtests_per_period = 2
-
-    # Mock orchestrator responses (all passing)
-    mock_backtest = BacktestResultsResponse(
-        run_id="test_run",
-        status="completed",
-        start_time=1000000,
-        end_time=2000000,
-        duration_seconds=100.0,
-        total_candles_processed=1000,
-        final_balance=Decimal("2600"),
-        total_return=Decimal("100"),
-        return_percentage=4.0,
-        max_drawdown=5.0,
-        total_trades=50,
-        win_rate=60.0,
-        profit_factor=1.5,
-        total_closed_positions=10,
-        winning_positions=6,
-        losing_positions=4,
-        total_commission=Decimal("10"),
-        commission_percentage=10.0,
-        strategy_name="carga_descarga",
-        symbol="BTCUSDT",
-    )
-
-    mock_evaluation = EvaluationResponse(
-        run_id="test_run",
-        evaluation_passed=True,
-        metrics={"sharpe_ratio": 2.5, "max_drawdown": 5.0, "profit_factor": 1.5},
-        kpi_compliance={"sharpe_ratio": True, "max_drawdown": True, "profit_factor": True},
-        recommendation="promote",
-    )
-
-    scheduler_agent.orchestrator.run_backtest.return_value = mock_backtest
-    scheduler_agent.orchestrator.evaluate_backtest.return_value = mock_evaluation
-
-    # Set to last period (index 1 = 7 days) and mark as running
-    scheduler_agent.current_period_index = 1
-    scheduler_agent.running = True
-
-    # Run 2 cycles to complete last period
-    scheduler_agent.run_cycle()
-    scheduler_agent.run_cycle()
-
-    # Should stop scheduler (promote to production)
-    assert scheduler_agent.running is False
-
+@pytest.mark.parametrize(
+    "scheduler_with_responses, config_overrides, initial_state, cycles, expected_state",
+    [scenario[1:] for scenario in _CYCLE_SCENARIOS],
+    ids=[scenario[0] for scenario in _CYCLE_SCENARIOS],
+    indirect=["scheduler_with_responses"],
+)
+def test_run_cycle_scenarios(scheduler_with_responses, config_overrides, initial_state, cycles, expected_state):
+    """Test period progression, resets and promotion across run_cycle() calls"""
+    agent = scheduler_with_responses
+    agent.config = agent.config.model_copy(update=config_overrides)
+    for attribute, value in initial_state.items():
+        setattr(agent, attribute, value)
+
+    for _ in range(cycles):
+        agent.run_cycle()
+
+    assert agent.orchestrator.run_backtest.call_count == cycles
+    assert agent.orchestrator.evaluate_backtest.call_count == cycles
+    for attribute, value in expected_state.items():
+        assert getattr(agent, attribute) == value
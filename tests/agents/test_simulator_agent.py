@@ -1,17 +1,40 @@
 """Tests for SimulatorAgent"""
 
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import Mock, call, patch
 
 import pytest
 
 from trading.agents.simulator_agent import SimulatorAgent
 from trading.domain.messages import AgentMessage, ErrorResponse
+from trading.infrastructure.simulator.simulator import MarketDataSimulator
 
+_UNKNOWN_MSG = AgentMessage(
+    message_id="msg_123",
+    from_agent="orchestrator",
+    to_agent="simulator",
+    flow_id="test_flow",
+    payload={"unknown": "payload"},
+)
 
-@pytest.fixture
+
+@pytest.fixture(scope="module")
 def simulator_agent():
-    """Create a SimulatorAgent instance"""
-    return SimulatorAgent(run_id="test_simulator_run")
+    """Create a SimulatorAgent instance (shared by the module, see _reset_agent)"""
+    agent = SimulatorAgent(run_id="test_simulator_run")
+    yield agent
+    agent.close()
+
+
+@pytest.fixture(autouse=True)
+def _reset_agent(simulator_agent):
+    """Restore the shared SimulatorAgent's mutable state after each test
+
+    Only attributes are reset; close() runs once, when the module fixture is torn down.
+    """
+    yield
+    simulator_agent.simulator = None
+    simulator_agent.episodic_memory.clear()
 
 
 def test_simulator_agent_initialization(simulator_agent):
@@ -32,7 +55,7 @@ def test_simulator_agent_policies(simulator_agent):
 @patch("trading.agents.simulator_agent.MarketDataSimulator")
 def test_initialize(mock_simulator_class, simulator_agent):
     """Test initialize() creates MarketDataSimulator"""
-    mock_simulator = MagicMock()
+    mock_simulator = Mock(spec_set=MarketDataSimulator)
     mock_simulator_class.return_value = mock_simulator
 
     result = simulator_agent.initialize(is_backtest=True)
@@ -46,7 +69,7 @@ def test_initialize(mock_simulator_class, simulator_agent):
 @patch("trading.agents.simulator_agent.MarketDataSimulator")
 def test_initialize_with_is_backtest_false(mock_simulator_class, simulator_agent):
     """Test initialize() with is_backtest=False"""
-    mock_simulator = MagicMock()
+    mock_simulator = Mock(spec_set=MarketDataSimulator)
     mock_simulator_class.return_value = mock_simulator
 
     simulator_agent.initialize(is_backtest=False)
@@ -63,7 +86,7 @@ def test_set_times_not_initialized(simulator_agent):
 @patch("trading.agents.simulator_agent.MarketDataSimulator")
 def test_set_times_success(mock_simulator_class, simulator_agent):
     """Test set_times() successfully sets times"""
-    mock_simulator = MagicMock()
+    mock_simulator = Mock(spec_set=MarketDataSimulator)
     mock_simulator_class.return_value = mock_simulator
     simulator_agent.initialize()
 
@@ -80,7 +103,7 @@ def test_set_times_success(mock_simulator_class, simulator_agent):
 @patch("trading.agents.simulator_agent.MarketDataSimulator")
 def test_set_times_without_end_time(mock_simulator_class, simulator_agent):
     """Test set_times() with end_time=None"""
-    mock_simulator = MagicMock()
+    mock_simulator = Mock(spec_set=MarketDataSimulator)
     mock_simulator_class.return_value = mock_simulator
     simulator_agent.initialize()
 
@@ -93,7 +116,7 @@ def test_set_times_without_end_time(mock_simulator_class, simulator_agent):
 @patch("trading.agents.simulator_agent.MarketDataSimulator")
 def test_set_times_policy_validation_failure(mock_simulator_class, simulator_agent):
     """Test set_times() fails when time range is too small"""
-    mock_simulator = MagicMock()
+    mock_simulator = Mock(spec_set=MarketDataSimulator)
     mock_simulator_class.return_value = mock_simulator
     simulator_agent.initialize()
 
@@ -111,8 +134,7 @@ def test_add_symbol_not_initialized(simulator_agent):
 @patch("trading.agents.simulator_agent.MarketDataSimulator")
 def test_add_symbol_success(mock_simulator_class, simulator_agent):
     """Test add_symbol() successfully adds symbol"""
-    mock_simulator = MagicMock()
-    mock_simulator.symbols_timeframes = {}
+    mock_simulator = Mock(spec=MarketDataSimulator, symbols_timeframes={})
     mock_simulator_class.return_value = mock_simulator
     simulator_agent.initialize()
 
@@ -124,8 +146,7 @@ def test_add_symbol_success(mock_simulator_class, simulator_agent):
 @patch("trading.agents.simulator_agent.MarketDataSimulator")
 def test_add_symbol_with_default_timeframes(mock_simulator_class, simulator_agent):
     """Test add_symbol() uses default timeframes if not provided"""
-    mock_simulator = MagicMock()
-    mock_simulator.symbols_timeframes = {}
+    mock_simulator = Mock(spec=MarketDataSimulator, symbols_timeframes={})
     mock_simulator_class.return_value = mock_simulator
     simulator_agent.initialize()
 
@@ -137,8 +158,8 @@ def test_add_symbol_with_default_timeframes(mock_simulator_class, simulator_agen
 @patch("trading.agents.simulator_agent.MarketDataSimulator")
 def test_add_symbol_policy_validation_failure(mock_simulator_class, simulator_agent):
     """Test add_symbol() fails when max_symbols limit reached"""
-    mock_simulator = MagicMock()
-    mock_simulator.symbols_timeframes = {f"SYMBOL{i}": [] for i in range(10)}  # Already 10 symbols
+    # Already 10 symbols
+    mock_simulator = Mock(spec=MarketDataSimulator, symbols_timeframes={f"SYMBOL{i}": [] for i in range(10)})
     mock_simulator_class.return_value = mock_simulator
     simulator_agent.initialize()
 
@@ -146,70 +167,58 @@ def test_add_symbol_policy_validation_failure(mock_simulator_class, simulator_ag
         simulator_agent.add_symbol("BTCUSDT")
 
 
-def test_handle_message_initialize_action(simulator_agent):
-    """Test handle_message with initialize action"""
-    with patch.object(simulator_agent, "initialize") as mock_initialize:
-        # Create a message and manually set payload as dict
-        # The simulator_agent handler checks isinstance(payload, dict) for backwards compatibility
-        message = MagicMock(spec=AgentMessage)
-        message.payload = {"action": "initialize", "is_backtest": True}
-        message.from_agent = "orchestrator"
-        message.flow_id = "init_flow"
-        
-        # Mock create_message to return a proper response
-        with patch.object(simulator_agent, "create_message") as mock_create_message:
-            mock_response = MagicMock(spec=AgentMessage)
-            mock_response.to_agent = "orchestrator"
-            mock_response.flow_id = "init_flow"
-            mock_response.payload = {"status": "initialized", "run_id": simulator_agent.run_id}
-            mock_create_message.return_value = mock_response
-
-            response = simulator_agent.handle_message(message)
-
-            assert isinstance(response, AgentMessage) or hasattr(response, "to_agent")
-            assert response.to_agent == "orchestrator"
-            assert response.flow_id == "init_flow"
-            assert response.payload["status"] == "initialized"
-            mock_initialize.assert_called_once_with(True)
-
-
-def test_handle_message_set_times_action(simulator_agent):
-    """Test handle_message with set_times action"""
-    with patch.object(simulator_agent, "set_times") as mock_set_times:
-        start_time = 1000
-        end_time = 1000 + 60000  # Meet minimum time range
-        message = MagicMock(spec=AgentMessage)
-        message.payload = {"action": "set_times", "start_time": start_time, "end_time": end_time, "min_candles": 20}
-        message.from_agent = "orchestrator"
-        message.flow_id = "config_flow"
-        
-        with patch.object(simulator_agent, "create_message") as mock_create_message:
-            mock_response = MagicMock(spec=AgentMessage)
-            mock_response.to_agent = "orchestrator"
-            mock_response.flow_id = "config_flow"
-            mock_response.payload = {"status": "configured"}
-            mock_create_message.return_value = mock_response
-
-            response = simulator_agent.handle_message(message)
+@pytest.mark.parametrize(
+    "payload, response_payload, target_method, target_call",
+    [
+        (
+            {"action": "initialize", "is_backtest": True},
+            {"status": "initialized", "run_id": "test_simulator_run"},
+            "initialize",
+            call(True),
+        ),
+        (
+            # Time range meets the 60000ms minimum
+            {"action": "set_times", "start_time": 1000, "end_time": 61000, "min_candles": 20},
+            {"status": "configured"},
+            "set_times",
+            call(start_time=1000, end_time=61000, min_candles=20),
+        ),
+    ],
+    ids=["initialize", "set_times"],
+)
+def test_handle_message_action(simulator_agent, payload, response_payload, target_method, target_call):
+    """Test handle_message dispatches dict actions and replies to the sender"""
+    # The simulator_agent handler checks isinstance(payload, dict) for backwards compatibility
+    message = SimpleNamespace(payload=payload, from_agent="orchestrator", flow_id="action_flow")
+
+    with (
+        patch.object(simulator_agent, target_method) as mock_target,
+        patch.object(simulator_agent, "create_message") as mock_create_message,
+    ):
+        response = simulator_agent.handle_message(message)
 
-            assert hasattr(response, "to_agent")
-            assert response.payload["status"] == "configured"
-            mock_set_times.assert_called_once_with(start_time=start_time, end_time=end_time, min_candles=20)
+    assert response is mock_create_message.return_value
+    assert mock_target.call_args_list == [target_call]
+    mock_create_message.assert_called_once_with(
+        to_agent="orchestrator", flow_id="action_flow", payload=response_payload
+    )
 
 
 def test_handle_message_next_candle_action(simulator_agent):
     """Test handle_message with next_candle action"""
-    mock_simulator = MagicMock()
+    mock_simulator = Mock(spec_set=MarketDataSimulator)
     simulator_agent.simulator = mock_simulator
 
-    message = MagicMock(spec=AgentMessage)
-    message.payload = {"action": "next_candle"}
-    message.from_agent = "orchestrator"
-    message.flow_id = "process_flow"
+    message = SimpleNamespace(
+        payload={"action": "next_candle"},
+        from_agent="orchestrator",
+        flow_id="process_flow",
+    )
     
     with patch.object(simulator_agent, "create_message") as mock_create_message:
-        mock_response = MagicMock(spec=AgentMessage)
-        mock_response.payload = {"status": "candle_processed"}
+        mock_response = SimpleNamespace(
+            payload={"status": "candle_processed"},
+        )
         mock_create_message.return_value = mock_response
 
         response = simulator_agent.handle_message(message)
@@ -222,14 +231,16 @@ def test_handle_message_next_candle_without_simulator(simulator_agent):
     """Test handle_message with next_candle action when simulator is None"""
     simulator_agent.simulator = None
 
-    message = MagicMock(spec=AgentMessage)
-    message.payload = {"action": "next_candle"}
-    message.from_agent = "orchestrator"
-    message.flow_id = "process_flow"
+    message = SimpleNamespace(
+        payload={"action": "next_candle"},
+        from_agent="orchestrator",
+        flow_id="process_flow",
+    )
     
     with patch.object(simulator_agent, "create_message") as mock_create_message:
-        mock_response = MagicMock(spec=AgentMessage)
-        mock_response.payload = {"status": "candle_processed"}
+        mock_response = SimpleNamespace(
+            payload={"status": "candle_processed"},
+        )
         mock_create_message.return_value = mock_response
 
         response = simulator_agent.handle_message(message)
@@ -240,15 +251,7 @@ def test_handle_message_next_candle_without_simulator(simulator_agent):
 
 def test_handle_message_unknown_payload(simulator_agent):
     """Test handle_message with unknown payload"""
-    message = AgentMessage(
-        message_id="msg_123",
-        from_agent="orchestrator",
-        to_agent="simulator",
-        flow_id="test_flow",
-        payload={"unknown": "payload"},
-    )
-
-    response = simulator_agent.handle_message(message)
+    response = simulator_agent.handle_message(_UNKNOWN_MSG)
 
     assert isinstance(response, AgentMessage)
     assert isinstance(response.payload, ErrorResponse)
@@ -259,7 +262,7 @@ def test_handle_message_with_exception(simulator_agent):
     """Test handle_message error handling"""
     # Initialize simulator first
     with patch("trading.agents.simulator_agent.MarketDataSimulator") as mock_sim_class:
-        mock_sim = MagicMock()
+        mock_sim = Mock(spec_set=MarketDataSimulator)
         mock_sim_class.return_value = mock_sim
         simulator_agent.initialize()
 
@@ -268,20 +271,21 @@ def test_handle_message_with_exception(simulator_agent):
 
         start_time = 1000
         end_time = 1000 + 60000
-        message = MagicMock(spec=AgentMessage)
-        message.payload = {"action": "set_times", "start_time": start_time, "end_time": end_time}
-        message.from_agent = "orchestrator"
-        message.flow_id = "test_flow"
+        message = SimpleNamespace(
+            payload={"action": "set_times", "start_time": start_time, "end_time": end_time},
+            from_agent="orchestrator",
+            flow_id="test_flow",
+        )
         
         with patch.object(simulator_agent, "create_message") as mock_create_message:
-            from trading.domain.messages import ErrorResponse
             error_response = ErrorResponse(
                 error_code="HANDLER_ERROR",
                 error_message="Test error",
                 run_id=simulator_agent.run_id,
             )
-            mock_response = MagicMock(spec=AgentMessage)
-            mock_response.payload = error_response
+            mock_response = SimpleNamespace(
+                payload=error_response,
+            )
             mock_create_message.return_value = mock_response
 
             response = simulator_agent.handle_message(message)
@@ -293,7 +297,7 @@ def test_handle_message_with_exception(simulator_agent):
 
 def test_close_cleanup_resources(simulator_agent):
     """Test close() cleans up resources"""
-    mock_simulator = MagicMock()
+    mock_simulator = Mock(spec_set=MarketDataSimulator)
     simulator_agent.simulator = mock_simulator
 
     simulator_agent.close()
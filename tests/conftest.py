@@ -1,7 +1,11 @@
 """Pytest configuration and fixtures"""
+import os
 import sys
 from pathlib import Path
 
+# Pin hash randomization so every pytest-xdist worker (spawned after this runs) orders sets identically
+os.environ.setdefault("PYTHONHASHSEED", "0")
+
 # Add src to Python path for imports
 src_path = Path(__file__).parent.parent / "src"
 if str(src_path) not in sys.path:
@@ -0,0 +1,10 @@
+"""Shared fixtures for domain tests"""
+import pytest
+
+from trading.domain.messages import StartBacktestRequest
+
+
+@pytest.fixture(scope="session")
+def base_backtest_request():
+    """StartBacktestRequest with only the required fields set (treat as read-only)"""
+    return StartBacktestRequest(symbol="BTCUSDT", start_time=1744023500000)
@@ -1,8 +1,19 @@
 """Tests for domain entities"""
 from decimal import Decimal
 
+import pytest
+
 from trading.domain.entities import Candle, Cycle, Order, Position, Trade
 
+D_0_1 = Decimal("0.1")
+D_5 = Decimal("5")
+D_100 = Decimal("100")
+D_49000 = Decimal("49000")
+D_50000 = Decimal("50000")
+D_50010 = Decimal("50010")
+D_50500 = Decimal("50500")
+D_51000 = Decimal("51000")
+
 
 def test_candle_creation():
     """Test Candle entity creation"""
@@ -10,24 +21,24 @@ def test_candle_creation():
         symbol="BTCUSDT",
         timeframe="1m",
         timestamp=1744023500000,
-        open_price=Decimal("50000"),
-        high_price=Decimal("51000"),
-        low_price=Decimal("49000"),
-        close_price=Decimal("50500"),
-        volume=Decimal("100"),
+        open_price=D_50000,
+        high_price=D_51000,
+        low_price=D_49000,
+        close_price=D_50500,
+        volume=D_100,
     )
 
     assert candle.symbol == "BTCUSDT"
     assert candle.timeframe == "1m"
-    assert candle.close_price == Decimal("50500")
+    assert candle.close_price == D_50500
 
 
 def test_order_creation():
     """Test Order entity creation"""
     order = Order(
         symbol="BTCUSDT",
-        price=Decimal("50000"),
-        quantity=Decimal("0.1"),
+        price=D_50000,
+        quantity=D_0_1,
         position_side="long",
         side="buy",
         type="limit",
@@ -46,14 +57,14 @@ def test_position_creation():
     position = Position(
         symbol="BTCUSDT",
         side="long",
-        amount=Decimal("0.1"),
-        entry_price=Decimal("50000"),
-        break_even=Decimal("50010"),
+        amount=D_0_1,
+        entry_price=D_50000,
+        break_even=D_50010,
     )
 
     assert position.symbol == "BTCUSDT"
     assert position.side == "long"
-    assert position.amount == Decimal("0.1")
+    assert position.amount == D_0_1
     assert len(position.trades) == 0
 
 
@@ -62,9 +73,9 @@ def test_position_add_trade():
     position = Position(
         symbol="BTCUSDT",
         side="long",
-        amount=Decimal("0.1"),
-        entry_price=Decimal("50000"),
-        break_even=Decimal("50010"),
+        amount=D_0_1,
+        entry_price=D_50000,
+        break_even=D_50010,
     )
 
     trade = Trade(
@@ -73,9 +84,9 @@ def test_position_add_trade():
         symbol="BTCUSDT",
         position_side="long",
         side="buy",
-        price=Decimal("50000"),
-        quantity=Decimal("0.1"),
-        commission=Decimal("5"),
+        price=D_50000,
+        quantity=D_0_1,
+        commission=D_5,
     )
 
     position.add_trade(trade)
@@ -84,67 +95,42 @@ def test_position_add_trade():
     assert position.trades[0] == trade
 
 
-def test_cycle_creation():
-    """Test Cycle entity creation"""
-    cycle = Cycle(
+@pytest.fixture(scope="module")
+def sample_cycle():
+    """Cycle shared by the cycle tests (read-only)"""
+    return Cycle(
         symbol="BTCUSDT",
         strategy_name="test_strategy",
         start_timestamp=1744023500000,
         end_timestamp=1744023501000,
-        total_pnl=Decimal("100"),
+        total_pnl=D_100,
         long_trades_count=5,
         short_trades_count=3,
         long_max_loads=3,
         short_max_loads=2,
     )
 
-    assert cycle.symbol == "BTCUSDT"
-    assert cycle.strategy_name == "test_strategy"
-    assert cycle.total_pnl == Decimal("100")
-    assert cycle.cycle_id is not None
-    assert cycle.duration_minutes > 0
-
 
-def test_cycle_to_dict():
-    """Test Cycle conversion to dictionary"""
-    cycle = Cycle(
-        symbol="BTCUSDT",
-        strategy_name="test_strategy",
-        start_timestamp=1744023500000,
-        end_timestamp=1744023501000,
-        total_pnl=Decimal("100"),
-        long_trades_count=5,
-        short_trades_count=3,
-        long_max_loads=3,
-        short_max_loads=2,
-    )
+def test_cycle_creation(sample_cycle):
+    """Test Cycle entity creation"""
+    assert sample_cycle.symbol == "BTCUSDT"
+    assert sample_cycle.strategy_name == "test_strategy"
+    assert sample_cycle.total_pnl == D_100
+    assert sample_cycle.cycle_id is not None
+    assert sample_cycle.duration_minutes > 0
+    assert sample_cycle.symbol_key == "btcusdt"
 
-    cycle_dict = cycle.to_dict()
 
-    assert cycle_dict["symbol"] == "BTCUSDT"
+def test_cycle_dict_round_trip(sample_cycle):
+    """Test Cycle survives to_dict() -> from_dict()"""
+    cycle_dict = sample_cycle.to_dict()
     assert cycle_dict["total_pnl"] == "100"  # Decimal converted to string
-    assert cycle_dict["long_trades_count"] == 5
-
-
-def test_cycle_from_dict():
-    """Test Cycle creation from dictionary"""
-    cycle_dict = {
-        "cycle_id": "test_cycle_id",
-        "symbol": "BTCUSDT",
-        "strategy_name": "test_strategy",
-        "start_timestamp": 1744023500000,
-        "end_timestamp": 1744023501000,
-        "duration_minutes": 0.0167,
-        "total_pnl": "100",
-        "long_trades_count": 5,
-        "short_trades_count": 3,
-        "long_max_loads": 3,
-        "short_max_loads": 2,
-    }
-
-    cycle = Cycle.from_dict(cycle_dict)
-
-    assert cycle.cycle_id == "test_cycle_id"
-    assert cycle.symbol == "BTCUSDT"
-    assert cycle.total_pnl == Decimal("100")
 
+    restored = Cycle.from_dict(cycle_dict)
+    restored_dict = restored.to_dict()
+
+    assert restored.total_pnl == D_100
+    # created_at records construction time, so it is not carried over
+    cycle_dict.pop("created_at")
+    restored_dict.pop("created_at")
+    assert restored_dict == cycle_dict
@@ -1,6 +1,9 @@
 """Tests for A2A message contracts"""
 from decimal import Decimal
 
+import pytest
+from pydantic import ValidationError
+
 from trading.domain.messages import (
     AgentMessage,
     BacktestResultsResponse,
@@ -12,6 +15,11 @@ from trading.domain.messages import (
     StartBacktestRequest,
 )
 
+D_10 = Decimal("10")
+D_100 = Decimal("100")
+D_2500 = Decimal("2500")
+D_2600 = Decimal("2600")
+
 
 def test_start_backtest_request():
     """Test StartBacktestRequest creation"""
@@ -24,17 +32,14 @@ def test_start_backtest_request():
     assert request.symbol == "BTCUSDT"
     assert request.start_time == 1744023500000
     assert request.end_time == 1744109900000
-    assert request.initial_balance == Decimal("2500")  # Default
-    assert request.leverage == Decimal("100")  # Default
+    assert request.initial_balance == D_2500  # Default
+    assert request.leverage == D_100  # Default
     assert request.run_id is not None
 
 
-def test_start_backtest_request_defaults():
+def test_start_backtest_request_defaults(base_backtest_request):
     """Test StartBacktestRequest default values"""
-    request = StartBacktestRequest(
-        symbol="ETHUSDT",
-        start_time=1744023500000,
-    )
+    request = base_backtest_request
 
     assert request.end_time is None
     assert request.stop_on_loss is True
@@ -48,7 +53,7 @@ def test_backtest_status_update():
         run_id="test_run_123",
         status="running",
         candles_processed=1000,
-        current_balance=Decimal("2600"),
+        current_balance=D_2600,
         execution_time_seconds=5.5,
         candles_per_second=181.8,
     )
@@ -56,7 +61,7 @@ def test_backtest_status_update():
     assert update.run_id == "test_run_123"
     assert update.status == "running"
     assert update.candles_processed == 1000
-    assert update.current_balance == Decimal("2600")
+    assert update.current_balance == D_2600
 
 
 def test_backtest_results_response():
@@ -68,8 +73,8 @@ def test_backtest_results_response():
         end_time=1744109900000,
         duration_seconds=86400.0,
         total_candles_processed=1000,
-        final_balance=Decimal("2600"),
-        total_return=Decimal("100"),
+        final_balance=D_2600,
+        total_return=D_100,
         return_percentage=4.0,
         max_drawdown=2.0,
         total_trades=100,
@@ -78,7 +83,7 @@ def test_backtest_results_response():
         total_closed_positions=50,
         winning_positions=35,
         losing_positions=15,
-        total_commission=Decimal("10"),
+        total_commission=D_10,
         commission_percentage=10.0,
         strategy_name="test_strategy",
         symbol="BTCUSDT",
@@ -86,7 +91,7 @@ def test_backtest_results_response():
 
     assert results.run_id == "test_run_123"
     assert results.status == "completed"
-    assert results.total_return == Decimal("100")
+    assert results.total_return == D_100
     assert results.win_rate == 65.0
     assert results.strategy_name == "test_strategy"
 
@@ -136,14 +141,13 @@ def test_evaluation_response():
     assert response.kpi_compliance["sharpe_ratio"] is True
 
 
-def test_agent_message():
+def test_agent_message(base_backtest_request):
     """Test AgentMessage wrapper"""
-    request = StartBacktestRequest(symbol="BTCUSDT", start_time=1744023500000)
     message = AgentMessage(
         from_agent="orchestrator",
         to_agent="backtest",
         flow_id="flow_123",
-        payload=request,
+        payload=base_backtest_request,
     )
 
     assert message.from_agent == "orchestrator"
@@ -165,23 +169,18 @@ def test_error_response():
     assert error.run_id == "test_run_123"
 
 
-def test_message_json_serialization():
+def test_message_json_serialization(base_backtest_request):
     """Test that messages can be serialized to JSON"""
-    request = StartBacktestRequest(symbol="BTCUSDT", start_time=1744023500000)
-    json_str = request.model_dump_json()
+    json_str = base_backtest_request.model_dump_json()
 
     assert json_str is not None
     assert "BTCUSDT" in json_str
     assert "2500" in json_str  # Default balance
 
 
-def test_start_backtest_request_timeframes_default():
+def test_start_backtest_request_timeframes_default(base_backtest_request):
     """Test StartBacktestRequest has default timeframes"""
-    request = StartBacktestRequest(
-        symbol="BTCUSDT",
-        start_time=1744023500000
-    )
-    assert request.timeframes == ["1m", "15m", "1h"]
+    assert base_backtest_request.timeframes == ["1m", "15m", "1h"]
 
 
 def test_start_backtest_request_timeframes_custom():
@@ -201,13 +200,9 @@ def test_start_backtest_request_timeframes_custom():
     assert request.timeframes == ["1m", "15m"]
 
 
-def test_start_backtest_request_rsi_limits_default():
+def test_start_backtest_request_rsi_limits_default(base_backtest_request):
     """Test StartBacktestRequest has None as default rsi_limits"""
-    request = StartBacktestRequest(
-        symbol="BTCUSDT",
-        start_time=1744023500000
-    )
-    assert request.rsi_limits is None
+    assert base_backtest_request.rsi_limits is None
 
 
 def test_start_backtest_request_rsi_limits_custom():
@@ -220,50 +215,18 @@ def test_start_backtest_request_rsi_limits_custom():
     assert request.rsi_limits == [10, 50, 90]
 
 
-def test_start_backtest_request_rsi_limits_validation_length():
-    """Test StartBacktestRequest validates rsi_limits has exactly 3 values"""
-    import pytest
-    from pydantic import ValidationError
-
-    # Test with 2 values - should fail
-    with pytest.raises(ValidationError) as exc_info:
-        StartBacktestRequest(
-            symbol="BTCUSDT",
-            start_time=1744023500000,
-            rsi_limits=[10, 50]
-        )
-    assert "exactly 3 values" in str(exc_info.value).lower() or "rsi_limits" in str(exc_info.value).lower()
-
-    # Test with 4 values - should fail
-    with pytest.raises(ValidationError) as exc_info:
-        StartBacktestRequest(
-            symbol="BTCUSDT",
-            start_time=1744023500000,
-            rsi_limits=[10, 50, 90, 95]
-        )
-    assert "exactly 3 values" in str(exc_info.value).lower() or "rsi_limits" in str(exc_info.value).lower()
-
-
-def test_start_backtest_request_rsi_limits_validation_range():
-    """Test StartBacktestRequest validates rsi_limits values are in range 0-100"""
-    import pytest
-    from pydantic import ValidationError
-
-    # Test with value < 0 - should fail
-    with pytest.raises(ValidationError) as exc_info:
-        StartBacktestRequest(
-            symbol="BTCUSDT",
-            start_time=1744023500000,
-            rsi_limits=[-10, 50, 90]
-        )
-    assert "range 0-100" in str(exc_info.value).lower() or "rsi_limits" in str(exc_info.value).lower()
-
-    # Test with value > 100 - should fail
-    with pytest.raises(ValidationError) as exc_info:
-        StartBacktestRequest(
-            symbol="BTCUSDT",
-            start_time=1744023500000,
-            rsi_limits=[10, 50, 110]
-        )
-    assert "range 0-100" in str(exc_info.value).lower() or "rsi_limits" in str(exc_info.value).lower()
-
+@pytest.mark.slow_validation
+@pytest.mark.parametrize(
+    "rsi_limits, error",
+    [
+        ([10, 50], "exactly 3 values"),
+        ([10, 50, 90, 95], "exactly 3 values"),
+        ([-10, 50, 90], "range 0-100"),
+        ([10, 50, 110], "range 0-100"),
+    ],
+    ids=["too_few", "too_many", "below_range", "above_range"],
+)
+def test_start_backtest_request_rsi_limits_validation(rsi_limits, error):
+    """Test StartBacktestRequest validates rsi_limits has exactly 3 values in range 0-100"""
+    with pytest.raises(ValidationError, match=error):
+        StartBacktestRequest(symbol="BTCUSDT", start_time=1744023500000, rsi_limits=rsi_limits)
@@ -1,9 +1,14 @@
 """Tests for backtest exchange adapters"""
 from decimal import Decimal
 
+import pytest
+
+from trading.domain.entities import SymbolInfo
 from trading.domain.ports import MarketDataPort
 from trading.infrastructure.backtest.adapters.exchange_adapter import BacktestExchangeAdapter, SimulatorAdapter
 
+D_10 = Decimal("10")
+
 
 class MockMarketDataPort(MarketDataPort):
     """Mock MarketDataPort for testing"""
@@ -12,12 +17,11 @@ class MockMarketDataPort(MarketDataPort):
         return []
 
     def get_symbol_info(self, symbol: str):
-        from trading.domain.entities import SymbolInfo
         return SymbolInfo(
             symbol=symbol,
             base_asset="BTC",
             quote_asset="USDT",
-            min_notional=Decimal("10"),
+            min_notional=D_10,
             price_precision=2,
             quantity_precision=3,
         )
@@ -35,36 +39,37 @@ class MockMarketDataPort(MarketDataPort):
         pass
 
 
-def test_simulator_adapter_set_base_timeframe():
-    """Test SimulatorAdapter set_base_timeframe passes timeframe to Exchange"""
-    market_data = MockMarketDataPort()
-    adapter = SimulatorAdapter(market_data=market_data)
+# Stateless, so one instance serves every adapter in this module
+_MOCK_PORT = MockMarketDataPort()
 
-    # Verify default
-    assert adapter.simulator.base_timeframe == "1m"
 
-    # Set custom timeframe
-    adapter.set_base_timeframe("3m")
-    assert adapter.simulator.base_timeframe == "3m"
+@pytest.fixture(scope="module")
+def simulator_adapter():
+    """SimulatorAdapter shared by the set_base_timeframe cases"""
+    return SimulatorAdapter(market_data=_MOCK_PORT)
 
-    # Set another timeframe
-    adapter.set_base_timeframe("15m")
-    assert adapter.simulator.base_timeframe == "15m"
 
+@pytest.fixture(scope="module")
+def backtest_exchange_adapter():
+    """BacktestExchangeAdapter shared by the set_base_timeframe cases"""
+    return BacktestExchangeAdapter(market_data_adapter=_MOCK_PORT)
 
-def test_backtest_exchange_adapter_set_base_timeframe():
-    """Test BacktestExchangeAdapter set_base_timeframe passes timeframe to SimulatorAdapter"""
-    market_data = MockMarketDataPort()
-    adapter = BacktestExchangeAdapter(market_data_adapter=market_data)
 
-    # Verify default
-    assert adapter.exchange.base_timeframe == "1m"
+def test_adapters_default_base_timeframe():
+    """Test both adapters start with the 1m base timeframe"""
+    assert SimulatorAdapter(market_data=_MOCK_PORT).simulator.base_timeframe == "1m"
+    assert BacktestExchangeAdapter(market_data_adapter=_MOCK_PORT).exchange.base_timeframe == "1m"
 
-    # Set custom timeframe
-    adapter.set_base_timeframe("3m")
-    assert adapter.exchange.base_timeframe == "3m"
 
-    # Set another timeframe
-    adapter.set_base_timeframe("15m")
-    assert adapter.exchange.base_timeframe == "15m"
+@pytest.mark.parametrize("timeframe", ["3m", "15m", "1m"])
+def test_simulator_adapter_set_base_timeframe(simulator_adapter, timeframe):
+    """Test SimulatorAdapter set_base_timeframe passes timeframe to Exchange"""
+    simulator_adapter.set_base_timeframe(timeframe)
+    assert simulator_adapter.simulator.base_timeframe == timeframe
+
 
+@pytest.mark.parametrize("timeframe", ["3m", "15m", "1m"])
+def test_backtest_exchange_adapter_set_base_timeframe(backtest_exchange_adapter, timeframe):
+    """Test BacktestExchangeAdapter set_base_timeframe passes timeframe to SimulatorAdapter"""
+    backtest_exchange_adapter.set_base_timeframe(timeframe)
+    assert backtest_exchange_adapter.exchange.base_timeframe == timeframe
@@ -1,7 +1,7 @@
 """Tests for BacktestMarketDataAdapter"""
 
 from decimal import Decimal
-from unittest.mock import MagicMock
+from unittest.mock import create_autospec
 
 import pytest
 
@@ -9,12 +9,36 @@ from trading.domain.entities import Candle, SymbolInfo
 from trading.infrastructure.backtest.adapters.market_data_adapter import BacktestMarketDataAdapter
 from trading.infrastructure.simulator.simulator import MarketDataSimulator
 
+D_0_001 = Decimal("0.001")
+D_0_01 = Decimal("0.01")
+D_10 = Decimal("10")
+D_100 = Decimal("100")
+D_49000 = Decimal("49000")
+D_50000 = Decimal("50000")
+D_50500 = Decimal("50500")
+D_51000 = Decimal("51000")
+
+
+def _make_listener():
+    """Return a fresh no-op candle listener (listeners are only compared by identity)"""
+
+    def listener(candle):
+        pass
+
+    return listener
+
+
+@pytest.fixture(scope="module")
+def _shared_simulator():
+    """Autospec'd MarketDataSimulator, built once per module"""
+    return create_autospec(MarketDataSimulator, instance=True, spec_set=True)
+
 
 @pytest.fixture
-def mock_simulator():
-    """Create a mock MarketDataSimulator"""
-    simulator = MagicMock(spec=MarketDataSimulator)
-    return simulator
+def mock_simulator(_shared_simulator):
+    """Create a mock MarketDataSimulator (the shared autospec, with calls and configured returns cleared)"""
+    _shared_simulator.reset_mock(return_value=True, side_effect=True)
+    return _shared_simulator
 
 
 @pytest.fixture
@@ -23,30 +47,30 @@ def market_data_adapter(mock_simulator):
     return BacktestMarketDataAdapter(simulator=mock_simulator)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_candle():
-    """Create a sample Candle"""
+    """Create a sample Candle (read-only, shared by the session)"""
     return Candle(
         symbol="BTCUSDT",
         timeframe="1m",
         timestamp=1744023500000,
-        open_price=Decimal("50000"),
-        high_price=Decimal("51000"),
-        low_price=Decimal("49000"),
-        close_price=Decimal("50500"),
-        volume=Decimal("100"),
+        open_price=D_50000,
+        high_price=D_51000,
+        low_price=D_49000,
+        close_price=D_50500,
+        volume=D_100,
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_symbol_info():
-    """Create a sample SymbolInfo"""
+    """Create a sample SymbolInfo (read-only, shared by the session)"""
     return SymbolInfo(
         symbol="BTCUSDT",
-        min_qty=Decimal("0.001"),
-        min_step=Decimal("0.001"),
-        tick_size=Decimal("0.01"),
-        notional=Decimal("10"),
+        min_qty=D_0_001,
+        min_step=D_0_001,
+        tick_size=D_0_01,
+        notional=D_10,
     )
 
 
@@ -72,7 +96,7 @@ def test_get_candles(market_data_adapter, mock_simulator, sample_candle):
 
 def test_add_complete_candle_listener(market_data_adapter, mock_simulator):
     """Test add_complete_candle_listener registers listener and delegates to simulator"""
-    listener = MagicMock()
+    listener = _make_listener()
 
     market_data_adapter.add_complete_candle_listener("BTCUSDT", "1m", listener)
 
@@ -87,8 +111,8 @@ def test_add_complete_candle_listener(market_data_adapter, mock_simulator):
 
 def test_add_complete_candle_listener_multiple_listeners(market_data_adapter, mock_simulator):
     """Test add_complete_candle_listener with multiple listeners"""
-    listener1 = MagicMock()
-    listener2 = MagicMock()
+    listener1 = _make_listener()
+    listener2 = _make_listener()
 
     market_data_adapter.add_complete_candle_listener("BTCUSDT", "1m", listener1)
     market_data_adapter.add_complete_candle_listener("BTCUSDT", "1m", listener2)
@@ -101,7 +125,7 @@ def test_add_complete_candle_listener_multiple_listeners(market_data_adapter, mo
 
 def test_add_complete_candle_listener_multiple_symbols_timeframes(market_data_adapter, mock_simulator):
     """Test add_complete_candle_listener with multiple symbols and timeframes"""
-    listener = MagicMock()
+    listener = _make_listener()
 
     market_data_adapter.add_complete_candle_listener("BTCUSDT", "1m", listener)
     market_data_adapter.add_complete_candle_listener("ETHUSDT", "15m", listener)
@@ -115,7 +139,7 @@ def test_add_complete_candle_listener_multiple_symbols_timeframes(market_data_ad
 
 def test_add_internal_candle_listener(market_data_adapter, mock_simulator):
     """Test add_internal_candle_listener calls add_complete_candle_listener"""
-    listener = MagicMock()
+    listener = _make_listener()
 
     market_data_adapter.add_internal_candle_listener("BTCUSDT", "1m", listener)
 
@@ -125,7 +149,7 @@ def test_add_internal_candle_listener(market_data_adapter, mock_simulator):
 
 def test_remove_internal_candle_listener(market_data_adapter, mock_simulator):
     """Test remove_internal_candle_listener removes listener and delegates to simulator"""
-    listener = MagicMock()
+    listener = _make_listener()
 
     # First add listener
     market_data_adapter.add_complete_candle_listener("BTCUSDT", "1m", listener)
@@ -142,7 +166,7 @@ def test_remove_internal_candle_listener(market_data_adapter, mock_simulator):
 
 def test_remove_internal_candle_listener_nonexistent(market_data_adapter, mock_simulator):
     """Test remove_internal_candle_listener handles nonexistent listener gracefully"""
-    listener = MagicMock()
+    listener = _make_listener()
 
     # Try to remove without adding
     market_data_adapter.remove_internal_candle_listener("BTCUSDT", "1m", listener)
@@ -153,7 +177,7 @@ def test_remove_internal_candle_listener_nonexistent(market_data_adapter, mock_s
 
 def test_remove_internal_candle_listener_nonexistent_symbol(market_data_adapter, mock_simulator):
     """Test remove_internal_candle_listener handles nonexistent symbol gracefully"""
-    listener = MagicMock()
+    listener = _make_listener()
 
     # Try to remove from nonexistent symbol
     market_data_adapter.remove_internal_candle_listener("NONEXISTENT", "1m", listener)
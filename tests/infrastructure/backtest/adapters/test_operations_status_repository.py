@@ -1,21 +1,33 @@
 """Tests for BacktestOperationsStatusRepository"""
 
+from collections.abc import Mapping
+
 import pytest
 
 from trading.domain.types import ORDER_SIDE_TYPE, SIDE_TYPE
 from trading.infrastructure.backtest.adapters.operations_status_repository import BacktestOperationsStatusRepository
 
+_ALL_OPERATIONS = [("long", "buy"), ("long", "sell"), ("short", "buy"), ("short", "sell")]
+
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def operations_repo():
-    """Create a BacktestOperationsStatusRepository instance"""
+    """Create a BacktestOperationsStatusRepository instance (shared by the module, see _reset)"""
     return BacktestOperationsStatusRepository(symbol="BTCUSDT")
 
 
+@pytest.fixture(autouse=True)
+def _reset(operations_repo):
+    """Start every test with all operations disabled"""
+    for side, order_side in _ALL_OPERATIONS:
+        operations_repo.set_operation_status(side, order_side, False)
+    yield
+
+
 def test_initialization(operations_repo):
     """Test repository initialization"""
     assert operations_repo.symbol == "BTCUSDT"
-    assert isinstance(operations_repo.operations, dict)
+    assert isinstance(operations_repo.operations, Mapping)
     assert "long" in operations_repo.operations
     assert "short" in operations_repo.operations
     assert "buy" in operations_repo.operations["long"]
@@ -32,38 +44,17 @@ def test_initial_state_all_false(operations_repo):
     assert operations_repo.get_operation_status("short", "sell") is False
 
 
-def test_set_operation_status_long_buy(operations_repo):
-    """Test set_operation_status for long buy"""
-    operations_repo.set_operation_status("long", "buy", True)
-
-    assert operations_repo.get_operation_status("long", "buy") is True
-    assert operations_repo.get_operation_status("long", "sell") is False
-    assert operations_repo.get_operation_status("short", "buy") is False
-    assert operations_repo.get_operation_status("short", "sell") is False
-
-
-def test_set_operation_status_long_sell(operations_repo):
-    """Test set_operation_status for long sell"""
-    operations_repo.set_operation_status("long", "sell", True)
-
-    assert operations_repo.get_operation_status("long", "sell") is True
-    assert operations_repo.get_operation_status("long", "buy") is False
-
-
-def test_set_operation_status_short_buy(operations_repo):
-    """Test set_operation_status for short buy"""
-    operations_repo.set_operation_status("short", "buy", True)
-
-    assert operations_repo.get_operation_status("short", "buy") is True
-    assert operations_repo.get_operation_status("short", "sell") is False
-
-
-def test_set_operation_status_short_sell(operations_repo):
-    """Test set_operation_status for short sell"""
-    operations_repo.set_operation_status("short", "sell", True)
+@pytest.mark.parametrize("side, order_side", _ALL_OPERATIONS)
+def test_set_operation_status(operations_repo, side, order_side):
+    """Test set_operation_status only enables the requested operation"""
+    operations_repo.set_operation_status(side, order_side, True)
 
-    assert operations_repo.get_operation_status("short", "sell") is True
-    assert operations_repo.get_operation_status("short", "buy") is False
+    assert operations_repo.get_operation_status(side, order_side) is True
+    assert all(
+        operations_repo.get_operation_status(*other) is False
+        for other in _ALL_OPERATIONS
+        if other != (side, order_side)
+    )
 
 
 def test_set_operation_status_to_false(operations_repo):
@@ -91,9 +82,17 @@ def test_multiple_operations_independent(operations_repo):
 
 def test_operations_in_memory_only(operations_repo):
     """Test operations are stored in memory only (no disk writes)"""
-    # This is more of a documentation test - verify the operations dict is used
+    # This is more of a documentation test - verify the in-memory state is reflected in the view
     operations_repo.set_operation_status("long", "buy", True)
 
-    # Verify it's in the in-memory dict
+    assert operations_repo.get_operation_status("long", "buy") is True
     assert operations_repo.operations["long"]["buy"] is True
 
+
+def test_operations_view_is_read_only(operations_repo):
+    """Test the operations view rejects writes instead of silently dropping them"""
+    with pytest.raises(TypeError):
+        operations_repo.operations["long"]["buy"] = True
+
+    assert operations_repo.get_operation_status("long", "buy") is False
+
@@ -0,0 +1,38 @@
+"""Shared fixtures for backtest infrastructure tests"""
+import pytest
+
+from trading.infrastructure.backtest.config import BacktestConfig, BacktestConfigs
+from trading.infrastructure.simulator.simulator import MarketDataSimulator
+
+
+@pytest.fixture(scope="session")
+def quick_test_config():
+    """Quick test (1 day) preset, built once per session (read-only)"""
+    return BacktestConfigs.get_quick_test_config()
+
+
+@pytest.fixture(scope="session")
+def two_hour_test_config():
+    """2-hour test preset, built once per session (read-only)"""
+    return BacktestConfigs.get_2hour_test_config()
+
+
+@pytest.fixture(scope="session")
+def base_config():
+    """1-day BTCUSDT BacktestConfig on 3m/15m/1h (read-only: BacktestRunner sets log_filename,
+    so pass runners a dataclasses.replace() copy)"""
+    return BacktestConfig(
+        symbol="BTCUSDT",
+        start_time=1744023500000,
+        end_time=1744023500000 + (24 * 60 * 60 * 1000),  # +1 day
+        timeframes=["3m", "15m", "1h"],
+    )
+
+
+@pytest.fixture
+def simulator(base_config):
+    """Backtest MarketDataSimulator with base_config's time range and timeframes"""
+    sim = MarketDataSimulator(is_backtest=True)
+    sim.set_times(start=base_config.start_time, end=base_config.end_time, min_candles=10)
+    sim.symbols_timeframes[base_config.symbol] = base_config.timeframes
+    return sim
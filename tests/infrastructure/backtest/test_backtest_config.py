@@ -1,69 +1,89 @@
 """Tests for backtest configuration"""
 
+import re
 from decimal import Decimal
 
 import pytest
 
-from trading.infrastructure.backtest.config import BacktestConfig, BacktestConfigs, BacktestResults, validate_timeframes
+from trading.infrastructure.backtest.config import BacktestConfig, BacktestResults, validate_timeframes
+
+# validate_timeframes error messages, compiled once for pytest.raises(match=...)
+COUNT_ERR = re.compile(r"Number of timeframes must be 2, 3 or 4")
+EMPTY_ERR = re.compile(r"At least one timeframe must be provided")
+INVALID_ERR = re.compile(r"Invalid timeframes")
+
+# Timestamps in milliseconds
+T0 = 1744023500000
+H = 3_600_000
+DAY = 86_400_000
+
+D_0_0002 = Decimal("0.0002")
+D_0_0005 = Decimal("0.0005")
+D_10 = Decimal("10")
+D_20 = Decimal("20")
+D_100 = Decimal("100")
+D_2500 = Decimal("2500")
+D_2600 = Decimal("2600")
+D_50000 = Decimal("50000")
 
 
 def test_backtest_config_creation():
     """Test BacktestConfig creation"""
     config = BacktestConfig(
         symbol="BTCUSDT",
-        start_time=1744023500000,
-        end_time=1744023500000 + (24 * 60 * 60 * 1000),
-        initial_balance=Decimal("2500"),
-        leverage=Decimal("100"),
+        start_time=T0,
+        end_time=T0 + DAY,
+        initial_balance=D_2500,
+        leverage=D_100,
     )
 
     assert config.symbol == "BTCUSDT"
-    assert config.initial_balance == Decimal("2500")
-    assert config.leverage == Decimal("100")
+    assert config.initial_balance == D_2500
+    assert config.leverage == D_100
     assert config.stop_on_loss is True  # Default value
 
 
 def test_backtest_config_defaults():
     """Test BacktestConfig default values"""
-    config = BacktestConfig(symbol="BTCUSDT", start_time=1744023500000)
+    config = BacktestConfig(symbol="BTCUSDT", start_time=T0)
 
-    assert config.initial_balance == Decimal("2500")  # Default
-    assert config.leverage == Decimal("100")  # Default
-    assert config.maker_fee == Decimal("0.0002")  # Default
-    assert config.taker_fee == Decimal("0.0005")  # Default
-    assert config.max_notional == Decimal("50000")  # Default
+    assert config.initial_balance == D_2500  # Default
+    assert config.leverage == D_100  # Default
+    assert config.maker_fee == D_0_0002  # Default
+    assert config.taker_fee == D_0_0005  # Default
+    assert config.max_notional == D_50000  # Default
     assert config.enable_frontend is False  # Default
     assert config.stop_on_loss is True  # Default
     assert config.max_loss_percentage == 0.5  # Default
 
 
-def test_backtest_configs_quick_test():
-    """Test quick test config preset"""
-    config_dict = BacktestConfigs.get_quick_test_config()
-
-    assert config_dict["symbol"] == "BTCUSDT"
-    assert config_dict["initial_balance"] == Decimal("2500")
-    assert "start_time" in config_dict
-    assert "end_time" in config_dict
-
-
-def test_backtest_configs_2hour_test():
-    """Test 2-hour test config preset"""
-    config_dict = BacktestConfigs.get_2hour_test_config()
+@pytest.mark.parametrize(
+    "preset_fixture, duration_ms, max_loss_percentage",
+    [
+        ("quick_test_config", DAY, 0.1),  # 1 day, 10% max loss
+        ("two_hour_test_config", 2 * H, 0.05),  # 2 hours, 5% max loss
+    ],
+    ids=["quick_test", "2hour_test"],
+)
+def test_backtest_configs_presets(request, preset_fixture, duration_ms, max_loss_percentage):
+    """Test quick and 2-hour test config presets"""
+    config_dict = request.getfixturevalue(preset_fixture)
 
     assert config_dict["symbol"] == "BTCUSDT"
-    assert config_dict["max_loss_percentage"] == 0.05  # 5% for quick test
+    assert config_dict["initial_balance"] == D_2500
+    assert config_dict["end_time"] - config_dict["start_time"] == duration_ms
+    assert config_dict["max_loss_percentage"] == max_loss_percentage
 
 
 def test_backtest_results_creation():
     """Test BacktestResults creation"""
     results = BacktestResults(
-        start_time=1744023500000,
-        end_time=1744023501000,
+        start_time=T0,
+        end_time=T0 + 1000,
         duration_seconds=1.0,
         total_candles_processed=100,
-        final_balance=Decimal("2600"),
-        total_return=Decimal("100"),
+        final_balance=D_2600,
+        total_return=D_100,
         return_percentage=4.0,
         max_drawdown=2.0,
         total_trades=10,
@@ -72,8 +92,8 @@ def test_backtest_results_creation():
         total_closed_positions=8,
         winning_positions=5,
         losing_positions=3,
-        average_trade_size=Decimal("100"),
-        total_commission=Decimal("10"),
+        average_trade_size=D_100,
+        total_commission=D_10,
         commission_percentage=10.0,
         total_closing_trades=8,
         partial_closing_trades=2,
@@ -86,92 +106,84 @@ def test_backtest_results_creation():
         full_losing_trades=2,
         total_cycles=5,
         avg_cycle_duration=10.0,
-        avg_cycle_pnl=Decimal("20"),
+        avg_cycle_pnl=D_20,
         winning_cycles=3,
         losing_cycles=2,
         cycle_win_rate=60.0,
     )
 
-    assert results.final_balance == Decimal("2600")
-    assert results.total_return == Decimal("100")
+    assert results.final_balance == D_2600
+    assert results.total_return == D_100
     assert results.return_percentage == 4.0
     assert results.win_rate == 60.0
     assert results.total_cycles == 5
 
 
-def test_validate_timeframes_count_2():
-    """Test validate_timeframes accepts 2 timeframes"""
-    result = validate_timeframes(["1m", "15m"])
-    assert result == ["1m", "15m"]
-
-    result = validate_timeframes(["3m", "1h"])
-    assert result == ["3m", "1h"]
-
-
-def test_validate_timeframes_count_3():
-    """Test validate_timeframes accepts 3 timeframes"""
-    result = validate_timeframes(["1m", "15m", "1h"])
-    assert result == ["1m", "15m", "1h"]
-
-    result = validate_timeframes(["3m", "15m", "1h"])
-    assert result == ["3m", "15m", "1h"]
-
-
-def test_validate_timeframes_count_4():
-    """Test validate_timeframes accepts 4 timeframes"""
-    result = validate_timeframes(["1m", "5m", "15m", "1h"])
-    assert result == ["1m", "5m", "15m", "1h"]
-
-    result = validate_timeframes(["3m", "15m", "1h", "4h"])
-    assert result == ["3m", "15m", "1h", "4h"]
-
-
-def test_validate_timeframes_count_invalid():
-    """Test validate_timeframes rejects invalid counts (1, 5 or more)"""
-    with pytest.raises(ValueError, match="Number of timeframes must be 2, 3 or 4"):
-        validate_timeframes(["1m"])
-
-    with pytest.raises(ValueError, match="Number of timeframes must be 2, 3 or 4"):
-        validate_timeframes(["1m", "15m", "1h", "4h", "1d"])
-
-    # Empty list raises different error message
-    with pytest.raises(ValueError, match="At least one timeframe must be provided"):
-        validate_timeframes([])
-
-
-def test_validate_timeframes_invalid_strings():
-    """Test validate_timeframes rejects invalid timeframe strings"""
-    with pytest.raises(ValueError, match="Invalid timeframes"):
-        validate_timeframes(["invalid", "15m"])
-
-    with pytest.raises(ValueError, match="Invalid timeframes"):
-        validate_timeframes(["1m", "invalid"])
-
-    with pytest.raises(ValueError, match="Invalid timeframes"):
-        validate_timeframes(["xxx", "yyy"])
+@pytest.mark.parametrize(
+    "timeframes",
+    [
+        ["1m", "15m"],
+        ["3m", "1h"],
+        ["1m", "15m", "1h"],
+        ["3m", "15m", "1h"],
+        ["1m", "5m", "15m", "1h"],
+        ["3m", "15m", "1h", "4h"],
+    ],
+    ids=["2_1m", "2_3m", "3_1m", "3_3m", "4_1m", "4_3m"],
+)
+def test_validate_timeframes_valid(timeframes):
+    """Test validate_timeframes accepts 2, 3 or 4 valid timeframes"""
+    assert validate_timeframes(timeframes) == timeframes
+
+
+@pytest.mark.parametrize(
+    "timeframes, error",
+    [
+        (["1m"], COUNT_ERR),
+        (["1m", "15m", "1h", "4h", "1d"], COUNT_ERR),
+        # Empty list raises different error message
+        ([], EMPTY_ERR),
+        (["invalid", "15m"], INVALID_ERR),
+        (["1m", "invalid"], INVALID_ERR),
+        (["xxx", "yyy"], INVALID_ERR),
+    ],
+    ids=["too_few", "too_many", "empty", "invalid_first", "invalid_last", "all_invalid"],
+)
+def test_validate_timeframes_invalid(timeframes, error):
+    """Test validate_timeframes rejects invalid counts and timeframe strings"""
+    with pytest.raises(ValueError, match=error):
+        validate_timeframes(timeframes)
 
 
 def test_backtest_config_timeframes_default():
     """Test BacktestConfig has default timeframes"""
-    config = BacktestConfig(symbol="BTCUSDT", start_time=1744023500000)
+    config = BacktestConfig(symbol="BTCUSDT", start_time=T0)
     assert config.timeframes == ["1m", "15m", "1h"]
+    assert config.base_timeframe == "1m"
+
+
+def test_backtest_config_base_timeframe_follows_timeframes():
+    """Test base_timeframe reflects timeframes reassigned after construction"""
+    config = BacktestConfig(symbol="BTCUSDT", start_time=T0)
+    config.timeframes = ["3m", "15m", "1h"]
+    assert config.base_timeframe == "3m"
 
 
 def test_backtest_config_timeframes_custom():
     """Test BacktestConfig accepts custom timeframes"""
-    config = BacktestConfig(symbol="BTCUSDT", start_time=1744023500000, timeframes=["3m", "15m", "1h"])
+    config = BacktestConfig(symbol="BTCUSDT", start_time=T0, timeframes=["3m", "15m", "1h"])
     assert config.timeframes == ["3m", "15m", "1h"]
 
-    config = BacktestConfig(symbol="BTCUSDT", start_time=1744023500000, timeframes=["1m", "15m"])
+    config = BacktestConfig(symbol="BTCUSDT", start_time=T0, timeframes=["1m", "15m"])
     assert config.timeframes == ["1m", "15m"]
 
 
 def test_backtest_config_timeframes_validation_on_init():
     """Test BacktestConfig validates timeframes on initialization"""
     # Should raise error for invalid count
-    with pytest.raises(ValueError, match="Number of timeframes must be 2, 3 or 4"):
-        BacktestConfig(symbol="BTCUSDT", start_time=1744023500000, timeframes=["1m"])
+    with pytest.raises(ValueError, match=COUNT_ERR):
+        BacktestConfig(symbol="BTCUSDT", start_time=T0, timeframes=["1m"])
 
     # Should raise error for invalid timeframe strings
-    with pytest.raises(ValueError, match="Invalid timeframes"):
-        BacktestConfig(symbol="BTCUSDT", start_time=1744023500000, timeframes=["invalid", "15m"])
+    with pytest.raises(ValueError, match=INVALID_ERR):
+        BacktestConfig(symbol="BTCUSDT", start_time=T0, timeframes=["invalid", "15m"])
@@ -1,61 +1,117 @@
 """Tests for CyclesRepository"""
 
-import os
 import sqlite3
-import tempfile
 from decimal import Decimal
-from unittest.mock import MagicMock, patch
 
 import pytest
 
 from trading.domain.entities import Cycle
 from trading.infrastructure.backtest.cycles_repository import CyclesRepository
 
+# Timestamps in milliseconds
+T0 = 1744023500000
+H = 3_600_000
 
-@pytest.fixture
-def temp_db():
-    """Create a temporary database file"""
-    fd, path = tempfile.mkstemp(suffix=".db")
-    os.close(fd)
-    yield path
-    # Cleanup
-    if os.path.exists(path):
-        os.remove(path)
+D_50 = Decimal("50")
+D_100 = Decimal("100")
+D_100_50 = Decimal("100.50")
+D_200 = Decimal("200")
+D_999_99 = Decimal("999.99")
 
+# Named shared-cache in-memory database: every connection opened by the repository sees the same data
+SHARED_MEMORY_DB = "file:cycles_repository_tests?mode=memory&cache=shared"
+
+
+@pytest.fixture(scope="module")
+def shared_db():
+    """Shared in-memory database, kept alive for the module by one open connection"""
+    keepalive = sqlite3.connect(SHARED_MEMORY_DB, uri=True)
+    yield keepalive
+    keepalive.close()
 
-@pytest.fixture
-def cycles_repo(temp_db):
-    """Create a CyclesRepository instance with temp database"""
-    return CyclesRepository(db_path=temp_db)
+
+@pytest.fixture(scope="module")
+def cycles_repo(shared_db):
+    """CyclesRepository bound to the shared database (tables are created once per module)"""
+    return CyclesRepository(db_path=SHARED_MEMORY_DB, fast=True)
+
+
+@pytest.fixture(autouse=True)
+def _clean_cycles(cycles_repo, shared_db):
+    """Start every test with an empty cycles table"""
+    # The repository commits on its own connections, so isolate tests by emptying the table
+    shared_db.execute("DELETE FROM cycles")
+    shared_db.commit()
+    yield
 
 
 @pytest.fixture
-def sample_cycle():
-    """Create a sample Cycle"""
-    return Cycle(
+def file_db_path(tmp_path):
+    """Path to an on-disk database, only for tests that check the file itself"""
+    return tmp_path / "backtest_results.db"
+
+
+@pytest.fixture(scope="module")
+def base_cycle_kwargs():
+    """Constructor arguments shared by every Cycle built in this module"""
+    return dict(
         symbol="BTCUSDT",
         strategy_name="test_strategy",
-        start_timestamp=1744023500000,
-        end_timestamp=1744023500000 + (60 * 60 * 1000),  # +1 hour
-        total_pnl=Decimal("100.50"),
+        start_timestamp=T0,
+        end_timestamp=T0 + H,  # +1 hour
+        total_pnl=D_100_50,
         long_trades_count=5,
         short_trades_count=3,
         long_max_loads=2,
         short_max_loads=1,
-        cycle_id="test_cycle_123",
     )
 
 
-def test_initialization(cycles_repo, temp_db):
+@pytest.fixture
+def cycle_factory(base_cycle_kwargs):
+    """Build a Cycle from the shared arguments, overriding the given fields"""
+
+    def _make(**overrides):
+        return Cycle(**{**base_cycle_kwargs, **overrides})
+
+    return _make
+
+
+@pytest.fixture
+def sample_cycle(cycle_factory):
+    """Create a sample Cycle"""
+    return cycle_factory(cycle_id="test_cycle_123")
+
+
+def test_initialization(cycles_repo, shared_db):
     """Test repository initialization creates database and tables"""
-    # Verify database file exists
-    assert os.path.exists(temp_db)
+    # Verify the cycles table exists with all of its columns
+    columns = [row[1] for row in shared_db.execute("PRAGMA table_info(cycles)")]
+    assert columns[0] == "cycle_id"
+    assert len(columns) == 12
 
     # Verify we can query the table (indirect test that it was created)
     cycles = cycles_repo.get_cycles("BTCUSDT")
     assert isinstance(cycles, list)
 
 
+@pytest.mark.parametrize("as_db_path", [str, lambda path: path], ids=["str", "path"])
+def test_initialization_creates_database_file(file_db_path, as_db_path):
+    """Test repository initialization creates the database file on disk, given a str or a Path"""
+    CyclesRepository(db_path=as_db_path(file_db_path))
+
+    assert file_db_path.exists()
+
+
+def test_fast_mode_pragmas(file_db_path):
+    """Test fast mode disables fsync on the connections the repository opens"""
+    repo = CyclesRepository(db_path=str(file_db_path), fast=True)
+
+    with repo._connect() as conn:
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 0  # OFF
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "memory"
+
+
 def test_save_cycle(cycles_repo, sample_cycle):
     """Test save_cycle saves cycle to database"""
     result = cycles_repo.save_cycle(sample_cycle)
@@ -68,39 +124,20 @@ def test_save_cycle(cycles_repo, sample_cycle):
     assert cycles[0].cycle_id == "test_cycle_123"
     assert cycles[0].symbol == "BTCUSDT"
     assert cycles[0].strategy_name == "test_strategy"
-    assert cycles[0].total_pnl == Decimal("100.50")
+    assert cycles[0].total_pnl == D_100_50
 
 
-def test_save_cycle_multiple(cycles_repo, sample_cycle):
-    """Test save_cycle can save multiple cycles"""
-    cycle1 = Cycle(
-        symbol="BTCUSDT",
-        strategy_name="test_strategy",
-        start_timestamp=1744023500000,
-        end_timestamp=1744023500000 + (60 * 60 * 1000),
-        total_pnl=Decimal("100"),
-        long_trades_count=5,
-        short_trades_count=3,
-        long_max_loads=2,
-        short_max_loads=1,
-        cycle_id="cycle_1",
-    )
-
-    cycle2 = Cycle(
-        symbol="BTCUSDT",
-        strategy_name="test_strategy",
-        start_timestamp=1744023500000 + (2 * 60 * 60 * 1000),
-        end_timestamp=1744023500000 + (3 * 60 * 60 * 1000),
-        total_pnl=Decimal("200"),
-        long_trades_count=10,
-        short_trades_count=5,
-        long_max_loads=3,
-        short_max_loads=2,
+def test_save_cycles_multiple(cycles_repo, cycle_factory):
+    """Test save_cycles saves multiple cycles in one call"""
+    cycle1 = cycle_factory(cycle_id="cycle_1", total_pnl=D_100)
+    cycle2 = cycle_factory(
         cycle_id="cycle_2",
+        start_timestamp=T0 + 2 * H,
+        end_timestamp=T0 + 3 * H,
+        total_pnl=D_200,
     )
 
-    cycles_repo.save_cycle(cycle1)
-    cycles_repo.save_cycle(cycle2)
+    assert cycles_repo.save_cycles([cycle1, cycle2]) is True
 
     cycles = cycles_repo.get_cycles("BTCUSDT")
     assert len(cycles) == 2
@@ -115,33 +152,22 @@ def test_save_cycle_replace_existing(cycles_repo, sample_cycle):
     cycles_repo.save_cycle(sample_cycle)
 
     # Modify and save again
-    sample_cycle.total_pnl = Decimal("999.99")
+    sample_cycle.total_pnl = D_999_99
     cycles_repo.save_cycle(sample_cycle)
 
     # Verify only one cycle exists with updated PnL
     cycles = cycles_repo.get_cycles("BTCUSDT")
     assert len(cycles) == 1
-    assert cycles[0].total_pnl == Decimal("999.99")
+    assert cycles[0].total_pnl == D_999_99
 
 
-def test_get_cycles_by_symbol(cycles_repo, sample_cycle):
+def test_get_cycles_by_symbol(cycles_repo, sample_cycle, cycle_factory):
     """Test get_cycles retrieves cycles by symbol"""
     # Save cycle for BTCUSDT
     cycles_repo.save_cycle(sample_cycle)
 
     # Save cycle for different symbol
-    eth_cycle = Cycle(
-        symbol="ETHUSDT",
-        strategy_name="test_strategy",
-        start_timestamp=1744023500000,
-        end_timestamp=1744023500000 + (60 * 60 * 1000),
-        total_pnl=Decimal("50"),
-        long_trades_count=2,
-        short_trades_count=1,
-        long_max_loads=1,
-        short_max_loads=1,
-        cycle_id="eth_cycle_1",
-    )
+    eth_cycle = cycle_factory(symbol="ETHUSDT", total_pnl=D_50, cycle_id="eth_cycle_1")
     cycles_repo.save_cycle(eth_cycle)
 
     # Get cycles for BTCUSDT
@@ -155,22 +181,16 @@ def test_get_cycles_by_symbol(cycles_repo, sample_cycle):
     assert eth_cycles[0].symbol == "ETHUSDT"
 
 
-def test_get_cycles_with_strategy_filter(cycles_repo, sample_cycle):
+def test_get_cycles_with_strategy_filter(cycles_repo, sample_cycle, cycle_factory):
     """Test get_cycles with strategy_name filter"""
     # Save cycle with test_strategy
     cycles_repo.save_cycle(sample_cycle)
 
     # Save cycle with different strategy
-    other_strategy_cycle = Cycle(
-        symbol="BTCUSDT",
+    other_strategy_cycle = cycle_factory(
         strategy_name="other_strategy",
-        start_timestamp=1744023500000 + (2 * 60 * 60 * 1000),
-        end_timestamp=1744023500000 + (3 * 60 * 60 * 1000),
-        total_pnl=Decimal("200"),
-        long_trades_count=10,
-        short_trades_count=5,
-        long_max_loads=3,
-        short_max_loads=2,
+        start_timestamp=T0 + 2 * H,
+        end_timestamp=T0 + 3 * H,
         cycle_id="other_strategy_cycle",
     )
     cycles_repo.save_cycle(other_strategy_cycle)
@@ -186,58 +206,29 @@ def test_get_cycles_with_strategy_filter(cycles_repo, sample_cycle):
     assert other_strategy_cycles[0].strategy_name == "other_strategy"
 
 
-def test_get_cycles_empty(cycles_repo):
-    """Test get_cycles returns empty list when no cycles exist"""
-    cycles = cycles_repo.get_cycles("BTCUSDT")
-    assert cycles == []
+@pytest.mark.parametrize("symbol", ["BTCUSDT", "NONEXISTENT"])
+def test_get_cycles_empty(cycles_repo, symbol):
+    """Test get_cycles returns empty list, not raise, when no cycles exist for the symbol"""
+    assert cycles_repo.get_cycles(symbol) == []
 
 
-def test_get_cycles_ordered_by_timestamp(cycles_repo):
+def test_get_cycles_ordered_by_timestamp(cycles_repo, cycle_factory):
     """Test get_cycles returns cycles ordered by start_timestamp ASC"""
     # Create cycles with different timestamps
-    cycle1 = Cycle(
-        symbol="BTCUSDT",
-        strategy_name="test_strategy",
-        start_timestamp=1744023500000,
-        end_timestamp=1744023500000 + (60 * 60 * 1000),
-        total_pnl=Decimal("100"),
-        long_trades_count=5,
-        short_trades_count=3,
-        long_max_loads=2,
-        short_max_loads=1,
-        cycle_id="cycle_1",
-    )
-
-    cycle2 = Cycle(
-        symbol="BTCUSDT",
-        strategy_name="test_strategy",
-        start_timestamp=1744023500000 + (2 * 60 * 60 * 1000),  # Later
-        end_timestamp=1744023500000 + (3 * 60 * 60 * 1000),
-        total_pnl=Decimal("200"),
-        long_trades_count=10,
-        short_trades_count=5,
-        long_max_loads=3,
-        short_max_loads=2,
+    cycle1 = cycle_factory(cycle_id="cycle_1")
+    cycle2 = cycle_factory(
         cycle_id="cycle_2",
+        start_timestamp=T0 + 2 * H,  # Later
+        end_timestamp=T0 + 3 * H,
     )
-
-    cycle3 = Cycle(
-        symbol="BTCUSDT",
-        strategy_name="test_strategy",
-        start_timestamp=1744023500000 + (1 * 60 * 60 * 1000),  # Middle
-        end_timestamp=1744023500000 + (1.5 * 60 * 60 * 1000),
-        total_pnl=Decimal("150"),
-        long_trades_count=7,
-        short_trades_count=4,
-        long_max_loads=2,
-        short_max_loads=1,
+    cycle3 = cycle_factory(
         cycle_id="cycle_3",
+        start_timestamp=T0 + H,  # Middle
+        end_timestamp=T0 + int(1.5 * H),
     )
 
     # Save in different order
-    cycles_repo.save_cycle(cycle2)
-    cycles_repo.save_cycle(cycle1)
-    cycles_repo.save_cycle(cycle3)
+    cycles_repo.save_cycles([cycle2, cycle1, cycle3])
 
     # Retrieve and verify order
     cycles = cycles_repo.get_cycles("BTCUSDT")
@@ -247,53 +238,15 @@ def test_get_cycles_ordered_by_timestamp(cycles_repo):
     assert cycles[2].cycle_id == "cycle_2"
 
 
-def test_save_cycle_error_handling(cycles_repo, sample_cycle):
+def test_save_cycle_error_handling(cycles_repo, sample_cycle, file_db_path):
     """Test save_cycle handles errors gracefully"""
-    # Test that save_cycle returns False on error
-    # We'll use a mock to simulate a database error during save
-    from unittest.mock import patch
-    
-    # Mock sqlite3.connect to raise an error on save
-    with patch("trading.infrastructure.backtest.cycles_repository.sqlite3.connect") as mock_connect:
-        # First call (in __init__) succeeds, second call (in save_cycle) fails
-        mock_conn = MagicMock()
-        mock_cursor = MagicMock()
-        mock_conn.cursor.return_value = mock_cursor
-        mock_conn.__enter__.return_value = mock_conn
-        mock_conn.__exit__.return_value = None
-        
-        # First call succeeds (for initialization)
-        # Second call raises error (for save_cycle)
-        call_count = [0]
-        def connect_side_effect(*args, **kwargs):
-            call_count[0] += 1
-            if call_count[0] == 1:
-                return mock_conn
-            else:
-                raise sqlite3.OperationalError("Database error")
-        
-        mock_connect.side_effect = connect_side_effect
-        
-        # Create a new repo (first connect succeeds)
-        test_repo = CyclesRepository(db_path=":memory:")
-        
-        # Now save_cycle should fail and return False
-        result = test_repo.save_cycle(sample_cycle)
-        # The error is caught and False is returned
-        assert result is False
-    
+    # Create the tables, then reopen the same file read-only so every write fails
+    CyclesRepository(db_path=str(file_db_path))
+    read_only_repo = CyclesRepository(db_path=f"file:{file_db_path}?mode=ro")
+
+    # The OperationalError is caught and False is returned
+    assert read_only_repo.save_cycle(sample_cycle) is False
+
     # Verify normal cycle saves work
     result = cycles_repo.save_cycle(sample_cycle)
     assert result is True
-
-
-def test_get_cycles_error_handling(temp_db):
-    """Test get_cycles handles errors gracefully"""
-    # Create repository with invalid database path to test error handling
-    # Actually, we'll test with a valid repo but query non-existent symbol
-    repo = CyclesRepository(db_path=temp_db)
-
-    # Query should return empty list, not raise
-    cycles = repo.get_cycles("NONEXISTENT")
-    assert cycles == []
-
@@ -1,13 +1,39 @@
 """Tests for EventDispatcher"""
 
+import gc
+import logging
+from dataclasses import dataclass, field
 from decimal import Decimal
-from unittest.mock import MagicMock
+from unittest.mock import Mock
 
 import pytest
 
 from trading.domain.entities import Cycle
 from trading.infrastructure.backtest.event_dispatcher import EventDispatcher
 
+# Symbols as registered, and the lowercased keys the dispatcher stores them under
+_BTC = "BTCUSDT"
+_BTC_L = "btcusdt"
+_ETH = "ETHUSDT"
+_ETH_L = "ethusdt"
+
+D_100 = Decimal("100")
+D_100_50 = Decimal("100.50")
+
+
+def _make_listener():
+    """Return a fresh no-op cycle listener (for tests that only check registration)"""
+
+    def listener(cycle):
+        pass
+
+    return listener
+
+
+def _make_mock_listener():
+    """Return a Mock cycle listener specced on a plain function (for tests that check calls)"""
+    return Mock(spec=_make_listener())
+
 
 @pytest.fixture
 def event_dispatcher():
@@ -15,15 +41,15 @@ def event_dispatcher():
     return EventDispatcher()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_cycle():
-    """Create a sample Cycle"""
+    """Create a sample Cycle (read-only, shared by the module)"""
     return Cycle(
-        symbol="BTCUSDT",
+        symbol=_BTC,
         strategy_name="test_strategy",
         start_timestamp=1744023500000,
         end_timestamp=1744023500000 + (60 * 60 * 1000),
-        total_pnl=Decimal("100.50"),
+        total_pnl=D_100_50,
         long_trades_count=5,
         short_trades_count=3,
         long_max_loads=2,
@@ -32,6 +58,22 @@ def sample_cycle():
     )
 
 
+@pytest.fixture(scope="module")
+def sample_cycle_lower():
+    """Create a sample Cycle with a lowercase symbol (read-only, shared by the module)"""
+    return Cycle(
+        symbol=_BTC_L,
+        strategy_name="test_strategy",
+        start_timestamp=1744023500000,
+        end_timestamp=1744023500000 + (60 * 60 * 1000),
+        total_pnl=D_100,
+        long_trades_count=5,
+        short_trades_count=3,
+        long_max_loads=2,
+        short_max_loads=1,
+    )
+
+
 def test_initialization(event_dispatcher):
     """Test EventDispatcher initialization"""
     assert isinstance(event_dispatcher.cycle_listeners, dict)
@@ -40,78 +82,90 @@ def test_initialization(event_dispatcher):
 
 def test_add_cycle_listener(event_dispatcher):
     """Test add_cycle_listener registers listener"""
-    listener = MagicMock()
+    listener = _make_listener()
 
-    event_dispatcher.add_cycle_listener("BTCUSDT", listener)
+    event_dispatcher.add_cycle_listener(_BTC, listener)
 
-    assert "btcusdt" in event_dispatcher.cycle_listeners  # Should be lowercased
-    assert listener in event_dispatcher.cycle_listeners["btcusdt"]
+    assert _BTC_L in event_dispatcher.cycle_listeners  # Should be lowercased
+    assert listener in event_dispatcher.cycle_listeners[_BTC_L]
 
 
 def test_add_cycle_listener_multiple_listeners(event_dispatcher):
     """Test add_cycle_listener with multiple listeners for same symbol"""
-    listener1 = MagicMock()
-    listener2 = MagicMock()
+    listener1 = _make_listener()
+    listener2 = _make_listener()
 
-    event_dispatcher.add_cycle_listener("BTCUSDT", listener1)
-    event_dispatcher.add_cycle_listener("BTCUSDT", listener2)
+    event_dispatcher.add_cycle_listener(_BTC, listener1)
+    event_dispatcher.add_cycle_listener(_BTC, listener2)
 
-    assert len(event_dispatcher.cycle_listeners["btcusdt"]) == 2
-    assert listener1 in event_dispatcher.cycle_listeners["btcusdt"]
-    assert listener2 in event_dispatcher.cycle_listeners["btcusdt"]
+    assert len(event_dispatcher.cycle_listeners[_BTC_L]) == 2
+    assert listener1 in event_dispatcher.cycle_listeners[_BTC_L]
+    assert listener2 in event_dispatcher.cycle_listeners[_BTC_L]
 
 
 def test_add_cycle_listener_multiple_symbols(event_dispatcher):
     """Test add_cycle_listener with multiple symbols"""
-    listener1 = MagicMock()
-    listener2 = MagicMock()
+    listener1 = _make_listener()
+    listener2 = _make_listener()
 
-    event_dispatcher.add_cycle_listener("BTCUSDT", listener1)
-    event_dispatcher.add_cycle_listener("ETHUSDT", listener2)
+    event_dispatcher.add_cycle_listener(_BTC, listener1)
+    event_dispatcher.add_cycle_listener(_ETH, listener2)
 
-    assert "btcusdt" in event_dispatcher.cycle_listeners
-    assert "ethusdt" in event_dispatcher.cycle_listeners
-    assert listener1 in event_dispatcher.cycle_listeners["btcusdt"]
-    assert listener2 in event_dispatcher.cycle_listeners["ethusdt"]
+    assert _BTC_L in event_dispatcher.cycle_listeners
+    assert _ETH_L in event_dispatcher.cycle_listeners
+    assert listener1 in event_dispatcher.cycle_listeners[_BTC_L]
+    assert listener2 in event_dispatcher.cycle_listeners[_ETH_L]
 
 
 def test_add_cycle_listener_case_insensitive(event_dispatcher):
     """Test add_cycle_listener is case insensitive"""
-    listener = MagicMock()
+    listener = _make_listener()
 
-    event_dispatcher.add_cycle_listener("BTCUSDT", listener)
-    event_dispatcher.add_cycle_listener("btcusdt", listener)  # Same symbol, different case
+    event_dispatcher.add_cycle_listener(_BTC, listener)
+    event_dispatcher.add_cycle_listener(_BTC_L, listener)  # Same symbol, different case
 
     # Should still be one entry (lowercased)
     assert len(event_dispatcher.cycle_listeners) == 1
-    assert "btcusdt" in event_dispatcher.cycle_listeners
+    assert _BTC_L in event_dispatcher.cycle_listeners
+
+
+def test_add_cycle_listener_registers_once(event_dispatcher, sample_cycle):
+    """Test adding the same listener twice only calls it once per cycle"""
+    listener = _make_mock_listener()
+
+    event_dispatcher.add_cycle_listener(_BTC, listener)
+    event_dispatcher.add_cycle_listener(_BTC, listener)
+    event_dispatcher.dispatch_cycle_completion(sample_cycle)
+
+    assert len(event_dispatcher.cycle_listeners[_BTC_L]) == 1
+    listener.assert_called_once_with(sample_cycle)
 
 
 def test_remove_cycle_listener(event_dispatcher):
     """Test remove_cycle_listener removes listener"""
-    listener = MagicMock()
+    listener = _make_listener()
 
-    event_dispatcher.add_cycle_listener("BTCUSDT", listener)
-    assert listener in event_dispatcher.cycle_listeners["btcusdt"]
+    event_dispatcher.add_cycle_listener(_BTC, listener)
+    assert listener in event_dispatcher.cycle_listeners[_BTC_L]
 
-    event_dispatcher.remove_cycle_listener("BTCUSDT", listener)
-    assert listener not in event_dispatcher.cycle_listeners["btcusdt"]
+    event_dispatcher.remove_cycle_listener(_BTC, listener)
+    assert _BTC_L not in event_dispatcher.cycle_listeners  # Empty symbol is pruned
 
 
 def test_remove_cycle_listener_nonexistent(event_dispatcher):
     """Test remove_cycle_listener handles nonexistent listener gracefully"""
-    listener = MagicMock()
+    listener = _make_listener()
 
     # Try to remove without adding
-    event_dispatcher.remove_cycle_listener("BTCUSDT", listener)
+    event_dispatcher.remove_cycle_listener(_BTC, listener)
 
     # Should not raise error
-    assert "btcusdt" not in event_dispatcher.cycle_listeners or len(event_dispatcher.cycle_listeners.get("btcusdt", [])) == 0
+    assert _BTC_L not in event_dispatcher.cycle_listeners
 
 
 def test_remove_cycle_listener_nonexistent_symbol(event_dispatcher):
     """Test remove_cycle_listener handles nonexistent symbol gracefully"""
-    listener = MagicMock()
+    listener = _make_listener()
 
     # Try to remove from nonexistent symbol
     event_dispatcher.remove_cycle_listener("NONEXISTENT", listener)
@@ -122,21 +176,21 @@ def test_remove_cycle_listener_nonexistent_symbol(event_dispatcher):
 
 def test_remove_cycle_listener_case_insensitive(event_dispatcher):
     """Test remove_cycle_listener is case insensitive"""
-    listener = MagicMock()
+    listener = _make_listener()
 
-    event_dispatcher.add_cycle_listener("BTCUSDT", listener)
-    event_dispatcher.remove_cycle_listener("btcusdt", listener)  # Different case
+    event_dispatcher.add_cycle_listener(_BTC, listener)
+    event_dispatcher.remove_cycle_listener(_BTC_L, listener)  # Different case
 
-    assert listener not in event_dispatcher.cycle_listeners["btcusdt"]
+    assert _BTC_L not in event_dispatcher.cycle_listeners
 
 
 def test_dispatch_cycle_completion(event_dispatcher, sample_cycle):
     """Test dispatch_cycle_completion calls all listeners"""
-    listener1 = MagicMock()
-    listener2 = MagicMock()
+    listener1 = _make_mock_listener()
+    listener2 = _make_mock_listener()
 
-    event_dispatcher.add_cycle_listener("BTCUSDT", listener1)
-    event_dispatcher.add_cycle_listener("BTCUSDT", listener2)
+    event_dispatcher.add_cycle_listener(_BTC, listener1)
+    event_dispatcher.add_cycle_listener(_BTC, listener2)
 
     event_dispatcher.dispatch_cycle_completion(sample_cycle)
 
@@ -152,11 +206,11 @@ def test_dispatch_cycle_completion_no_listeners(event_dispatcher, sample_cycle):
 
 def test_dispatch_cycle_completion_different_symbol(event_dispatcher, sample_cycle):
     """Test dispatch_cycle_completion only calls listeners for matching symbol"""
-    listener1 = MagicMock()
-    listener2 = MagicMock()
+    listener1 = _make_mock_listener()
+    listener2 = _make_mock_listener()
 
-    event_dispatcher.add_cycle_listener("BTCUSDT", listener1)
-    event_dispatcher.add_cycle_listener("ETHUSDT", listener2)
+    event_dispatcher.add_cycle_listener(_BTC, listener1)
+    event_dispatcher.add_cycle_listener(_ETH, listener2)
 
     # Dispatch for BTCUSDT
     event_dispatcher.dispatch_cycle_completion(sample_cycle)
@@ -165,30 +219,18 @@ def test_dispatch_cycle_completion_different_symbol(event_dispatcher, sample_cyc
     listener2.assert_not_called()
 
 
-def test_dispatch_cycle_completion_case_insensitive(event_dispatcher):
+def test_dispatch_cycle_completion_case_insensitive(event_dispatcher, sample_cycle_lower):
     """Test dispatch_cycle_completion is case insensitive"""
-    listener = MagicMock()
-    event_dispatcher.add_cycle_listener("BTCUSDT", listener)
+    listener = _make_mock_listener()
+    event_dispatcher.add_cycle_listener(_BTC, listener)
 
     # Cycle with different case
-    cycle = Cycle(
-        symbol="btcusdt",  # Lowercase
-        strategy_name="test_strategy",
-        start_timestamp=1744023500000,
-        end_timestamp=1744023500000 + (60 * 60 * 1000),
-        total_pnl=Decimal("100"),
-        long_trades_count=5,
-        short_trades_count=3,
-        long_max_loads=2,
-        short_max_loads=1,
-    )
+    event_dispatcher.dispatch_cycle_completion(sample_cycle_lower)
 
-    event_dispatcher.dispatch_cycle_completion(cycle)
+    listener.assert_called_once_with(sample_cycle_lower)
 
-    listener.assert_called_once_with(cycle)
 
-
-def test_dispatch_cycle_completion_listener_error(event_dispatcher, sample_cycle, capsys):
+def test_dispatch_cycle_completion_listener_error(event_dispatcher, sample_cycle, caplog):
     """Test dispatch_cycle_completion handles listener errors gracefully"""
     def failing_listener(cycle):
         raise Exception("Listener error")
@@ -196,52 +238,139 @@ def test_dispatch_cycle_completion_listener_error(event_dispatcher, sample_cycle
     def working_listener(cycle):
         pass
 
-    listener1 = MagicMock(side_effect=failing_listener)
-    listener2 = MagicMock(side_effect=working_listener)
+    listener1 = Mock(spec=failing_listener, side_effect=failing_listener)
+    listener2 = Mock(spec=working_listener, side_effect=working_listener)
 
-    event_dispatcher.add_cycle_listener("BTCUSDT", listener1)
-    event_dispatcher.add_cycle_listener("BTCUSDT", listener2)
+    event_dispatcher.add_cycle_listener(_BTC, listener1)
+    event_dispatcher.add_cycle_listener(_BTC, listener2)
 
     # Should not raise, but continue with other listeners
-    event_dispatcher.dispatch_cycle_completion(sample_cycle)
+    with caplog.at_level(logging.ERROR):
+        event_dispatcher.dispatch_cycle_completion(sample_cycle)
 
     # Verify both were called (error didn't stop execution)
     assert listener1.called
     assert listener2.called
 
-    # Verify error was printed
-    captured = capsys.readouterr()
-    assert "Error in cycle listener" in captured.out
+    # Verify error was logged
+    assert "Error in cycle listener: Listener error" in caplog.text
+
+
+def test_dispatch_cycle_completion_listener_unsubscribes(event_dispatcher, sample_cycle):
+    """Test a listener can remove itself while the cycle is being dispatched"""
+    other_listener = _make_mock_listener()
+
+    def one_shot_listener(cycle):
+        event_dispatcher.remove_cycle_listener(_BTC, one_shot_listener)
+
+    event_dispatcher.add_cycle_listener(_BTC, one_shot_listener)
+    event_dispatcher.add_cycle_listener(_BTC, other_listener)
+
+    event_dispatcher.dispatch_cycle_completion(sample_cycle)
+
+    other_listener.assert_called_once_with(sample_cycle)
+    assert one_shot_listener not in event_dispatcher.cycle_listeners[_BTC_L]
+
+
+def test_bound_method_listener_held_weakly(event_dispatcher, sample_cycle):
+    """Test a bound-method listener is dispatched to and dropped once its owner is collected"""
+
+    class Owner:
+        def __init__(self):
+            self.cycles = []
+
+        def on_cycle(self, cycle):
+            self.cycles.append(cycle)
+
+    owner = Owner()
+    event_dispatcher.add_cycle_listener(_BTC, owner.on_cycle)
+    event_dispatcher.dispatch_cycle_completion(sample_cycle)
+    assert owner.cycles == [sample_cycle]
+
+    event_dispatcher.remove_cycle_listener(_BTC, owner.on_cycle)
+    assert event_dispatcher.has_cycle_listeners(_BTC) is False
+
+    event_dispatcher.add_cycle_listener(_BTC, owner.on_cycle)
+    del owner
+    gc.collect()
+    assert event_dispatcher.has_cycle_listeners(_BTC) is False
+
+
+@dataclass
+class _UnhashableOwner:
+    """Dataclass owner: eq=True leaves it unhashable"""
+
+    cycles: list = field(default_factory=list)
+
+    def on_cycle(self, cycle):
+        self.cycles.append(cycle)
+
+
+class _SlottedOwner:
+    """__slots__ owner without __weakref__, so it can't be weakly referenced"""
+
+    __slots__ = ("cycles",)
+
+    def __init__(self):
+        self.cycles = []
+
+    def on_cycle(self, cycle):
+        self.cycles.append(cycle)
+
+
+@pytest.mark.parametrize("owner_cls", [_UnhashableOwner, _SlottedOwner], ids=["unhashable", "slots"])
+def test_bound_method_listener_without_weakref_support(event_dispatcher, sample_cycle, owner_cls):
+    """Test a bound method whose owner can't back a WeakMethod is held strongly and still removable"""
+    owner = owner_cls()
+    event_dispatcher.add_cycle_listener(_BTC, owner.on_cycle)
+    event_dispatcher.dispatch_cycle_completion(sample_cycle)
+    assert owner.cycles == [sample_cycle]
+
+    event_dispatcher.remove_cycle_listener(_BTC, owner.on_cycle)
+    assert event_dispatcher.has_cycle_listeners(_BTC) is False
 
 
 def test_has_cycle_listeners(event_dispatcher):
     """Test has_cycle_listeners returns True when listeners exist"""
-    listener = MagicMock()
+    listener = _make_listener()
 
-    assert event_dispatcher.has_cycle_listeners("BTCUSDT") is False
+    assert event_dispatcher.has_cycle_listeners(_BTC) is False
 
-    event_dispatcher.add_cycle_listener("BTCUSDT", listener)
+    event_dispatcher.add_cycle_listener(_BTC, listener)
 
-    assert event_dispatcher.has_cycle_listeners("BTCUSDT") is True
+    assert event_dispatcher.has_cycle_listeners(_BTC) is True
 
 
 def test_has_cycle_listeners_after_removal(event_dispatcher):
     """Test has_cycle_listeners returns False after removing all listeners"""
-    listener = MagicMock()
+    listener = _make_listener()
+
+    event_dispatcher.add_cycle_listener(_BTC, listener)
+    assert event_dispatcher.has_cycle_listeners(_BTC) is True
+
+    event_dispatcher.remove_cycle_listener(_BTC, listener)
+    assert event_dispatcher.has_cycle_listeners(_BTC) is False
+
+
+def test_remove_cycle_listener_keeps_symbol_with_remaining_listeners(event_dispatcher):
+    """Test removing one of several listeners keeps the symbol registered"""
+    listener1 = _make_listener()
+    listener2 = _make_listener()
 
-    event_dispatcher.add_cycle_listener("BTCUSDT", listener)
-    assert event_dispatcher.has_cycle_listeners("BTCUSDT") is True
+    event_dispatcher.add_cycle_listener(_BTC, listener1)
+    event_dispatcher.add_cycle_listener(_BTC, listener2)
+    event_dispatcher.remove_cycle_listener(_BTC, listener1)
 
-    event_dispatcher.remove_cycle_listener("BTCUSDT", listener)
-    assert event_dispatcher.has_cycle_listeners("BTCUSDT") is False
+    assert list(event_dispatcher.cycle_listeners[_BTC_L]) == [listener2]
+    assert event_dispatcher.has_cycle_listeners(_BTC) is True
 
 
 def test_has_cycle_listeners_case_insensitive(event_dispatcher):
     """Test has_cycle_listeners is case insensitive"""
-    listener = MagicMock()
+    listener = _make_listener()
 
-    event_dispatcher.add_cycle_listener("BTCUSDT", listener)
+    event_dispatcher.add_cycle_listener(_BTC, listener)
 
-    assert event_dispatcher.has_cycle_listeners("btcusdt") is True
+    assert event_dispatcher.has_cycle_listeners(_BTC_L) is True
     assert event_dispatcher.has_cycle_listeners("BtcUsdt") is True
 
@@ -1,223 +1,117 @@
 """Tests for BacktestRunner"""
 
+from dataclasses import replace
 from decimal import Decimal
 from unittest.mock import Mock
 
+import pytest
+
 from trading.domain.entities import Trade
 from trading.domain.ports import StrategyPort
-from trading.infrastructure.backtest.config import BacktestConfig, BacktestResults
+from trading.infrastructure.backtest.config import BacktestResults
 from trading.infrastructure.backtest.runner import BacktestRunner
-from trading.infrastructure.simulator.simulator import MarketDataSimulator, get_base_timeframe
-
-
-def test_backtest_runner_calculates_base_timeframe():
-    """Test BacktestRunner calculates base timeframe correctly from config.timeframes"""
-    # Test with default timeframes (1m, 15m, 1h)
-    config = BacktestConfig(
-        symbol="BTCUSDT",
-        start_time=1744023500000,
-        end_time=1744023500000 + (24 * 60 * 60 * 1000),
-        timeframes=["1m", "15m", "1h"],
-    )
-    base_timeframe = get_base_timeframe(config.timeframes)
-    assert base_timeframe == "1m"
-
-    # Test with custom timeframes (3m, 15m, 1h)
-    config = BacktestConfig(
-        symbol="BTCUSDT",
-        start_time=1744023500000,
-        end_time=1744023500000 + (24 * 60 * 60 * 1000),
-        timeframes=["3m", "15m", "1h"],
-    )
-    base_timeframe = get_base_timeframe(config.timeframes)
-    assert base_timeframe == "3m"
-
-    # Test with 2 timeframes
-    config = BacktestConfig(
-        symbol="BTCUSDT",
-        start_time=1744023500000,
-        end_time=1744023500000 + (24 * 60 * 60 * 1000),
-        timeframes=["15m", "1h"],
-    )
-    base_timeframe = get_base_timeframe(config.timeframes)
-    assert base_timeframe == "15m"
-
-
-def test_backtest_runner_configures_exchange_base_timeframe():
-    """Test BacktestRunner configures Exchange with base timeframe"""
-    config = BacktestConfig(
-        symbol="BTCUSDT",
-        start_time=1744023500000,
-        end_time=1744023500000 + (24 * 60 * 60 * 1000),
-        timeframes=["3m", "15m", "1h"],
-    )
-
-    # Create mock simulator
-    simulator = MarketDataSimulator(is_backtest=True)
-    simulator.set_times(start=config.start_time, end=config.end_time, min_candles=10)
-    simulator.symbols_timeframes[config.symbol] = config.timeframes
-
-    # Create runner
-    runner = BacktestRunner(config=config, simulator=simulator)
-
-    # Create a mock strategy factory
-    mock_strategy = Mock(spec=StrategyPort)
-
-    def strategy_factory(symbol, exchange, market_data, cycle_dispatcher, strategy_name):
-        return mock_strategy
-
-    # Setup exchange and strategy
-    runner.setup_exchange_and_strategy(strategy_factory=strategy_factory)
-
-    # Verify that exchange was configured with base timeframe
-    # The base timeframe for ["3m", "15m", "1h"] should be "3m"
-    expected_base_timeframe = get_base_timeframe(config.timeframes)
-    assert expected_base_timeframe == "3m"
+from trading.infrastructure.simulator.simulator import get_base_timeframe
 
-    # Access the exchange's base_timeframe through the adapter chain
-    assert runner.exchange.exchange.base_timeframe == "3m"
-
-
-def test_backtest_runner_timeframes_1m_15m_1h():
-    """Test BacktestRunner with default timeframes (1m, 15m, 1h)"""
-    config = BacktestConfig(
-        symbol="BTCUSDT",
-        start_time=1744023500000,
-        end_time=1744023500000 + (24 * 60 * 60 * 1000),
-        timeframes=["1m", "15m", "1h"],
-    )
-
-    simulator = MarketDataSimulator(is_backtest=True)
-    simulator.set_times(start=config.start_time, end=config.end_time, min_candles=10)
-    simulator.symbols_timeframes[config.symbol] = config.timeframes
-
-    runner = BacktestRunner(config=config, simulator=simulator)
-
-    mock_strategy = Mock(spec=StrategyPort)
-
-    def strategy_factory(symbol, exchange, market_data, cycle_dispatcher, strategy_name):
-        return mock_strategy
-
-    runner.setup_exchange_and_strategy(strategy_factory=strategy_factory)
-
-    # Verify base timeframe is "1m"
-    assert runner.exchange.exchange.base_timeframe == "1m"
-
-
-def test_backtest_runner_timeframes_3m_15m_1h():
-    """Test BacktestRunner with custom timeframes (3m, 15m, 1h)"""
-    config = BacktestConfig(
-        symbol="BTCUSDT",
-        start_time=1744023500000,
-        end_time=1744023500000 + (24 * 60 * 60 * 1000),
-        timeframes=["3m", "15m", "1h"],
-    )
+_BTC = "BTCUSDT"
 
-    simulator = MarketDataSimulator(is_backtest=True)
-    simulator.set_times(start=config.start_time, end=config.end_time, min_candles=10)
-    simulator.symbols_timeframes[config.symbol] = config.timeframes
+D_0 = Decimal("0")
+D_0_1 = Decimal("0.1")
+D_2_5 = Decimal("2.5")
+D_50_0 = Decimal("50.0")
+D_192_5 = Decimal("192.5")
 
-    runner = BacktestRunner(config=config, simulator=simulator)
 
+@pytest.fixture
+def strategy_factory():
+    """Return (mock strategy, factory that always builds it) for setup_exchange_and_strategy"""
     mock_strategy = Mock(spec=StrategyPort)
 
-    def strategy_factory(symbol, exchange, market_data, cycle_dispatcher, strategy_name):
+    def factory(symbol, exchange, market_data, cycle_dispatcher, strategy_name):
         return mock_strategy
 
-    runner.setup_exchange_and_strategy(strategy_factory=strategy_factory)
-
-    # Verify base timeframe is "3m"
-    assert runner.exchange.exchange.base_timeframe == "3m"
+    return mock_strategy, factory
 
 
-def test_validate_metrics_consistency_with_opening_commissions():
-    """Test _validate_metrics_consistency correctly handles opening commissions"""
-    config = BacktestConfig(
-        symbol="BTCUSDT",
-        start_time=1744023500000,
-        end_time=1744023500000 + (24 * 60 * 60 * 1000),
-        initial_balance=Decimal("2500"),
-        timeframes=["1m", "15m", "1h"],
-    )
-
-    simulator = MarketDataSimulator(is_backtest=True)
-    simulator.set_times(start=config.start_time, end=config.end_time, min_candles=10)
-    simulator.symbols_timeframes[config.symbol] = config.timeframes
+@pytest.mark.parametrize(
+    "timeframes, expected_base_timeframe",
+    [(["1m", "15m", "1h"], "1m"), (["3m", "15m", "1h"], "3m"), (["15m", "1h"], "15m")],
+    ids=["1m_15m_1h", "3m_15m_1h", "15m_1h"],
+)
+def test_backtest_runner_base_timeframe(base_config, simulator, strategy_factory, timeframes, expected_base_timeframe):
+    """Test BacktestRunner calculates the base timeframe from config.timeframes and configures Exchange with it"""
+    config = replace(base_config, timeframes=timeframes)
+    assert config.base_timeframe == get_base_timeframe(timeframes) == expected_base_timeframe
 
+    # BacktestRunner overwrites the simulator's timeframes for config.symbol
     runner = BacktestRunner(config=config, simulator=simulator)
+    _, factory = strategy_factory
+    runner.setup_exchange_and_strategy(strategy_factory=factory)
 
-    # Create trades with opening commissions (realized_pnl == 0)
-    opening_trade1 = Trade(
-        order_id="order1",
-        timestamp=1744023500000,
-        symbol="BTCUSDT",
-        position_side="long",
-        side="buy",
-        price=Decimal("50000"),
-        quantity=Decimal("0.1"),
-        commission=Decimal("1.0"),  # Opening commission
-        realized_pnl=Decimal("0"),  # Opening position has no realized P&L
-    )
-
-    opening_trade2 = Trade(
-        order_id="order2",
-        timestamp=1744023501000,
-        symbol="BTCUSDT",
-        position_side="short",
-        side="sell",
-        price=Decimal("50100"),
-        quantity=Decimal("0.1"),
-        commission=Decimal("1.5"),  # Opening commission
-        realized_pnl=Decimal("0"),  # Opening position has no realized P&L
-    )
-
-    # Create closing trades (realized_pnl != 0)
-    closing_trade1 = Trade(
-        order_id="order3",
-        timestamp=1744023502000,
-        symbol="BTCUSDT",
-        position_side="long",
-        side="sell",
-        price=Decimal("51000"),
-        quantity=Decimal("0.1"),
-        commission=Decimal("2.0"),  # Closing commission
-        realized_pnl=Decimal("98.0"),  # Profit: (51000 - 50000) * 0.1 - 1.0 - 2.0 = 98.0
-    )
-
-    closing_trade2 = Trade(
-        order_id="order4",
-        timestamp=1744023503000,
-        symbol="BTCUSDT",
-        position_side="short",
-        side="buy",
-        price=Decimal("49500"),
-        quantity=Decimal("0.1"),
-        commission=Decimal("2.5"),  # Closing commission
-        realized_pnl=Decimal("97.0"),  # Profit: (50100 - 49500) * 0.1 - 1.5 - 2.5 = 97.0
-    )
-
-    trades = [opening_trade1, opening_trade2, closing_trade1, closing_trade2]
-
-    # Calculate expected values:
-    # sum_realized_pnl = 98.0 + 97.0 = 195.0
-    # opening_commissions = 1.0 + 1.5 = 2.5
-    # total_return = sum_realized_pnl - opening_commissions = 195.0 - 2.5 = 192.5
-    # OR: total_return already includes everything, so:
-    # total_return = (98.0 - 2.0) + (97.0 - 2.5) - 1.0 - 1.5 = 96.0 + 94.5 - 2.5 = 188.0
-    # Actually, total_return is the net change in balance, which should be:
-    # profits from closes minus all commissions = (98.0 + 97.0) - (1.0 + 1.5 + 2.0 + 2.5) = 195.0 - 7.0 = 188.0
-
-    # But the formula used is: sum_realized = total_return + opening_commissions
-    # So: 195.0 = total_return + 2.5 → total_return = 192.5
-    # Let's use the simpler approach: total_return = sum_realized_pnl - opening_commissions = 195.0 - 2.5 = 192.5
-
-    results = BacktestResults(
+    # Access the exchange's base_timeframe through the adapter chain
+    assert runner.exchange.exchange.base_timeframe == expected_base_timeframe
+
+
+# _validate_metrics_consistency scenarios: (trades, results, expect_pnl_inconsistency).
+# Trades and results are only read by the validation, so they are built once at import.
+
+# Opening trades pay commission but have no realized P&L; closing trades realize the profit
+_OPENING_LONG = Trade(
+    order_id="order1",
+    timestamp=1744023500000,
+    symbol=_BTC,
+    position_side="long",
+    side="buy",
+    price=Decimal("50000"),
+    quantity=D_0_1,
+    commission=Decimal("1.0"),  # Opening commission
+    realized_pnl=D_0,  # Opening position has no realized P&L
+)
+_OPENING_SHORT = Trade(
+    order_id="order2",
+    timestamp=1744023501000,
+    symbol=_BTC,
+    position_side="short",
+    side="sell",
+    price=Decimal("50100"),
+    quantity=D_0_1,
+    commission=Decimal("1.5"),  # Opening commission
+    realized_pnl=D_0,  # Opening position has no realized P&L
+)
+_CLOSING_LONG = Trade(
+    order_id="order3",
+    timestamp=1744023502000,
+    symbol=_BTC,
+    position_side="long",
+    side="sell",
+    price=Decimal("51000"),
+    quantity=D_0_1,
+    commission=Decimal("2.0"),  # Closing commission
+    realized_pnl=Decimal("98.0"),  # Profit: (51000 - 50000) * 0.1 - 1.0 - 2.0 = 98.0
+)
+_CLOSING_SHORT = Trade(
+    order_id="order4",
+    timestamp=1744023503000,
+    symbol=_BTC,
+    position_side="short",
+    side="buy",
+    price=Decimal("49500"),
+    quantity=D_0_1,
+    commission=D_2_5,  # Closing commission
+    realized_pnl=Decimal("97.0"),  # Profit: (50100 - 49500) * 0.1 - 1.5 - 2.5 = 97.0
+)
+
+# The validation checks: sum realized_pnl == total_return + opening_commissions
+# sum_realized_pnl = 98.0 + 97.0 = 195.0, opening_commissions = 1.0 + 1.5 = 2.5
+# -> total_return = 195.0 - 2.5 = 192.5
+_CASE_OPENING_COMMISSIONS = (
+    [_OPENING_LONG, _OPENING_SHORT, _CLOSING_LONG, _CLOSING_SHORT],
+    BacktestResults(
         start_time=1744023500000,
         end_time=1744023504000,
         duration_seconds=4.0,
         total_candles_processed=100,
         final_balance=Decimal("2692.5"),  # 2500 + 192.5
-        total_return=Decimal("192.5"),  # sum_realized - opening_commissions = 195.0 - 2.5
+        total_return=D_192_5,  # sum_realized - opening_commissions = 195.0 - 2.5
         return_percentage=7.7,
         max_drawdown=0.0,
         total_trades=4,
@@ -226,7 +120,7 @@ def test_validate_metrics_consistency_with_opening_commissions():
         total_closed_positions=2,
         winning_positions=2,
         losing_positions=0,
-        average_trade_size=Decimal("0.1"),
+        average_trade_size=D_0_1,
         total_commission=Decimal("7.0"),  # All commissions: 1.0 + 1.5 + 2.0 + 2.5
         commission_percentage=3.6,
         total_closing_trades=2,
@@ -240,68 +134,19 @@ def test_validate_metrics_consistency_with_opening_commissions():
         full_losing_trades=0,
         total_cycles=1,
         avg_cycle_duration=1.0,
-        avg_cycle_pnl=Decimal("192.5"),
+        avg_cycle_pnl=D_192_5,
         winning_cycles=1,
         losing_cycles=0,
         cycle_win_rate=100.0,
-    )
-
-    warnings = runner._validate_metrics_consistency(results, trades)
-
-    # Should not have P&L inconsistency warning
-    pnl_warnings = [w for w in warnings if "P&L inconsistency" in w]
-    assert len(pnl_warnings) == 0, f"Unexpected P&L inconsistency warning: {pnl_warnings}"
-
-
-def test_validate_metrics_consistency_all_opening_positions():
-    """Test _validate_metrics_consistency with all opening positions (no realized P&L)"""
-    config = BacktestConfig(
-        symbol="BTCUSDT",
-        start_time=1744023500000,
-        end_time=1744023500000 + (24 * 60 * 60 * 1000),
-        initial_balance=Decimal("2500"),
-        timeframes=["1m", "15m", "1h"],
-    )
-
-    simulator = MarketDataSimulator(is_backtest=True)
-    simulator.set_times(start=config.start_time, end=config.end_time, min_candles=10)
-    simulator.symbols_timeframes[config.symbol] = config.timeframes
-
-    runner = BacktestRunner(config=config, simulator=simulator)
-
-    # All trades are opening positions
-    opening_trade1 = Trade(
-        order_id="order1",
-        timestamp=1744023500000,
-        symbol="BTCUSDT",
-        position_side="long",
-        side="buy",
-        price=Decimal("50000"),
-        quantity=Decimal("0.1"),
-        commission=Decimal("1.0"),
-        realized_pnl=Decimal("0"),
-    )
-
-    opening_trade2 = Trade(
-        order_id="order2",
-        timestamp=1744023501000,
-        symbol="BTCUSDT",
-        position_side="short",
-        side="sell",
-        price=Decimal("50100"),
-        quantity=Decimal("0.1"),
-        commission=Decimal("1.5"),
-        realized_pnl=Decimal("0"),
-    )
-
-    trades = [opening_trade1, opening_trade2]
-
-    # sum_realized_pnl = 0
-    # opening_commissions = 1.0 + 1.5 = 2.5
-    # total_return = -2.5 (only commissions paid, no profits)
-    # sum_realized = total_return + opening_commissions → 0 = -2.5 + 2.5 = 0 ✓
-
-    results = BacktestResults(
+    ),
+    False,
+)
+
+# All trades are opening positions:
+# sum_realized = total_return + opening_commissions -> 0 = -2.5 + 2.5
+_CASE_ALL_OPENING = (
+    [_OPENING_LONG, _OPENING_SHORT],
+    BacktestResults(
         start_time=1744023500000,
         end_time=1744023502000,
         duration_seconds=2.0,
@@ -316,8 +161,8 @@ def test_validate_metrics_consistency_all_opening_positions():
         total_closed_positions=0,
         winning_positions=0,
         losing_positions=0,
-        average_trade_size=Decimal("0.1"),
-        total_commission=Decimal("2.5"),
+        average_trade_size=D_0_1,
+        total_commission=D_2_5,
         commission_percentage=100.0,
         total_closing_trades=0,
         partial_closing_trades=0,
@@ -330,75 +175,25 @@ def test_validate_metrics_consistency_all_opening_positions():
         full_losing_trades=0,
         total_cycles=0,
         avg_cycle_duration=0.0,
-        avg_cycle_pnl=Decimal("0"),
+        avg_cycle_pnl=D_0,
         winning_cycles=0,
         losing_cycles=0,
         cycle_win_rate=0.0,
-    )
-
-    warnings = runner._validate_metrics_consistency(results, trades)
-
-    # Should not have P&L inconsistency warning
-    pnl_warnings = [w for w in warnings if "P&L inconsistency" in w]
-    assert len(pnl_warnings) == 0, f"Unexpected P&L inconsistency warning: {pnl_warnings}"
-
-
-def test_validate_metrics_consistency_detects_actual_inconsistency():
-    """Test _validate_metrics_consistency detects actual P&L inconsistencies"""
-    config = BacktestConfig(
-        symbol="BTCUSDT",
-        start_time=1744023500000,
-        end_time=1744023500000 + (24 * 60 * 60 * 1000),
-        initial_balance=Decimal("2500"),
-        timeframes=["1m", "15m", "1h"],
-    )
-
-    simulator = MarketDataSimulator(is_backtest=True)
-    simulator.set_times(start=config.start_time, end=config.end_time, min_candles=10)
-    simulator.symbols_timeframes[config.symbol] = config.timeframes
-
-    runner = BacktestRunner(config=config, simulator=simulator)
-
-    # Create mismatched scenario where calculation would be wrong
-    opening_trade = Trade(
-        order_id="order1",
-        timestamp=1744023500000,
-        symbol="BTCUSDT",
-        position_side="long",
-        side="buy",
-        price=Decimal("50000"),
-        quantity=Decimal("0.1"),
-        commission=Decimal("1.0"),
-        realized_pnl=Decimal("0"),
-    )
-
-    closing_trade = Trade(
-        order_id="order2",
-        timestamp=1744023501000,
-        symbol="BTCUSDT",
-        position_side="long",
-        side="sell",
-        price=Decimal("51000"),
-        quantity=Decimal("0.1"),
-        commission=Decimal("2.0"),
-        realized_pnl=Decimal("98.0"),  # Actual realized P&L
-    )
-
-    trades = [opening_trade, closing_trade]
-
-    # sum_realized_pnl = 98.0
-    # opening_commissions = 1.0
-    # If we incorrectly set total_return, it should trigger a warning
-    # Correct: total_return = 98.0 - 1.0 = 97.0
-    # Wrong: total_return = 50.0 (intentionally wrong)
-
-    results = BacktestResults(
+    ),
+    False,
+)
+
+# sum_realized_pnl = 98.0, opening_commissions = 1.0
+# Correct: total_return = 98.0 - 1.0 = 97.0; here it is intentionally wrong (50.0)
+_CASE_ACTUAL_INCONSISTENCY = (
+    [_OPENING_LONG, _CLOSING_LONG],
+    BacktestResults(
         start_time=1744023500000,
         end_time=1744023502000,
         duration_seconds=2.0,
         total_candles_processed=50,
         final_balance=Decimal("2550.0"),  # 2500 + 50.0 (wrong)
-        total_return=Decimal("50.0"),  # Intentionally wrong
+        total_return=D_50_0,  # Intentionally wrong
         return_percentage=2.0,
         max_drawdown=0.0,
         total_trades=2,
@@ -407,7 +202,7 @@ def test_validate_metrics_consistency_detects_actual_inconsistency():
         total_closed_positions=1,
         winning_positions=1,
         losing_positions=0,
-        average_trade_size=Decimal("0.1"),
+        average_trade_size=D_0_1,
         total_commission=Decimal("3.0"),
         commission_percentage=6.0,
         total_closing_trades=1,
@@ -421,14 +216,28 @@ def test_validate_metrics_consistency_detects_actual_inconsistency():
         full_losing_trades=0,
         total_cycles=1,
         avg_cycle_duration=1.0,
-        avg_cycle_pnl=Decimal("50.0"),
+        avg_cycle_pnl=D_50_0,
         winning_cycles=1,
         losing_cycles=0,
         cycle_win_rate=100.0,
-    )
+    ),
+    True,
+)
+
+
+@pytest.mark.parametrize(
+    "trades, results, expect_pnl_inconsistency",
+    [_CASE_OPENING_COMMISSIONS, _CASE_ALL_OPENING, _CASE_ACTUAL_INCONSISTENCY],
+    ids=["with_opening_commissions", "all_opening_positions", "detects_actual_inconsistency"],
+)
+def test_validate_metrics_consistency(base_config, simulator, trades, results, expect_pnl_inconsistency):
+    """Test _validate_metrics_consistency accounts for opening commissions and flags real P&L mismatches"""
+    runner = BacktestRunner(config=replace(base_config), simulator=simulator)
 
     warnings = runner._validate_metrics_consistency(results, trades)
 
-    # Should have P&L inconsistency warning
     pnl_warnings = [w for w in warnings if "P&L inconsistency" in w]
-    assert len(pnl_warnings) > 0, "Expected P&L inconsistency warning but none was found"
+    if expect_pnl_inconsistency:
+        assert pnl_warnings, "Expected P&L inconsistency warning but none was found"
+    else:
+        assert not pnl_warnings, f"Unexpected P&L inconsistency warning: {pnl_warnings}"
@@ -1,89 +1,99 @@
 """Tests for GroqClient"""
 
+import importlib
 import json
 import os
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import patch
 
 import pytest
 
-from trading.infrastructure.llm.groq_client import GroqClient, get_groq_client
+
+def _response(content):
+    """Build a plain chat completion response carrying the given content"""
+    return SimpleNamespace(
+        choices=[SimpleNamespace(message=SimpleNamespace(content=content), finish_reason="stop")],
+        model="llama-3.3-70b-versatile",
+        usage=SimpleNamespace(prompt_tokens=10, completion_tokens=20, total_tokens=30),
+    )
+
+
+# Default response, built once; tests that need other content install their own via _response()
+_CANNED_RESPONSE = _response("Test response")
+
+
+@pytest.fixture(scope="module")
+def groq_module():
+    """The groq_client module, imported on first use so collection doesn't load the Groq SDK"""
+    return importlib.import_module("trading.infrastructure.llm.groq_client")
+
+
+@pytest.fixture(autouse=True, scope="module")
+def _groq_patched(groq_module):
+    """Set GROQ_API_KEY and patch the Groq class once for the whole module"""
+    with patch.dict(os.environ, {"GROQ_API_KEY": "test_api_key"}), patch.object(groq_module, "Groq") as groq_class:
+        yield groq_class
 
 
 @pytest.fixture
-def mock_groq_api_key():
-    """Mock GROQ_API_KEY environment variable"""
-    with patch.dict(os.environ, {"GROQ_API_KEY": "test_api_key"}):
-        yield "test_api_key"
+def mock_groq_class(_groq_patched):
+    """The patched Groq class, with calls and return value cleared for this test"""
+    _groq_patched.reset_mock(return_value=True, side_effect=True)
+    return _groq_patched
 
 
 @pytest.fixture
-def mock_groq_client(mock_groq_api_key):
-    """Create a GroqClient with mocked Groq API"""
-    with patch("trading.infrastructure.llm.groq_client.Groq") as mock_groq_class:
-        mock_client = MagicMock()
-        mock_groq_class.return_value = mock_client
+def reset_groq_singleton(groq_module):
+    """Clear the get_groq_client singleton before and after the test"""
+    groq_module._groq_client = None
+    yield
+    groq_module._groq_client = None
 
-        # Mock chat completion response
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[0].message.content = "Test response"
-        mock_response.choices[0].finish_reason = "stop"
-        mock_response.model = "llama-3.3-70b-versatile"
-        mock_response.usage = MagicMock()
-        mock_response.usage.prompt_tokens = 10
-        mock_response.usage.completion_tokens = 20
-        mock_response.usage.total_tokens = 30
 
-        mock_client.chat.completions.create.return_value = mock_response
+@pytest.fixture
+def mock_groq_api_key():
+    """GROQ_API_KEY value set by the module-level environment patch"""
+    return "test_api_key"
 
-        client = GroqClient()
-        client.client = mock_client
-        yield client
 
+@pytest.fixture
+def mock_groq_client(mock_groq_class, groq_module):
+    """Create a GroqClient with mocked Groq API"""
+    mock_groq_class.return_value.chat.completions.create.return_value = _CANNED_RESPONSE
+    return groq_module.GroqClient()
 
-def test_initialization_with_api_key(mock_groq_api_key):
-    """Test GroqClient initialization with API key from env"""
-    with patch("trading.infrastructure.llm.groq_client.Groq") as mock_groq_class:
-        mock_client = MagicMock()
-        mock_groq_class.return_value = mock_client
 
-        client = GroqClient()
+def test_initialization_with_api_key(mock_groq_class, mock_groq_api_key, groq_module):
+    """Test GroqClient initialization with API key from env"""
+    client = groq_module.GroqClient()
 
-        assert client.api_key == "test_api_key"
-        assert client.model == "llama-3.3-70b-versatile"  # Default
-        mock_groq_class.assert_called_once_with(api_key="test_api_key")
+    assert client.api_key == mock_groq_api_key
+    assert client.model == "llama-3.3-70b-versatile"  # Default
+    mock_groq_class.assert_called_once_with(api_key=mock_groq_api_key)
 
 
-def test_initialization_with_custom_api_key():
+def test_initialization_with_custom_api_key(mock_groq_class, groq_module):
     """Test GroqClient initialization with custom API key"""
-    with patch("trading.infrastructure.llm.groq_client.Groq") as mock_groq_class:
-        mock_client = MagicMock()
-        mock_groq_class.return_value = mock_client
-
-        client = GroqClient(api_key="custom_key", model="custom-model")
+    client = groq_module.GroqClient(api_key="custom_key", model="custom-model")
 
-        assert client.api_key == "custom_key"
-        assert client.model == "custom-model"
-        mock_groq_class.assert_called_once_with(api_key="custom_key")
+    assert client.api_key == "custom_key"
+    assert client.model == "custom-model"
+    mock_groq_class.assert_called_once_with(api_key="custom_key")
 
 
-def test_initialization_without_api_key():
+def test_initialization_without_api_key(groq_module):
     """Test GroqClient initialization fails without API key"""
     with patch.dict(os.environ, {}, clear=True):
         with pytest.raises(ValueError, match="GROQ_API_KEY not found"):
-            GroqClient()
+            groq_module.GroqClient()
 
 
-def test_initialization_with_model_env_var(mock_groq_api_key):
+def test_initialization_with_model_env_var(groq_module):
     """Test GroqClient uses GROQ_MODEL env var if provided"""
     with patch.dict(os.environ, {"GROQ_MODEL": "custom-model"}):
-        with patch("trading.infrastructure.llm.groq_client.Groq") as mock_groq_class:
-            mock_client = MagicMock()
-            mock_groq_class.return_value = mock_client
+        client = groq_module.GroqClient()
 
-            client = GroqClient()
-
-            assert client.model == "custom-model"
+    assert client.model == "custom-model"
 
 
 def test_chat(mock_groq_client):
@@ -137,51 +147,37 @@ def test_chat_error_handling(mock_groq_client):
         mock_groq_client.chat([{"role": "user", "content": "Hello"}])
 
 
-def test_chat_json(mock_groq_client):
-    """Test chat_json() returns parsed JSON"""
-    # Mock JSON response
-    json_response = {"key": "value", "number": 123}
-    mock_groq_client.client.chat.completions.create.return_value.choices[0].message.content = json.dumps(json_response)
+_JSON_PAYLOAD = {"key": "value", "number": 123}
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        json.dumps(_JSON_PAYLOAD),
+        f"```json\n{json.dumps(_JSON_PAYLOAD)}\n```",
+        f"```\n{json.dumps(_JSON_PAYLOAD)}\n```",
+    ],
+    ids=["raw", "markdown_json_block", "markdown_block_no_tag"],
+)
+def test_chat_json(mock_groq_client, content):
+    """Test chat_json() parses raw and code-block-wrapped JSON with the JSON instruction and lower temperature"""
+    mock_groq_client.client.chat.completions.create.return_value = _response(content)
 
-    messages = [{"role": "user", "content": "Return JSON"}]
-    response = mock_groq_client.chat_json(messages)
+    response = mock_groq_client.chat_json([{"role": "user", "content": "Return JSON"}])
 
-    assert response == json_response
+    assert response == _JSON_PAYLOAD
 
     # Verify JSON instruction was added
     call_kwargs = mock_groq_client.client.chat.completions.create.call_args[1]
     assert len(call_kwargs["messages"]) == 2
     assert call_kwargs["messages"][-1]["role"] == "system"
     assert "JSON" in call_kwargs["messages"][-1]["content"]
-
-
-def test_chat_json_with_markdown_code_block(mock_groq_client):
-    """Test chat_json() handles markdown code blocks"""
-    json_content = {"key": "value"}
-    # Simulate response wrapped in markdown
-    mock_groq_client.client.chat.completions.create.return_value.choices[0].message.content = f"```json\n{json.dumps(json_content)}\n```"
-
-    messages = [{"role": "user", "content": "Return JSON"}]
-    response = mock_groq_client.chat_json(messages)
-
-    assert response == json_content
-
-
-def test_chat_json_with_code_block_no_json(mock_groq_client):
-    """Test chat_json() handles code blocks without json tag"""
-    json_content = {"key": "value"}
-    # Simulate response wrapped in code block without json tag
-    mock_groq_client.client.chat.completions.create.return_value.choices[0].message.content = f"```\n{json.dumps(json_content)}\n```"
-
-    messages = [{"role": "user", "content": "Return JSON"}]
-    response = mock_groq_client.chat_json(messages)
-
-    assert response == json_content
+    assert call_kwargs["temperature"] == 0.3  # Lower for JSON
 
 
 def test_chat_json_empty_response(mock_groq_client):
     """Test chat_json() raises error on empty response"""
-    mock_groq_client.client.chat.completions.create.return_value.choices[0].message.content = None
+    mock_groq_client.client.chat.completions.create.return_value = _response(None)
 
     with pytest.raises(ValueError, match="Empty response from Groq API"):
         mock_groq_client.chat_json([{"role": "user", "content": "Hello"}])
@@ -189,77 +185,39 @@ def test_chat_json_empty_response(mock_groq_client):
 
 def test_chat_json_invalid_json(mock_groq_client):
     """Test chat_json() raises error on invalid JSON"""
-    mock_groq_client.client.chat.completions.create.return_value.choices[0].message.content = "Not valid JSON"
+    mock_groq_client.client.chat.completions.create.return_value = _response("Not valid JSON")
 
     with pytest.raises(ValueError, match="Invalid JSON response"):
         mock_groq_client.chat_json([{"role": "user", "content": "Hello"}])
 
 
-def test_chat_json_lower_temperature(mock_groq_client):
-    """Test chat_json() uses lower temperature by default"""
-    # Mock JSON response
-    json_response = {"key": "value"}
-    mock_groq_client.client.chat.completions.create.return_value.choices[0].message.content = json.dumps(json_response)
-
-    messages = [{"role": "user", "content": "Return JSON"}]
-
-    mock_groq_client.chat_json(messages)
-
-    call_kwargs = mock_groq_client.client.chat.completions.create.call_args[1]
-    assert call_kwargs["temperature"] == 0.3  # Lower for JSON
-
-
-def test_get_groq_client_singleton(mock_groq_api_key):
+def test_get_groq_client_singleton(mock_groq_class, reset_groq_singleton, groq_module):
     """Test get_groq_client returns singleton instance"""
-    with patch("trading.infrastructure.llm.groq_client.Groq") as mock_groq_class:
-        mock_client = MagicMock()
-        mock_groq_class.return_value = mock_client
-
-        # Reset singleton
-        import trading.infrastructure.llm.groq_client as groq_module
-        groq_module._groq_client = None
+    client1 = groq_module.get_groq_client()
+    client2 = groq_module.get_groq_client()
 
-        client1 = get_groq_client()
-        client2 = get_groq_client()
+    # Should be the same instance
+    assert client1 is client2
 
-        # Should be the same instance
-        assert client1 is client2
+    # Should only create Groq client once
+    assert mock_groq_class.call_count == 1
 
-        # Should only create Groq client once
-        assert mock_groq_class.call_count == 1
 
-
-def test_get_groq_client_with_params_first_call(mock_groq_api_key):
+def test_get_groq_client_with_params_first_call(mock_groq_class, reset_groq_singleton, groq_module):
     """Test get_groq_client uses params on first call"""
-    with patch("trading.infrastructure.llm.groq_client.Groq") as mock_groq_class:
-        mock_client = MagicMock()
-        mock_groq_class.return_value = mock_client
-
-        # Reset singleton
-        import trading.infrastructure.llm.groq_client as groq_module
-        groq_module._groq_client = None
-
-        client = get_groq_client(api_key="custom_key", model="custom-model")
+    client = groq_module.get_groq_client(api_key="custom_key", model="custom-model")
 
-        assert client.api_key == "custom_key"
-        assert client.model == "custom-model"
+    assert client.api_key == "custom_key"
+    assert client.model == "custom-model"
 
 
-def test_get_groq_client_ignores_params_after_first_call(mock_groq_api_key):
+def test_get_groq_client_ignores_params_after_first_call(mock_groq_class, reset_groq_singleton, groq_module):
     """Test get_groq_client ignores params after first call"""
-    with patch("trading.infrastructure.llm.groq_client.Groq") as mock_groq_class:
-        mock_client = MagicMock()
-        mock_groq_class.return_value = mock_client
-
-        # Reset singleton
-        import trading.infrastructure.llm.groq_client as groq_module
-        groq_module._groq_client = None
-
-        client1 = get_groq_client(api_key="first_key", model="first-model")
-        client2 = get_groq_client(api_key="second_key", model="second-model")
+    client1 = groq_module.get_groq_client(api_key="first_key", model="first-model")
+    client2 = groq_module.get_groq_client(api_key="second_key", model="second-model")
 
-        # Should still use first params
-        assert client1 is client2
-        assert client1.api_key == "first_key"
-        assert client1.model == "first-model"
+    # Should still use first params
+    assert client1 is client2
+    assert client1.api_key == "first_key"
+    assert client1.model == "first-model"
 
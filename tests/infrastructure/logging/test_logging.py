@@ -1,8 +1,20 @@
 """Tests for logging infrastructure"""
+import copy
 import logging
 
 from trading.infrastructure.logging import LoggingContext, get_logger, get_run_logger, logging_context
 
+# Plain INFO record built once; formatting sets attributes on it, so tests format a copy
+_RECORD_TEMPLATE = logging.LogRecord(
+    name="test",
+    level=logging.INFO,
+    pathname="",
+    lineno=0,
+    msg="Test message",
+    args=(),
+    exc_info=None,
+)
+
 
 def test_get_logger():
     """Test basic logger creation"""
@@ -60,16 +72,7 @@ def test_logger_with_context():
     """Test logger includes ADK context in formatted messages"""
     with logging_context(run_id="test_run", agent="test_agent"):
         logger = get_logger("test_context_logger")
-        # Create a log record
-        record = logging.LogRecord(
-            name="test",
-            level=logging.INFO,
-            pathname="",
-            lineno=0,
-            msg="Test message",
-            args=(),
-            exc_info=None,
-        )
+        record = copy.copy(_RECORD_TEMPLATE)
 
         # Format should include context
         formatter = logger.handlers[0].formatter
@@ -1,7 +1,5 @@
 """Tests for CandlesRepository"""
 
-import os
-import tempfile
 from decimal import Decimal
 
 import pytest
@@ -9,71 +7,114 @@ import pytest
 from trading.domain.entities import Candle
 from trading.infrastructure.simulator.adapters.candles_repository import CandlesRepository
 
+T0 = 1744023500000
+M = 60_000  # One minute in ms
+
+D_100 = Decimal("100")
+D_150 = Decimal("150")
+D_200 = Decimal("200")
+D_49000 = Decimal("49000")
+D_50000 = Decimal("50000")
+D_50500 = Decimal("50500")
+D_51000 = Decimal("51000")
+D_51500 = Decimal("51500")
+D_59000 = Decimal("59000")
+D_60000 = Decimal("60000")
+D_60500 = Decimal("60500")
+D_61000 = Decimal("61000")
+
+
+def _make_candle(timestamp, open_price=D_50000, high=D_51000, low=D_49000, close=D_50500, volume=D_100):
+    """Build a BTCUSDT 1m candle, defaulting to the common test prices"""
+    return Candle(
+        symbol="BTCUSDT",
+        timeframe="1m",
+        timestamp=timestamp,
+        open_price=open_price,
+        high_price=high,
+        low_price=low,
+        close_price=close,
+        volume=volume,
+    )
+
 
 @pytest.fixture
-def temp_db():
-    """Create a temporary database file"""
-    fd, path = tempfile.mkstemp(suffix=".db")
-    os.close(fd)
-    yield path
-    # Cleanup
-    if os.path.exists(path):
-        os.remove(path)
+def temp_db(tmp_path_factory):
+    """Path to a database file (only for tests that check on-disk behaviour); pytest cleans it up"""
+    return tmp_path_factory.mktemp("candles") / "candles.db"
 
 
-@pytest.fixture
-def candles_repo_backtest(temp_db):
-    """Create a CandlesRepository instance in backtest mode"""
-    repo = CandlesRepository(is_backtest=True, db_path=temp_db)
+@pytest.fixture(scope="module")
+def candles_repo_backtest():
+    """In-memory CandlesRepository in backtest mode, shared by the module"""
+    repo = CandlesRepository(is_backtest=True, db_path=":memory:")
     yield repo
     repo.close()
 
 
+@pytest.fixture(autouse=True)
+def _drop_kline_tables(candles_repo_backtest):
+    """Drop every kline table after each test so the shared repository starts empty"""
+    yield
+    cursor = candles_repo_backtest.cursor
+    cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name LIKE '%_kline'")
+    for (table_name,) in cursor.fetchall():
+        cursor.execute(f"DROP TABLE {table_name}")
+    candles_repo_backtest.conn.commit()
+
+
 @pytest.fixture
 def candles_repo_production(temp_db):
     """Create a CandlesRepository instance in production mode"""
-    repo = CandlesRepository(is_backtest=False, db_path=temp_db)
+    repo = CandlesRepository(is_backtest=False, db_path=str(temp_db))
     yield repo
     repo.close()
 
 
-@pytest.fixture
+# Five consecutive 1m candles, inserted out of order; the second one closes higher so lookups can tell them apart
+_POPULATED_CANDLES = tuple(_make_candle(T0 + i * M, close=D_51000 if i == 1 else D_50500) for i in [3, 1, 4, 0, 2])
+
+
+@pytest.fixture(scope="module")
+def populated_repo():
+    """In-memory CandlesRepository pre-loaded once with _POPULATED_CANDLES, for read-only tests"""
+    repo = CandlesRepository(is_backtest=True, db_path=":memory:")
+    repo.add_candles(_POPULATED_CANDLES)
+    yield repo
+    repo.close()
+
+
+@pytest.fixture(scope="session")
 def sample_candles():
-    """Create sample candles"""
-    return [
-        Candle(
-            symbol="BTCUSDT",
-            timeframe="1m",
-            timestamp=1744023500000,
-            open_price=Decimal("50000"),
-            high_price=Decimal("51000"),
-            low_price=Decimal("49000"),
-            close_price=Decimal("50500"),
-            volume=Decimal("100"),
-        ),
-        Candle(
-            symbol="BTCUSDT",
-            timeframe="1m",
-            timestamp=1744023500000 + 60000,  # +1 minute
-            open_price=Decimal("50500"),
-            high_price=Decimal("51500"),
-            low_price=Decimal("50000"),
-            close_price=Decimal("51000"),
-            volume=Decimal("150"),
-        ),
-    ]
+    """Create sample candles (read-only tuple, shared by the session)"""
+    return (
+        _make_candle(T0),
+        _make_candle(T0 + M, open_price=D_50500, high=D_51500, low=D_50000, close=D_51000, volume=D_150),
+    )
 
 
-def test_initialization_backtest(candles_repo_backtest, temp_db):
+def test_initialization_backtest(temp_db):
     """Test repository initialization in backtest mode"""
-    assert candles_repo_backtest.is_backtest is True
-    assert os.path.exists(temp_db)
+    repo = CandlesRepository(is_backtest=True, db_path=str(temp_db))
+    try:
+        assert repo.is_backtest is True
+        assert temp_db.is_file()
+    finally:
+        repo.close()
 
 
 def test_initialization_production(candles_repo_production, temp_db):
     """Test repository initialization in production mode"""
     assert candles_repo_production.is_backtest is False
-    assert os.path.exists(temp_db)
+    assert temp_db.is_file()
+
+
+def test_backtest_mode_pragmas(candles_repo_backtest):
+    """Test the shared backtest repository runs without fsync or an on-disk journal"""
+    cursor = candles_repo_backtest.cursor
+    assert cursor.execute("PRAGMA synchronous").fetchone()[0] == 0  # OFF
+    assert cursor.execute("PRAGMA journal_mode").fetchone()[0] == "memory"
+    assert cursor.execute("PRAGMA temp_store").fetchone()[0] == 2  # MEMORY
 
 
 def test_add_candles_creates_table(candles_repo_backtest, sample_candles):
@@ -113,16 +154,8 @@ def test_add_candles_replace_existing(candles_repo_backtest, sample_candles):
 
     # Modify and add again (same timestamp)
     modified_candles = [
-        Candle(
-            symbol="BTCUSDT",
-            timeframe="1m",
-            timestamp=1744023500000,  # Same timestamp
-            open_price=Decimal("60000"),  # Different price
-            high_price=Decimal("61000"),
-            low_price=Decimal("59000"),
-            close_price=Decimal("60500"),
-            volume=Decimal("200"),
-        )
+        # Same timestamp, different prices
+        _make_candle(T0, open_price=D_60000, high=D_61000, low=D_59000, close=D_60500, volume=D_200)
     ]
 
     candles_repo_backtest.add_candles(modified_candles)
@@ -136,106 +169,71 @@ def test_add_candles_replace_existing(candles_repo_backtest, sample_candles):
     assert float(close_price) == 60500.0
 
 
-def test_get_next_candle(candles_repo_backtest, sample_candles):
+def test_get_next_candle(populated_repo):
     """Test get_next_candle retrieves next candle after timestamp"""
-    candles_repo_backtest.add_candles(sample_candles)
-
     # Get next candle after first timestamp
-    next_candle = candles_repo_backtest.get_next_candle("BTCUSDT", 1744023500000, "1m")
+    next_candle = populated_repo.get_next_candle("BTCUSDT", T0, "1m")
 
     assert next_candle is not None
-    assert next_candle.timestamp == 1744023500000 + 60000
-    assert next_candle.close_price == Decimal("51000")
+    assert next_candle.timestamp == T0 + M
+    assert next_candle.close_price == D_51000
 
 
-def test_get_next_candle_nonexistent(candles_repo_backtest):
+def test_get_next_candle_nonexistent(populated_repo):
     """Test get_next_candle returns None when no next candle exists"""
-    next_candle = candles_repo_backtest.get_next_candle("BTCUSDT", 9999999999999, "1m")
+    next_candle = populated_repo.get_next_candle("BTCUSDT", 9999999999999, "1m")
 
     assert next_candle is None
 
 
-def test_get_next_candle_nonexistent_table(candles_repo_backtest):
+def test_get_next_candle_nonexistent_table(populated_repo):
     """Test get_next_candle returns None when table doesn't exist"""
-    next_candle = candles_repo_backtest.get_next_candle("NONEXISTENT", 1000, "1m")
+    next_candle = populated_repo.get_next_candle("NONEXISTENT", 1000, "1m")
 
     assert next_candle is None
 
 
-def test_get_candles(candles_repo_backtest, sample_candles):
+def test_get_candles(populated_repo):
     """Test get_candles retrieves candles from start_time"""
-    candles_repo_backtest.add_candles(sample_candles)
-
     # Get candles from start_time
-    candles = candles_repo_backtest.get_candles("BTCUSDT", "1m", 10, start_time=1744023500000)
+    candles = populated_repo.get_candles("BTCUSDT", "1m", 10, start_time=T0 + 3 * M)
 
     assert len(candles) == 2
-    assert candles[0].timestamp == 1744023500000
-    assert candles[1].timestamp == 1744023500000 + 60000
+    assert candles[0].timestamp == T0 + 3 * M
+    assert candles[1].timestamp == T0 + 4 * M
 
 
-def test_get_candles_with_limit(candles_repo_backtest, sample_candles):
+def test_get_candles_with_limit(populated_repo):
     """Test get_candles respects limit"""
-    # Add more candles
-    extra_candles = [
-        Candle(
-            symbol="BTCUSDT",
-            timeframe="1m",
-            timestamp=1744023500000 + (i * 60000),
-            open_price=Decimal("50000"),
-            high_price=Decimal("51000"),
-            low_price=Decimal("49000"),
-            close_price=Decimal("50500"),
-            volume=Decimal("100"),
-        )
-        for i in range(5)
-    ]
-    candles_repo_backtest.add_candles(extra_candles)
-
-    # Get with limit
-    candles = candles_repo_backtest.get_candles("BTCUSDT", "1m", 3, start_time=1744023500000)
+    candles = populated_repo.get_candles("BTCUSDT", "1m", 3, start_time=T0)
 
     assert len(candles) == 3
 
 
-def test_get_candles_empty_table(candles_repo_backtest):
+def test_get_candles_empty_table(populated_repo):
     """Test get_candles returns empty list when table doesn't exist"""
-    candles = candles_repo_backtest.get_candles("NONEXISTENT", "1m", 10, start_time=1000)
+    candles = populated_repo.get_candles("NONEXISTENT", "1m", 10, start_time=1000)
 
     assert candles == []
 
 
-def test_get_candles_ordered_by_timestamp(candles_repo_backtest):
+def test_get_candles_ordered_by_timestamp(populated_repo):
     """Test get_candles returns candles ordered by timestamp ASC"""
-    # Add candles in random order
-    candles = [
-        Candle(
-            symbol="BTCUSDT",
-            timeframe="1m",
-            timestamp=1744023500000 + (i * 60000),
-            open_price=Decimal("50000"),
-            high_price=Decimal("51000"),
-            low_price=Decimal("49000"),
-            close_price=Decimal("50500"),
-            volume=Decimal("100"),
-        )
-        for i in [3, 1, 4, 0, 2]  # Random order
-    ]
-    candles_repo_backtest.add_candles(candles)
-
-    # Retrieve and verify order
-    retrieved = candles_repo_backtest.get_candles("BTCUSDT", "1m", 10, start_time=1744023500000)
+    # _POPULATED_CANDLES were inserted out of order
+    retrieved = populated_repo.get_candles("BTCUSDT", "1m", 10, start_time=T0)
 
     assert len(retrieved) == 5
     for i in range(4):
         assert retrieved[i].timestamp < retrieved[i + 1].timestamp
 
 
-def test_close(candles_repo_backtest):
+def test_close():
     """Test close() closes database connection"""
-    candles_repo_backtest.close()
+    # Own repository: closing the shared one would break the rest of the module
+    repo = CandlesRepository(is_backtest=True, db_path=":memory:")
+    repo.close()
 
     # Verify connection is closed
     with pytest.raises(Exception):  # Should raise when trying to use closed connection
-        candles_repo_backtest.cursor.execute("SELECT 1")
+        repo.cursor.execute("SELECT 1")
 
@@ -1,13 +1,53 @@
 """Tests for EventDispatcher (simulator)"""
 
+import io
 from decimal import Decimal
-from unittest.mock import MagicMock
+from unittest.mock import Mock
 
 import pytest
 
 from trading.domain.entities import Candle
 from trading.infrastructure.simulator.adapters.event_dispatcher import EventDispatcher
 
+D_100 = Decimal("100")
+D_49000 = Decimal("49000")
+D_50000 = Decimal("50000")
+D_50500 = Decimal("50500")
+D_51000 = Decimal("51000")
+
+
+def _make_candle(symbol="BTCUSDT", timeframe="1m", timestamp=1744023500000):
+    """Build a candle with the common test prices (these tests only route on symbol/timeframe)"""
+    return Candle(
+        symbol=symbol,
+        timeframe=timeframe,
+        timestamp=timestamp,
+        open_price=D_50000,
+        high_price=D_51000,
+        low_price=D_49000,
+        close_price=D_50500,
+        volume=D_100,
+    )
+
+
+def _make_listener():
+    """Return a fresh no-op candle listener (for tests that only check registration)"""
+
+    def listener(candle):
+        pass
+
+    return listener
+
+
+def _spy():
+    """Return a candle listener and the list it records each received candle into"""
+    calls = []
+
+    def listener(candle):
+        calls.append(candle)
+
+    return calls, listener
+
 
 @pytest.fixture
 def event_dispatcher():
@@ -15,19 +55,10 @@ def event_dispatcher():
     return EventDispatcher()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_candle():
-    """Create a sample Candle"""
-    return Candle(
-        symbol="BTCUSDT",
-        timeframe="1m",
-        timestamp=1744023500000,
-        open_price=Decimal("50000"),
-        high_price=Decimal("51000"),
-        low_price=Decimal("49000"),
-        close_price=Decimal("50500"),
-        volume=Decimal("100"),
-    )
+    """Create a sample Candle (read-only, shared by the module)"""
+    return _make_candle()
 
 
 def test_initialization(event_dispatcher):
@@ -38,7 +69,7 @@ def test_initialization(event_dispatcher):
 
 def test_add_complete_candle_listener(event_dispatcher):
     """Test add_complete_candle_listener registers listener"""
-    listener = MagicMock()
+    listener = _make_listener()
 
     event_dispatcher.add_complete_candle_listener("BTCUSDT", "1m", listener)
 
@@ -49,8 +80,8 @@ def test_add_complete_candle_listener(event_dispatcher):
 
 def test_add_complete_candle_listener_multiple_listeners(event_dispatcher):
     """Test add_complete_candle_listener with multiple listeners"""
-    listener1 = MagicMock()
-    listener2 = MagicMock()
+    listener1 = _make_listener()
+    listener2 = _make_listener()
 
     event_dispatcher.add_complete_candle_listener("BTCUSDT", "1m", listener1)
     event_dispatcher.add_complete_candle_listener("BTCUSDT", "1m", listener2)
@@ -60,7 +91,7 @@ def test_add_complete_candle_listener_multiple_listeners(event_dispatcher):
 
 def test_add_complete_candle_listener_multiple_timeframes(event_dispatcher):
     """Test add_complete_candle_listener with multiple timeframes"""
-    listener = MagicMock()
+    listener = _make_listener()
 
     event_dispatcher.add_complete_candle_listener("BTCUSDT", "1m", listener)
     event_dispatcher.add_complete_candle_listener("BTCUSDT", "15m", listener)
@@ -71,7 +102,7 @@ def test_add_complete_candle_listener_multiple_timeframes(event_dispatcher):
 
 def test_add_complete_candle_listener_multiple_symbols(event_dispatcher):
     """Test add_complete_candle_listener with multiple symbols"""
-    listener = MagicMock()
+    listener = _make_listener()
 
     event_dispatcher.add_complete_candle_listener("BTCUSDT", "1m", listener)
     event_dispatcher.add_complete_candle_listener("ETHUSDT", "1m", listener)
@@ -82,7 +113,7 @@ def test_add_complete_candle_listener_multiple_symbols(event_dispatcher):
 
 def test_remove_complete_candle_listener(event_dispatcher):
     """Test remove_complete_candle_listener removes listener"""
-    listener = MagicMock()
+    listener = _make_listener()
 
     event_dispatcher.add_complete_candle_listener("BTCUSDT", "1m", listener)
     assert listener in event_dispatcher.complete_candle_listeners["btcusdt"]["1m"]
@@ -93,7 +124,7 @@ def test_remove_complete_candle_listener(event_dispatcher):
 
 def test_remove_complete_candle_listener_nonexistent(event_dispatcher):
     """Test remove_complete_candle_listener handles nonexistent listener gracefully"""
-    listener = MagicMock()
+    listener = _make_listener()
 
     # Try to remove without adding
     event_dispatcher.remove_complete_candle_listener("BTCUSDT", "1m", listener)
@@ -106,16 +137,16 @@ def test_remove_complete_candle_listener_nonexistent(event_dispatcher):
 
 def test_dispatch_complete_candle(event_dispatcher, sample_candle):
     """Test dispatch_complete_candle calls all listeners"""
-    listener1 = MagicMock()
-    listener2 = MagicMock()
+    calls1, listener1 = _spy()
+    calls2, listener2 = _spy()
 
     event_dispatcher.add_complete_candle_listener("BTCUSDT", "1m", listener1)
     event_dispatcher.add_complete_candle_listener("BTCUSDT", "1m", listener2)
 
     event_dispatcher.dispatch_complete_candle(sample_candle)
 
-    listener1.assert_called_once_with(sample_candle)
-    listener2.assert_called_once_with(sample_candle)
+    assert calls1 == [sample_candle]
+    assert calls2 == [sample_candle]
 
 
 def test_dispatch_complete_candle_no_listeners(event_dispatcher, sample_candle):
@@ -126,8 +157,8 @@ def test_dispatch_complete_candle_no_listeners(event_dispatcher, sample_candle):
 
 def test_dispatch_complete_candle_different_timeframe(event_dispatcher, sample_candle):
     """Test dispatch_complete_candle only calls listeners for matching timeframe"""
-    listener1 = MagicMock()
-    listener2 = MagicMock()
+    calls1, listener1 = _spy()
+    calls2, listener2 = _spy()
 
     event_dispatcher.add_complete_candle_listener("BTCUSDT", "1m", listener1)
     event_dispatcher.add_complete_candle_listener("BTCUSDT", "15m", listener2)
@@ -135,14 +166,14 @@ def test_dispatch_complete_candle_different_timeframe(event_dispatcher, sample_c
     # Dispatch for 1m
     event_dispatcher.dispatch_complete_candle(sample_candle)
 
-    listener1.assert_called_once_with(sample_candle)
-    listener2.assert_not_called()
+    assert calls1 == [sample_candle]
+    assert calls2 == []
 
 
 def test_dispatch_complete_candle_different_symbol(event_dispatcher, sample_candle):
     """Test dispatch_complete_candle only calls listeners for matching symbol"""
-    listener1 = MagicMock()
-    listener2 = MagicMock()
+    calls1, listener1 = _spy()
+    calls2, listener2 = _spy()
 
     event_dispatcher.add_complete_candle_listener("BTCUSDT", "1m", listener1)
     event_dispatcher.add_complete_candle_listener("ETHUSDT", "1m", listener2)
@@ -150,11 +181,11 @@ def test_dispatch_complete_candle_different_symbol(event_dispatcher, sample_cand
     # Dispatch for BTCUSDT
     event_dispatcher.dispatch_complete_candle(sample_candle)
 
-    listener1.assert_called_once_with(sample_candle)
-    listener2.assert_not_called()
+    assert calls1 == [sample_candle]
+    assert calls2 == []
 
 
-def test_dispatch_complete_candle_listener_error(event_dispatcher, sample_candle, capsys):
+def test_dispatch_complete_candle_listener_error(event_dispatcher, sample_candle, monkeypatch):
     """Test dispatch_complete_candle handles listener errors gracefully"""
     def failing_listener(candle):
         raise Exception("Listener error")
@@ -162,12 +193,16 @@ def test_dispatch_complete_candle_listener_error(event_dispatcher, sample_candle
     def working_listener(candle):
         pass
 
-    listener1 = MagicMock(side_effect=failing_listener)
-    listener2 = MagicMock(side_effect=working_listener)
+    listener1 = Mock(spec=failing_listener, side_effect=failing_listener)
+    listener2 = Mock(spec=working_listener, side_effect=working_listener)
 
     event_dispatcher.add_complete_candle_listener("BTCUSDT", "1m", listener1)
     event_dispatcher.add_complete_candle_listener("BTCUSDT", "1m", listener2)
 
+    # The dispatcher print()s the error; a plain buffer on sys.stdout is enough to read it back
+    stdout = io.StringIO()
+    monkeypatch.setattr("sys.stdout", stdout)
+
     # Should not raise, but continue with other listeners
     event_dispatcher.dispatch_complete_candle(sample_candle)
 
@@ -176,28 +211,18 @@ def test_dispatch_complete_candle_listener_error(event_dispatcher, sample_candle
     assert listener2.called
 
     # Verify error was printed
-    captured = capsys.readouterr()
-    assert "Error in candle listener" in captured.out
+    assert "Error in candle listener" in stdout.getvalue()
 
 
 def test_dispatch_complete_candle_case_insensitive(event_dispatcher):
     """Test dispatch_complete_candle is case insensitive"""
-    listener = MagicMock()
+    calls, listener = _spy()
     event_dispatcher.add_complete_candle_listener("BTCUSDT", "1m", listener)
 
     # Candle with lowercase symbol
-    candle = Candle(
-        symbol="btcusdt",  # Lowercase
-        timeframe="1m",
-        timestamp=1744023500000,
-        open_price=Decimal("50000"),
-        high_price=Decimal("51000"),
-        low_price=Decimal("49000"),
-        close_price=Decimal("50500"),
-        volume=Decimal("100"),
-    )
+    candle = _make_candle(symbol="btcusdt")
 
     event_dispatcher.dispatch_complete_candle(candle)
 
-    listener.assert_called_once_with(candle)
+    assert calls == [candle]
 
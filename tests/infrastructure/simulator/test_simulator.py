@@ -1,24 +1,43 @@
 """Tests for market data simulator"""
 
+import pytest
+
 from trading.infrastructure.simulator import MarketDataSimulator
 from trading.infrastructure.simulator.domain import ONE_MINUTE, TIMEFRAME_MINUTES
 from trading.infrastructure.simulator.simulator import get_base_timeframe
 
 
-def test_simulator_initialization():
-    """Test MarketDataSimulator initialization"""
-    simulator = MarketDataSimulator(is_backtest=True)
+@pytest.fixture(scope="module")
+def _shared_simulator():
+    """Backtest MarketDataSimulator, built once per module"""
+    sim = MarketDataSimulator(is_backtest=True)
+    yield sim
+    sim.close()
+
+
+@pytest.fixture
+def simulator(_shared_simulator):
+    """The shared simulator, with its per-run state cleared back to construction defaults"""
+    sim = _shared_simulator
+    sim.symbols_timeframes.clear()
+    sim.cumulative_candles.clear()
+    sim.endeds.clear()
+    sim.last_candle.clear()
+    sim.event_dispatcher.complete_candle_listeners.clear()
+    sim.start_time = sim.end_time = sim.min_candles = sim.current_time = 0
+    return sim
 
+
+def test_simulator_initialization(simulator):
+    """Test MarketDataSimulator initialization"""
     assert simulator.symbols_timeframes == {}
     assert simulator.start_time == 0
     assert simulator.end_time == 0
     assert simulator.current_time == 0
 
 
-def test_simulator_set_times():
+def test_simulator_set_times(simulator):
     """Test setting simulation times"""
-    simulator = MarketDataSimulator(is_backtest=True)
-
     start_time = 1744023500000
     end_time = start_time + (24 * 60 * 60 * 1000)  # 24 hours later
 
@@ -30,10 +49,8 @@ def test_simulator_set_times():
     assert simulator.min_candles == 10
 
 
-def test_simulator_ended():
+def test_simulator_ended(simulator):
     """Test symbol ended status"""
-    simulator = MarketDataSimulator(is_backtest=True)
-
     assert simulator.ended("BTCUSDT") is False
 
     simulator.end("BTCUSDT")
@@ -48,10 +65,8 @@ def test_timeframe_constants():
     assert ONE_MINUTE == 60000
 
 
-def test_simulator_event_dispatcher():
+def test_simulator_event_dispatcher(simulator):
     """Test simulator event dispatcher"""
-    simulator = MarketDataSimulator(is_backtest=True)
-
     received_candles = []
 
     def listener(candle):
@@ -64,60 +79,31 @@ def test_simulator_event_dispatcher():
     simulator.event_dispatcher.remove_complete_candle_listener("BTCUSDT", "1m", listener)
 
 
-def test_get_base_timeframe_single_timeframe():
-    """Test get_base_timeframe with a single valid timeframe"""
-    result = get_base_timeframe(["1m"])
-    assert result == "1m"
-
-    result = get_base_timeframe(["15m"])
-    assert result == "15m"
-
-    result = get_base_timeframe(["1h"])
-    assert result == "1h"
-
-
-def test_get_base_timeframe_multiple_timeframes():
-    """Test get_base_timeframe with multiple timeframes, should return shortest"""
-    result = get_base_timeframe(["1m", "15m", "1h"])
-    assert result == "1m"
-
-    result = get_base_timeframe(["3m", "15m", "1h"])
-    assert result == "3m"
-
-    result = get_base_timeframe(["15m", "1h", "4h"])
-    assert result == "15m"
-
-
-def test_get_base_timeframe_empty_list():
-    """Test get_base_timeframe with empty list, should return default "1m" """
-    result = get_base_timeframe([])
-    assert result == "1m"
-
-
-def test_get_base_timeframe_invalid_timeframes():
-    """Test get_base_timeframe with invalid timeframes, should return default "1m" """
-    result = get_base_timeframe(["invalid"])
-    assert result == "1m"
-
-    result = get_base_timeframe(["xxx", "yyy"])
-    assert result == "1m"
-
-
-def test_get_base_timeframe_mixed_valid_invalid():
-    """Test get_base_timeframe with mixed valid and invalid timeframes, should use only valid ones"""
-    result = get_base_timeframe(["invalid", "15m", "invalid2", "1h"])
-    assert result == "15m"
-
-    result = get_base_timeframe(["invalid", "3m", "15m"])
-    assert result == "3m"
-
-
-def test_get_base_timeframe_ordering():
-    """Test get_base_timeframe returns the shortest timeframe correctly"""
-    # Test ordering: 1m < 3m < 5m < 15m < 30m < 1h
-    assert get_base_timeframe(["1m", "3m"]) == "1m"
-    assert get_base_timeframe(["3m", "1m"]) == "1m"
-    assert get_base_timeframe(["15m", "3m", "1h"]) == "3m"
-    assert get_base_timeframe(["1h", "30m", "15m"]) == "15m"
-    assert get_base_timeframe(["5m", "3m", "1m"]) == "1m"
-
+@pytest.mark.parametrize(
+    "timeframes, expected",
+    [
+        # Single valid timeframe
+        (["1m"], "1m"),
+        (["15m"], "15m"),
+        (["1h"], "1h"),
+        # Multiple timeframes: shortest wins, whatever the order (1m < 3m < 5m < 15m < 30m < 1h)
+        (["1m", "15m", "1h"], "1m"),
+        (["3m", "15m", "1h"], "3m"),
+        (["15m", "1h", "4h"], "15m"),
+        (["1m", "3m"], "1m"),
+        (["3m", "1m"], "1m"),
+        (["15m", "3m", "1h"], "3m"),
+        (["1h", "30m", "15m"], "15m"),
+        (["5m", "3m", "1m"], "1m"),
+        # Empty or only invalid: default "1m"
+        ([], "1m"),
+        (["invalid"], "1m"),
+        (["xxx", "yyy"], "1m"),
+        # Mixed valid and invalid: only valid ones count
+        (["invalid", "15m", "invalid2", "1h"], "15m"),
+        (["invalid", "3m", "15m"], "3m"),
+    ],
+)
+def test_get_base_timeframe(timeframes, expected):
+    """Test get_base_timeframe returns the shortest valid timeframe, defaulting to "1m" """
+    assert get_base_timeframe(timeframes) == expected
@@ -0,0 +1,22 @@
+"""Shared fixtures for integration tests"""
+import pytest
+
+from trading.agents import OrchestratorAgent
+from trading.infrastructure.logging import LoggingContext
+
+
+@pytest.fixture(scope="session")
+def _shared_orchestrator():
+    """Initialized OrchestratorAgent (with all child agents), built once per session"""
+    orchestrator = OrchestratorAgent(run_id="integration_shared").initialize()
+    yield orchestrator
+    orchestrator.close()
+
+
+@pytest.fixture
+def orchestrator(_shared_orchestrator, request):
+    """The shared orchestrator, bound to this test's run_id and with no completed backtests"""
+    _shared_orchestrator.completed_backtests.clear()
+    _shared_orchestrator.set_context(run_id=request.node.name, flow_id="test")
+    yield _shared_orchestrator
+    LoggingContext.clear()
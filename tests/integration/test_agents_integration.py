@@ -1,8 +1,9 @@
 """Integration tests for agent workflows"""
+from decimal import Decimal
 
 import pytest
 
-from trading.agents import BacktestAgent, EvaluatorAgent, OrchestratorAgent, SimulatorAgent
+from trading.agents import BacktestAgent, EvaluatorAgent, SimulatorAgent
 from trading.domain.messages import (
     AgentMessage,
     BacktestResultsResponse,
@@ -10,6 +11,63 @@ from trading.domain.messages import (
     StartBacktestRequest,
 )
 
+# Fixed request window (ms)
+START_TS = 1_744_023_500_000
+ONE_HOUR_MS = 3_600_000
+ONE_DAY_MS = 86_400_000
+
+D_10 = Decimal("10")
+D_25 = Decimal("25")
+D_250 = Decimal("250")
+D_2750 = Decimal("2750")
+
+# Sample backtest results, validated once; tests take a model_copy() before storing them
+_BASE_RESULTS = BacktestResultsResponse(
+    run_id="test_backtest_eval",
+    status="completed",
+    start_time=1000000,
+    end_time=2000000,
+    duration_seconds=86400.0,
+    total_candles_processed=1000,
+    final_balance=D_2750,
+    total_return=D_250,
+    return_percentage=10.0,
+    max_drawdown=5.0,
+    total_trades=50,
+    win_rate=60.0,
+    profit_factor=2.5,  # Above threshold
+    total_closed_positions=50,
+    winning_positions=30,
+    losing_positions=20,
+    total_commission=D_10,
+    commission_percentage=4.0,
+    total_cycles=10,
+    avg_cycle_duration=60.0,
+    avg_cycle_pnl=D_25,
+    winning_cycles=7,
+    losing_cycles=3,
+    cycle_win_rate=70.0,
+    strategy_name="test_strategy",
+    symbol="BTCUSDT",
+)
+
+
+@pytest.fixture(scope="module")
+def _shared_simulator_agent():
+    """Initialized backtest SimulatorAgent, built once per module"""
+    agent = SimulatorAgent(run_id="test_run_123").initialize(is_backtest=True)
+    yield agent
+    agent.close()
+
+
+@pytest.fixture
+def simulator_agent(_shared_simulator_agent):
+    """The shared SimulatorAgent, with its memory emptied and run_id back to test_run_123"""
+    agent = _shared_simulator_agent
+    agent.episodic_memory.clear()
+    agent.run_id = "test_run_123"
+    return agent
+
 
 def test_simulator_agent_initialization():
     """Test SimulatorAgent initialization"""
@@ -28,31 +86,25 @@ def test_backtest_agent_initialization():
     assert agent.get_memory("initialized") is True
 
 
-def test_orchestrator_agent_initialization():
+def test_orchestrator_agent_initialization(orchestrator):
     """Test OrchestratorAgent initialization"""
-    orchestrator = OrchestratorAgent(run_id="test_run_123")
-    orchestrator.initialize()
-
     assert orchestrator.simulator_agent is not None
     assert orchestrator.backtest_agent is not None
     assert orchestrator.evaluator_agent is not None
     assert orchestrator.get_memory("initialized") is True
 
 
-def test_agent_messaging():
+def test_agent_messaging(simulator_agent):
     """Test A2A messaging between agents"""
-    simulator = SimulatorAgent(run_id="test_run_123")
-    simulator.initialize(is_backtest=True)
-
     # Create message
     request_payload = {
         "action": "set_times",
-        "start_time": 1744023500000,
-        "end_time": 1744023500000 + (24 * 60 * 60 * 1000),
+        "start_time": START_TS,
+        "end_time": START_TS + ONE_DAY_MS,
         "min_candles": 10,
     }
 
-    message = simulator.create_message(
+    message = simulator_agent.create_message(
         to_agent="simulator",
         flow_id="test_flow",
         payload=request_payload,
@@ -63,16 +115,13 @@ def test_agent_messaging():
     assert message.flow_id == "test_flow"
 
 
-def test_orchestrator_agent_message_handling():
+def test_orchestrator_agent_message_handling(orchestrator):
     """Test OrchestratorAgent message handling"""
-    orchestrator = OrchestratorAgent(run_id="test_run_123")
-    orchestrator.initialize()
-
     # Create backtest request
     request = StartBacktestRequest(
         symbol="BTCUSDT",
-        start_time=1744023500000,
-        end_time=1744023500000 + (60 * 60 * 1000),  # 1 hour
+        start_time=START_TS,
+        end_time=START_TS + ONE_HOUR_MS,
         strategy_name="test_strategy",
     )
 
@@ -88,39 +137,33 @@ def test_orchestrator_agent_message_handling():
     assert isinstance(message.payload, StartBacktestRequest)
 
 
-def test_agent_context_management():
+def test_agent_context_management(simulator_agent):
     """Test agent context management"""
-    agent = SimulatorAgent(run_id="test_run_123")
-    agent.set_context(run_id="new_run_456", flow_id="flow_test")
+    simulator_agent.set_context(run_id="new_run_456", flow_id="flow_test")
 
-    assert agent.run_id == "new_run_456"
+    assert simulator_agent.run_id == "new_run_456"
 
 
-def test_agent_memory_storage():
+def test_agent_memory_storage(simulator_agent):
     """Test agent episodic memory"""
-    agent = SimulatorAgent(run_id="test_run_123")
-    agent.store_memory("test_key", "test_value")
+    simulator_agent.store_memory("test_key", "test_value")
 
-    assert agent.get_memory("test_key") == "test_value"
-    assert agent.get_memory("nonexistent", "default") == "default"
+    assert simulator_agent.get_memory("test_key") == "test_value"
+    assert simulator_agent.get_memory("nonexistent", "default") == "default"
 
 
-def test_agent_policy_validation():
+def test_agent_policy_validation(simulator_agent):
     """Test agent policy validation"""
-    agent = SimulatorAgent(run_id="test_run_123")
-
     # Test valid value
-    assert agent.validate_policy("max_symbols", 5) is True
+    assert simulator_agent.validate_policy("max_symbols", 5) is True
 
     # Test invalid value (exceeds max)
-    assert agent.validate_policy("max_symbols", 15) is False
+    assert simulator_agent.validate_policy("max_symbols", 15) is False
 
 
-def test_agent_error_response():
+def test_agent_error_response(simulator_agent):
     """Test agent error response creation"""
-    agent = SimulatorAgent(run_id="test_run_123")
-
-    error = agent.create_error_response(
+    error = simulator_agent.create_error_response(
         error_code="TEST_ERROR",
         error_message="Test error message",
         details={"detail": "value"},
@@ -139,42 +182,9 @@ def test_evaluator_agent_initialization():
     assert evaluator.get_memory("initialized") is True
 
 
-def test_orchestrator_evaluate_backtest():
+def test_orchestrator_evaluate_backtest(orchestrator):
     """Test OrchestratorAgent can evaluate backtest results"""
-    from decimal import Decimal
-
-    orchestrator = OrchestratorAgent(run_id="test_run_123")
-    orchestrator.initialize()
-
-    # Create sample backtest results
-    results = BacktestResultsResponse(
-        run_id="test_backtest_eval",
-        status="completed",
-        start_time=1000000,
-        end_time=2000000,
-        duration_seconds=86400.0,
-        total_candles_processed=1000,
-        final_balance=Decimal("2750"),
-        total_return=Decimal("250"),
-        return_percentage=10.0,
-        max_drawdown=5.0,
-        total_trades=50,
-        win_rate=60.0,
-        profit_factor=2.5,  # Above threshold
-        total_closed_positions=50,
-        winning_positions=30,
-        losing_positions=20,
-        total_commission=Decimal("10"),
-        commission_percentage=4.0,
-        total_cycles=10,
-        avg_cycle_duration=60.0,
-        avg_cycle_pnl=Decimal("25"),
-        winning_cycles=7,
-        losing_cycles=3,
-        cycle_win_rate=70.0,
-        strategy_name="test_strategy",
-        symbol="BTCUSDT",
-    )
+    results = _BASE_RESULTS.model_copy()
 
     # Store results in orchestrator's completed_backtests
     orchestrator.completed_backtests["test_backtest_eval"] = results
@@ -195,22 +205,4 @@ def test_orchestrator_evaluate_backtest():
 @pytest.mark.skip(reason="Requires full strategy implementation and market data")
 def test_full_backtest_workflow():
     """Test complete backtest workflow through agents"""
-    # This test would require:
-    # - Full strategy implementation
-    # - Market data setup
-    # - Complete backtest execution
-    # TODO: Implement when strategy is available
-
-    orchestrator = OrchestratorAgent(run_id="integration_test")
-    orchestrator.initialize()
-
-    # This would execute the full backtest
-    # request = StartBacktestRequest(
-    #     symbol="BTCUSDT",
-    #     start_time=1744023500000,
-    #     end_time=1744023500000 + (60 * 60 * 1000),
-    #     strategy_name="test_strategy",
-    # )
-    # response = orchestrator.run_backtest(request)
-    # assert isinstance(response, BacktestResultsResponse)
-
+    pass
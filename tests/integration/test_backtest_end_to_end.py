@@ -7,6 +7,13 @@ from trading.agents import OrchestratorAgent
 from trading.domain.messages import StartBacktestRequest
 from trading.strategies.factory import create_strategy_factory
 
+# Fixed request window (ms)
+START_TS = 1_744_023_500_000
+ONE_HOUR_MS = 3_600_000
+
+# Stateless closure (no repository bound), so one instance serves every test in this module
+_FACTORY = create_strategy_factory(strategy_name="carga_descarga")
+
 
 @pytest.mark.skip(reason="Requires market data in database or API access. Enable when ready to test full workflow.")
 def test_backtest_end_to_end_with_orchestrator():
@@ -18,20 +25,17 @@ def test_backtest_end_to_end_with_orchestrator():
     # Create backtest request (short time window for testing)
     request = StartBacktestRequest(
         symbol="BTCUSDT",
-        start_time=1744023500000,  # Fixed timestamp
-        end_time=1744023500000 + (60 * 60 * 1000),  # +1 hour
+        start_time=START_TS,
+        end_time=START_TS + ONE_HOUR_MS,
         initial_balance=Decimal("2500"),
         leverage=Decimal("100"),
         strategy_name="carga_descarga",
         max_loss_percentage=0.5,
     )
 
-    # Create strategy factory
-    strategy_factory = create_strategy_factory(strategy_name="carga_descarga")
-
     try:
         # Execute backtest
-        results = orchestrator.run_backtest(request, strategy_factory=strategy_factory)
+        results = orchestrator.run_backtest(request, strategy_factory=_FACTORY)
 
         # Verify results
         assert results.status == "completed"
@@ -46,38 +50,31 @@ def test_backtest_end_to_end_with_orchestrator():
 
 def test_strategy_factory_creation():
     """Test that strategy factory can be created"""
-    factory = create_strategy_factory(strategy_name="carga_descarga")
-    assert callable(factory)
+    assert callable(_FACTORY)
 
 
-def test_orchestrator_with_strategy_factory():
+def test_orchestrator_with_strategy_factory(orchestrator):
     """Test that orchestrator can be initialized with strategy factory"""
-    orchestrator = OrchestratorAgent(run_id="test_factory_run")
-    orchestrator.initialize()
-
     assert orchestrator.backtest_agent is not None
     assert orchestrator.simulator_agent is not None
 
-    # Verify we can create a strategy factory
-    factory = create_strategy_factory(strategy_name="carga_descarga")
-    assert callable(factory)
-
-    orchestrator.close()
+    # Verify the strategy factory is usable alongside it
+    assert callable(_FACTORY)
 
 
 def test_start_backtest_request_creation():
     """Test that StartBacktestRequest can be created with valid data"""
     request = StartBacktestRequest(
         symbol="BTCUSDT",
-        start_time=1744023500000,
-        end_time=1744023500000 + (60 * 60 * 1000),
+        start_time=START_TS,
+        end_time=START_TS + ONE_HOUR_MS,
         initial_balance=Decimal("2500"),
         leverage=Decimal("100"),
         strategy_name="carga_descarga",
     )
 
     assert request.symbol == "BTCUSDT"
-    assert request.start_time == 1744023500000
+    assert request.start_time == START_TS
     assert request.initial_balance == Decimal("2500")
     assert request.strategy_name == "carga_descarga"
     assert request.run_id is not None
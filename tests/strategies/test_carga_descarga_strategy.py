@@ -1,24 +1,28 @@
 """Unit tests for CargaDescargaStrategy helper methods"""
 from unittest.mock import Mock
 
+import pytest
+
 from trading.domain.ports import ExchangePort, MarketDataPort
 from trading.infrastructure.backtest.adapters.operations_status_repository import (
     BacktestOperationsStatusRepository,
 )
 from trading.strategies.carga_descarga.carga_descarga_strategy import CargaDescargaStrategy
 
+# Shared by every strategy built here; helper tests never assert on port calls
+_EXCHANGE_STUB = Mock(spec=ExchangePort)
+_MARKET_DATA_STUB = Mock(spec=MarketDataPort)
+# Operation status is only written by trade/candle handlers, which the helper tests never drive
+_OPS_REPO = BacktestOperationsStatusRepository(symbol="BTCUSDT")
+
 
 def create_mock_strategy(timeframes: list[str], rsi_limits: list[int] | None = None) -> CargaDescargaStrategy:
     """Helper to create a CargaDescargaStrategy instance with mocked dependencies"""
-    mock_exchange = Mock(spec=ExchangePort)
-    mock_market_data = Mock(spec=MarketDataPort)
-    ops_repo = BacktestOperationsStatusRepository(symbol="BTCUSDT")
-
     strategy = CargaDescargaStrategy(
         symbol="BTCUSDT",
-        exchange=mock_exchange,
-        market_data=mock_market_data,
-        operation_status_repository=ops_repo,
+        exchange=_EXCHANGE_STUB,
+        market_data=_MARKET_DATA_STUB,
+        operation_status_repository=_OPS_REPO,
         cycle_dispatcher=None,
         strategy_name="test_strategy",
         timeframes=timeframes,
@@ -27,130 +31,100 @@ def create_mock_strategy(timeframes: list[str], rsi_limits: list[int] | None = N
     return strategy
 
 
-def test_get_loads_per_timeframe_with_2_timeframes():
-    """Test _get_loads_per_timeframe with 2 timeframes: should return 4 (9 // 2 = 4)"""
-    strategy = create_mock_strategy(timeframes=["15m", "1h"])
-    loads_per_tf = strategy._get_loads_per_timeframe()
-    assert loads_per_tf == 4
-
-
-def test_get_loads_per_timeframe_with_3_timeframes():
-    """Test _get_loads_per_timeframe with 3 timeframes: should return 3 (9 // 3 = 3)"""
-    strategy = create_mock_strategy(timeframes=["1m", "15m", "1h"])
-    loads_per_tf = strategy._get_loads_per_timeframe()
-    assert loads_per_tf == 3
-
-
-def test_get_loads_per_timeframe_with_4_timeframes():
-    """Test _get_loads_per_timeframe with 4 timeframes: should return 2 (9 // 4 = 2)"""
-    strategy = create_mock_strategy(timeframes=["1m", "5m", "15m", "1h"])
-    loads_per_tf = strategy._get_loads_per_timeframe()
-    assert loads_per_tf == 2
-
-
-def test_calculate_timeframe_index_with_2_timeframes():
-    """Test _calculate_timeframe_index with 2 timeframes"""
-    strategy = create_mock_strategy(timeframes=["15m", "1h"])
-    # loads=0 → index=0
-    assert strategy._calculate_timeframe_index(0) == 0
-    # loads=4 → index=1 (last timeframe)
-    assert strategy._calculate_timeframe_index(4) == 1
-    # loads=8 → index=1 (capped at max_index)
-    assert strategy._calculate_timeframe_index(8) == 1
-
-
-def test_calculate_timeframe_index_with_3_timeframes():
-    """Test _calculate_timeframe_index with 3 timeframes"""
-    strategy = create_mock_strategy(timeframes=["1m", "15m", "1h"])
-    # loads=0 → index=0
-    assert strategy._calculate_timeframe_index(0) == 0
-    # loads=3 → index=1
-    assert strategy._calculate_timeframe_index(3) == 1
-    # loads=6 → index=2 (last timeframe)
-    assert strategy._calculate_timeframe_index(6) == 2
-    # loads=9 → index=2 (capped)
-    assert strategy._calculate_timeframe_index(9) == 2
-
-
-def test_calculate_timeframe_index_with_4_timeframes():
-    """Test _calculate_timeframe_index with 4 timeframes"""
-    strategy = create_mock_strategy(timeframes=["1m", "5m", "15m", "1h"])
-    # loads=0 → index=0
-    assert strategy._calculate_timeframe_index(0) == 0
-    # loads=2 → index=1
-    assert strategy._calculate_timeframe_index(2) == 1
-    # loads=4 → index=2
-    assert strategy._calculate_timeframe_index(4) == 2
-    # loads=6 → index=3 (last timeframe)
-    assert strategy._calculate_timeframe_index(6) == 3
-
-
-def test_is_last_tf_load_with_3_timeframes():
-    """Test _is_last_tf_load with 3 timeframes (loads_per_tf=3)"""
-    strategy = create_mock_strategy(timeframes=["1m", "15m", "1h"])
-    # loads=0 → False
-    assert strategy._is_last_tf_load(0) is False
-    # loads=1 → False
-    assert strategy._is_last_tf_load(1) is False
-    # loads=2 → False
-    assert strategy._is_last_tf_load(2) is False
-    # loads=3 → True
-    assert strategy._is_last_tf_load(3) is True
-    # loads=4 → False
-    assert strategy._is_last_tf_load(4) is False
-    # loads=6 → True
-    assert strategy._is_last_tf_load(6) is True
-
-
-def test_is_last_tf_load_with_2_timeframes():
-    """Test _is_last_tf_load with 2 timeframes (loads_per_tf=4)"""
-    strategy = create_mock_strategy(timeframes=["15m", "1h"])
-    # loads=4 → True
-    assert strategy._is_last_tf_load(4) is True
-    # loads=8 → True
-    assert strategy._is_last_tf_load(8) is True
-    # loads=5 → False
-    assert strategy._is_last_tf_load(5) is False
-
-
-def test_get_threshold_loads_with_3_timeframes():
-    """Test _get_threshold_loads with 3 timeframes (scale_factor=1.0)"""
-    strategy = create_mock_strategy(timeframes=["1m", "15m", "1h"])
-    # base_threshold=3 → 3
-    assert strategy._get_threshold_loads(3) == 3
-    # base_threshold=4 → 4
-    assert strategy._get_threshold_loads(4) == 4
-
-
-def test_get_threshold_loads_with_2_timeframes():
-    """Test _get_threshold_loads with 2 timeframes (scale_factor=0.67)"""
-    strategy = create_mock_strategy(timeframes=["15m", "1h"])
-    # base_threshold=3 → 2 (int(3 * 2/3) = 2)
-    assert strategy._get_threshold_loads(3) == 2
-    # base_threshold=4 → 2 (int(4 * 2/3) = 2)
-    assert strategy._get_threshold_loads(4) == 2
-
-
-def test_get_threshold_loads_with_4_timeframes():
-    """Test _get_threshold_loads with 4 timeframes (scale_factor=1.33)"""
-    strategy = create_mock_strategy(timeframes=["1m", "5m", "15m", "1h"])
-    # base_threshold=3 → 4 (int(3 * 4/3) = 4)
-    assert strategy._get_threshold_loads(3) == 4
-    # base_threshold=4 → 5 (int(4 * 4/3) = 5)
-    assert strategy._get_threshold_loads(4) == 5
-
-
-def test_get_threshold_loads_minimum_value():
-    """Test _get_threshold_loads ensures at least 1 for small values"""
-    strategy = create_mock_strategy(timeframes=["15m", "1h"])
-    # base_threshold=1 with 2 timeframes → 1 (max(1, int(1 * 2/3)) = 1)
-    assert strategy._get_threshold_loads(1) == 1
-
-
-def test_rsi_limits_default():
+TF_2 = ["15m", "1h"]
+TF_3 = ["1m", "15m", "1h"]
+TF_4 = ["1m", "5m", "15m", "1h"]
+
+
+@pytest.fixture(scope="module")
+def strategy_for():
+    """Lookup returning one cached default-rsi strategy per timeframe list (helpers only read timeframes)"""
+    strategies = {}
+
+    def get(timeframes: list[str]) -> CargaDescargaStrategy:
+        key = tuple(timeframes)
+        if key not in strategies:
+            strategies[key] = create_mock_strategy(timeframes=timeframes)
+        return strategies[key]
+
+    return get
+
+
+@pytest.mark.parametrize(
+    "timeframes, expected",
+    [(TF_2, 4), (TF_3, 3), (TF_4, 2)],  # 9 // n timeframes
+    ids=["2_timeframes", "3_timeframes", "4_timeframes"],
+)
+def test_get_loads_per_timeframe(strategy_for, timeframes, expected):
+    """Test _get_loads_per_timeframe splits the 9 loads evenly across timeframes"""
+    assert strategy_for(timeframes)._get_loads_per_timeframe() == expected
+
+
+@pytest.mark.parametrize(
+    "timeframes, loads, expected",
+    [
+        (TF_2, 0, 0),
+        (TF_2, 4, 1),  # Last timeframe
+        (TF_2, 8, 1),  # Capped at max_index
+        (TF_3, 0, 0),
+        (TF_3, 3, 1),
+        (TF_3, 6, 2),  # Last timeframe
+        (TF_3, 9, 2),  # Capped
+        (TF_4, 0, 0),
+        (TF_4, 2, 1),
+        (TF_4, 4, 2),
+        (TF_4, 6, 3),  # Last timeframe
+    ],
+)
+def test_calculate_timeframe_index(strategy_for, timeframes, loads, expected):
+    """Test _calculate_timeframe_index maps loads to a timeframe index, capped at the last one"""
+    assert strategy_for(timeframes)._calculate_timeframe_index(loads) == expected
+
+
+@pytest.mark.parametrize(
+    "timeframes, loads, expected",
+    [
+        # 3 timeframes: loads_per_tf=3
+        (TF_3, 0, False),
+        (TF_3, 1, False),
+        (TF_3, 2, False),
+        (TF_3, 3, True),
+        (TF_3, 4, False),
+        (TF_3, 6, True),
+        # 2 timeframes: loads_per_tf=4
+        (TF_2, 4, True),
+        (TF_2, 8, True),
+        (TF_2, 5, False),
+    ],
+)
+def test_is_last_tf_load(strategy_for, timeframes, loads, expected):
+    """Test _is_last_tf_load is True only when a load completes a timeframe group"""
+    assert strategy_for(timeframes)._is_last_tf_load(loads) is expected
+
+
+@pytest.mark.parametrize(
+    "timeframes, base_threshold, expected",
+    [
+        # 3 timeframes: scale_factor=1.0
+        (TF_3, 3, 3),
+        (TF_3, 4, 4),
+        # 2 timeframes: scale_factor=0.67
+        (TF_2, 3, 2),  # int(3 * 2/3) = 2
+        (TF_2, 4, 2),  # int(4 * 2/3) = 2
+        (TF_2, 1, 1),  # max(1, int(1 * 2/3)) = 1: never below 1
+        # 4 timeframes: scale_factor=1.33
+        (TF_4, 3, 4),  # int(3 * 4/3) = 4
+        (TF_4, 4, 5),  # int(4 * 4/3) = 5
+    ],
+)
+def test_get_threshold_loads(strategy_for, timeframes, base_threshold, expected):
+    """Test _get_threshold_loads scales the 3-timeframe threshold by n/3, with a minimum of 1"""
+    assert strategy_for(timeframes)._get_threshold_loads(base_threshold) == expected
+
+
+def test_rsi_limits_default(strategy_for):
     """Test CargaDescargaStrategy has default rsi_limits"""
-    strategy = create_mock_strategy(timeframes=["1m", "15m", "1h"])
-    assert strategy.rsi_limits == [15, 50, 85]
+    assert strategy_for(TF_3).rsi_limits == [15, 50, 85]
 
 
 def test_rsi_limits_custom():
@@ -162,46 +136,20 @@ def test_rsi_limits_custom():
     assert strategy.rsi_limits == [10, 50, 90]
 
 
-def test_rsi_limits_validation_length():
-    """Test CargaDescargaStrategy validates rsi_limits has exactly 3 values"""
-    import pytest
-
-    # Test with 2 values - should fail
-    with pytest.raises(ValueError) as exc_info:
-        create_mock_strategy(
-            timeframes=["1m", "15m", "1h"],
-            rsi_limits=[10, 50]
-        )
-    assert "exactly 3 values" in str(exc_info.value).lower()
-
-    # Test with 4 values - should fail
-    with pytest.raises(ValueError) as exc_info:
-        create_mock_strategy(
-            timeframes=["1m", "15m", "1h"],
-            rsi_limits=[10, 50, 90, 95]
-        )
-    assert "exactly 3 values" in str(exc_info.value).lower()
-
-
-def test_rsi_limits_validation_range():
-    """Test CargaDescargaStrategy validates rsi_limits values are in range 0-100"""
-    import pytest
-
-    # Test with value < 0 - should fail
-    with pytest.raises(ValueError) as exc_info:
-        create_mock_strategy(
-            timeframes=["1m", "15m", "1h"],
-            rsi_limits=[-10, 50, 90]
-        )
-    assert "range 0-100" in str(exc_info.value).lower()
-
-    # Test with value > 100 - should fail
-    with pytest.raises(ValueError) as exc_info:
-        create_mock_strategy(
-            timeframes=["1m", "15m", "1h"],
-            rsi_limits=[10, 50, 110]
-        )
-    assert "range 0-100" in str(exc_info.value).lower()
+@pytest.mark.parametrize(
+    "rsi_limits, error",
+    [
+        ([10, 50], "exactly 3 values"),
+        ([10, 50, 90, 95], "exactly 3 values"),
+        ([-10, 50, 90], "range 0-100"),
+        ([10, 50, 110], "range 0-100"),
+    ],
+    ids=["too_few", "too_many", "below_range", "above_range"],
+)
+def test_rsi_limits_validation(rsi_limits, error):
+    """Test CargaDescargaStrategy validates rsi_limits has exactly 3 values in range 0-100"""
+    with pytest.raises(ValueError, match=error):
+        create_mock_strategy(timeframes=TF_3, rsi_limits=rsi_limits)
 
 
 def test_rsi_limits_uses_values_in_logic():
@@ -213,8 +161,5 @@ def test_rsi_limits_uses_values_in_logic():
     )
 
     # Verify the strategy instance has the correct limits
-    assert strategy.rsi_limits == [20, 60, 80]
-    assert strategy.rsi_limits[0] == 20  # low threshold
-    assert strategy.rsi_limits[1] == 60  # medium threshold
-    assert strategy.rsi_limits[2] == 80  # high threshold
+    assert strategy.rsi_limits == [20, 60, 80]  # low, medium, high thresholds
 
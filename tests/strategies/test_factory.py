@@ -4,14 +4,13 @@ from unittest.mock import Mock
 from trading.domain.ports import CycleListenerPort, ExchangePort, MarketDataPort
 from trading.strategies.factory import create_strategy_factory
 
+_EXCHANGE_STUB = Mock(spec=ExchangePort)
+_MARKET_DATA_STUB = Mock(spec=MarketDataPort)
+_CYCLE_DISPATCHER_STUB = Mock(spec=CycleListenerPort)
+
 
 def test_strategy_factory_passes_timeframes():
     """Test strategy factory passes timeframes to strategy"""
-    # Create mocks
-    mock_exchange = Mock(spec=ExchangePort)
-    mock_market_data = Mock(spec=MarketDataPort)
-    mock_cycle_dispatcher = Mock(spec=CycleListenerPort)
-
     # Create factory with custom timeframes
     factory_func = create_strategy_factory(
         strategy_name="carga_descarga",
@@ -21,9 +20,9 @@ def test_strategy_factory_passes_timeframes():
     # Create strategy using factory
     strategy = factory_func(
         symbol="BTCUSDT",
-        exchange=mock_exchange,
-        market_data=mock_market_data,
-        cycle_dispatcher=mock_cycle_dispatcher,
+        exchange=_EXCHANGE_STUB,
+        market_data=_MARKET_DATA_STUB,
+        cycle_dispatcher=_CYCLE_DISPATCHER_STUB,
         strategy_name="carga_descarga",
     )
 
@@ -33,20 +32,15 @@ def test_strategy_factory_passes_timeframes():
 
 def test_strategy_factory_default_timeframes():
     """Test strategy factory with no timeframes uses strategy default"""
-    # Create mocks
-    mock_exchange = Mock(spec=ExchangePort)
-    mock_market_data = Mock(spec=MarketDataPort)
-    mock_cycle_dispatcher = Mock(spec=CycleListenerPort)
-
     # Create factory without timeframes
     factory_func = create_strategy_factory(strategy_name="carga_descarga")
 
     # Create strategy using factory
     strategy = factory_func(
         symbol="BTCUSDT",
-        exchange=mock_exchange,
-        market_data=mock_market_data,
-        cycle_dispatcher=mock_cycle_dispatcher,
+        exchange=_EXCHANGE_STUB,
+        market_data=_MARKET_DATA_STUB,
+        cycle_dispatcher=_CYCLE_DISPATCHER_STUB,
         strategy_name="carga_descarga",
     )
 
@@ -56,11 +50,6 @@ def test_strategy_factory_default_timeframes():
 
 def test_strategy_factory_passes_rsi_limits():
     """Test strategy factory passes rsi_limits to strategy"""
-    # Create mocks
-    mock_exchange = Mock(spec=ExchangePort)
-    mock_market_data = Mock(spec=MarketDataPort)
-    mock_cycle_dispatcher = Mock(spec=CycleListenerPort)
-
     # Create factory with custom rsi_limits
     factory_func = create_strategy_factory(
         strategy_name="carga_descarga",
@@ -70,9 +59,9 @@ def test_strategy_factory_passes_rsi_limits():
     # Create strategy using factory
     strategy = factory_func(
         symbol="BTCUSDT",
-        exchange=mock_exchange,
-        market_data=mock_market_data,
-        cycle_dispatcher=mock_cycle_dispatcher,
+        exchange=_EXCHANGE_STUB,
+        market_data=_MARKET_DATA_STUB,
+        cycle_dispatcher=_CYCLE_DISPATCHER_STUB,
         strategy_name="carga_descarga",
     )
 
@@ -82,20 +71,15 @@ def test_strategy_factory_passes_rsi_limits():
 
 def test_strategy_factory_default_rsi_limits():
     """Test strategy factory with no rsi_limits uses strategy default"""
-    # Create mocks
-    mock_exchange = Mock(spec=ExchangePort)
-    mock_market_data = Mock(spec=MarketDataPort)
-    mock_cycle_dispatcher = Mock(spec=CycleListenerPort)
-
     # Create factory without rsi_limits
     factory_func = create_strategy_factory(strategy_name="carga_descarga")
 
     # Create strategy using factory
     strategy = factory_func(
         symbol="BTCUSDT",
-        exchange=mock_exchange,
-        market_data=mock_market_data,
-        cycle_dispatcher=mock_cycle_dispatcher,
+        exchange=_EXCHANGE_STUB,
+        market_data=_MARKET_DATA_STUB,
+        cycle_dispatcher=_CYCLE_DISPATCHER_STUB,
         strategy_name="carga_descarga",
     )
 
@@ -105,11 +89,6 @@ def test_strategy_factory_default_rsi_limits():
 
 def test_strategy_factory_passes_both_rsi_limits_and_timeframes():
     """Test strategy factory passes both rsi_limits and timeframes"""
-    # Create mocks
-    mock_exchange = Mock(spec=ExchangePort)
-    mock_market_data = Mock(spec=MarketDataPort)
-    mock_cycle_dispatcher = Mock(spec=CycleListenerPort)
-
     # Create factory with both custom rsi_limits and timeframes
     factory_func = create_strategy_factory(
         strategy_name="carga_descarga",
@@ -120,9 +99,9 @@ def test_strategy_factory_passes_both_rsi_limits_and_timeframes():
     # Create strategy using factory
     strategy = factory_func(
         symbol="BTCUSDT",
-        exchange=mock_exchange,
-        market_data=mock_market_data,
-        cycle_dispatcher=mock_cycle_dispatcher,
+        exchange=_EXCHANGE_STUB,
+        market_data=_MARKET_DATA_STUB,
+        cycle_dispatcher=_CYCLE_DISPATCHER_STUB,
         strategy_name="carga_descarga",
     )
 